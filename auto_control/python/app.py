@@ -133,7 +133,7 @@ class AutoControlWindow(QMainWindow):
         # Relay map: objectName -> controller RELAY index (1-based)
         # YAML relays use Arduino pin numbers. Translate to RELAY_n using relay_pins order.
         self.relay_map: Dict[str, int] = {}
-        pin_to_relay_index = {pin: idx + 1 for idx, pin in enumerate(self.cfg.relay_pins)}
+        pin_to_relay_index = self.cfg.pin_to_relay_index
         for obj_name, arduino_pin in self.cfg.relays.items():
             relay_idx = pin_to_relay_index.get(int(arduino_pin))
             if relay_idx is not None:
@@ -2697,18 +2697,21 @@ class AutoControlWindow(QMainWindow):
                             set_interlock_indicator(w, None)
 
                 # Analog
-                ai_raw = self.arduino.get_analog_inputs()  # Raw ADC values
-                ai_volts = self.arduino.get_analog_voltages()  # Converted voltages
+                # One serial read per poll; the voltages are derived from the raw ADC values
+                ai_volts = self.arduino.get_analog_voltages()
+                if ai_volts:
+                    # Share the frame with running auto procedures so they can skip a read
+                    self.safety_controller.publish_voltages(ai_volts)
 
-                if ai_raw and ai_volts and hasattr(self, "groupAnalog"):
+                if ai_volts and hasattr(self, "groupAnalog"):
                     # Store voltage values for safety controller (use voltages, not raw ADC)
                     self.last_analog_inputs = [float(ai_volts[i]) if i < len(ai_volts) else 0.0 for i in range(4)]
 
                     lcds = [getattr(self, f"lcdAnalog{i}", None) for i in range(1, 5)]
+                    scales, offsets = self.cfg.analog_scales, self.cfg.analog_offsets
                     for i, voltage in enumerate(ai_volts[:4]):
-                        if i < len(self.cfg.analog_channels):
-                            scale = float(self.cfg.analog_channels[i].get("scale", 1.0))
-                            offset = float(self.cfg.analog_channels[i].get("offset", 0.0))
+                        if i < len(scales):
+                            scale, offset = scales[i], offsets[i]
                         else:
                             scale, offset = 1.0, 0.0
 
@@ -3339,7 +3342,14 @@ def run() -> int:
         sys.exit(0)
     
     signal.signal(signal.SIGINT, signal_handler)
-    
+
+    # Procedure progress messages go to the console alongside the prints below
+    try:
+        from .auto_procedures import configure_progress_output
+    except Exception:
+        from auto_procedures import configure_progress_output
+    configure_progress_output()
+
     # ========================================
     # CRITICAL: Initialize Arduino FIRST to prevent unwanted relay operations during GUI setup
     # ========================================
@@ -13,9 +13,12 @@ import sys
 import platform
 import os
 import uuid
+from array import array
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Optional, List, Sequence, Tuple, Dict
 
+# 10-bit ADC (0-1023) to 0-5 V scale factor
+ADC_TO_VOLTS = 5.0 / 1023.0
 
 class ArduinoController:
     """
@@ -848,7 +851,7 @@ class ArduinoController:
                 expected_prefix = "ANALOG_INPUTS:"
             elif command == "STATUS":
                 expected_prefix = "STATUS:"
-            elif command.startswith("RELAY_") or command in ("ALL_OFF",):
+            elif command.startswith(("RELAY_", "RELAYS_", "PULSE_RELAY_")) or command in ("ALL_OFF", "ABORT_PULSE"):
                 # Relay commands return OK or ERROR
                 expected_prefix = "OK"
 
@@ -951,6 +954,63 @@ class ArduinoController:
             return True
         return False
         
+    def set_relays_bulk(self, mapping: Dict[int, bool], suppress_logging: bool = False) -> bool:
+        """
+        Set several relays with a single RELAYS_<mask>_<states> command.
+        
+        Args:
+            mapping: Relay number (1-23) -> True for ON, False for OFF
+        Returns:
+            True if command successful, False otherwise (including firmware
+            without bulk support, which answers ERROR)
+        """
+        if not mapping:
+            return True
+        mask = 0
+        states = 0
+        for relay_number, state in mapping.items():
+            if not (1 <= relay_number <= self.NUM_RELAYS):
+                return False
+            bit = 1 << (relay_number - 1)
+            mask |= bit
+            if state:
+                states |= bit
+        command = f"RELAYS_{mask:X}_{states:X}"
+        if not suppress_logging:
+            print(f"🔧 RELAY OPERATION: Relays {sorted(mapping)} in one frame (Command: {command})")
+        response = self.send_command(command)
+        if response == "OK":
+            for relay_number, state in mapping.items():
+                self.relay_states[relay_number - 1] = state
+            return True
+        return False
+        
+    def pulse_relay(self, relay_number: int, pulse_ms: int, interval_ms: int, count: int) -> bool:
+        """
+        Start a firmware-timed pulse train on one relay.
+
+        The Arduino switches the relay ON for pulse_ms, `count` times, with
+        pulses starting interval_ms apart, and returns to OFF. The call returns
+        as soon as the train has started; stop it early with abort_pulse().
+
+        Returns:
+            True if the train started, False otherwise (including firmware
+            without pulse support, which answers ERROR)
+        """
+        if not (2 <= relay_number <= self.NUM_RELAYS):
+            return False
+        command = f"PULSE_RELAY_{relay_number}_{int(pulse_ms)}_{int(interval_ms)}_{int(count)}"
+        print(f"🔧 RELAY OPERATION: Relay {relay_number} pulse train x{count} (Command: {command})")
+        return self.send_command(command) == "OK"
+
+    def abort_pulse(self) -> bool:
+        """Stop a running pulse train; its relay is left OFF."""
+        response = self.send_command("ABORT_PULSE")
+        if response == "OK":
+            return True
+        print(f"❌ ABORT_PULSE failed - response: {response}")
+        return False
+
     def get_relay_state(self, relay_number: int) -> bool:
         """
         Get current state of specific relay.
@@ -1064,16 +1124,19 @@ class ArduinoController:
                 pass
         return None
         
-    def get_analog_voltages(self) -> Optional[List[float]]:
+    def get_analog_voltages(self) -> Optional[Sequence[float]]:
         """
         Query Arduino for current analog input values and convert to voltages.
         Returns:
-            List of analog input voltages (0-5V), or None if error
+            Analog input voltages (0-5V) as an array('d'), or None if error.
+            The values are stored unboxed in one buffer; index and compare them
+            directly (no float() needed). Each call returns a new array, so
+            callers may keep a reading.
         """
         raw_values = self.get_analog_inputs()
         if raw_values is not None:
             # Convert ADC values (0-1023) to voltages (0-5V)
-            return [value * 5.0 / 1023.0 for value in raw_values]
+            return array('d', map(ADC_TO_VOLTS.__mul__, raw_values))
         return None
         
     def get_available_ports(self) -> List[Tuple[str, str]]:
@@ -5,28 +5,74 @@ This module contains automated procedures for vacuum system operations,
 ensuring all safety conditions are met before performing actions.
 """
 
+import logging
+import operator
+import queue
+import sys
+import threading
 import time
-from typing import Dict, List, Optional, Callable
+from collections import deque
+from functools import partial
+from statistics import median
+from typing import Dict, List, Optional, Callable, Sequence, Tuple, NamedTuple
 from pathlib import Path
-import builtins
 
-# Global cancellation flag for long-running procedures
-_procedure_cancelled = False
+logger = logging.getLogger(__name__)
+
+# Operator-facing procedure messages. Output routing is left to the
+# application: it calls configure_progress_output() at startup.
+progress = logging.getLogger("procedure")
+
+def configure_progress_output(stream=None) -> None:
+    """Write procedure messages to stdout (or `stream`) as bare lines.
+
+    The handler writes synchronously so these lines stay in order with the
+    relay and safety messages the controllers print directly. Does nothing
+    if the 'procedure' logger already has a handler.
+    """
+    if progress.handlers:
+        return
+    handler = logging.StreamHandler(stream if stream is not None else sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    progress.addHandler(handler)
+    progress.setLevel(logging.INFO)
+    progress.propagate = False
+
+# Minimum seconds between repeated log lines from polling loops
+LOG_THROTTLE_INTERVAL = 5.0
+
+# Global cancellation signal for long-running procedures. An Event rather than a
+# bare flag so waits can block on it and wake as soon as a cancel arrives.
+_cancel_event = threading.Event()
+# Set by a procedure when it observes the cancellation, so abort can stop
+# waiting as soon as a running procedure has noticed
+_cancel_ack = threading.Event()
+# Longest abort waits for a running procedure to acknowledge a cancel
+CANCEL_ACK_TIMEOUT = 0.5
 
 def cancel_running_procedures():
     """Signal all running procedures to cancel."""
-    global _procedure_cancelled
-    _procedure_cancelled = True
-    print("🛑 Cancellation signal sent to all running procedures")
+    _cancel_ack.clear()
+    _cancel_event.set()
+    progress.info("🛑 Cancellation signal sent to all running procedures")
 
 def reset_cancellation_flag():
     """Reset the cancellation flag before starting new procedures."""
-    global _procedure_cancelled
-    _procedure_cancelled = False
+    _cancel_event.clear()
 
 def is_procedure_cancelled() -> bool:
     """Check if procedures should be cancelled."""
-    return _procedure_cancelled
+    if _cancel_event.is_set():
+        _cancel_ack.set()
+        return True
+    return False
+
+def wait_cancelled(timeout: float) -> bool:
+    """Sleep up to `timeout` seconds; return True early if procedures are cancelled."""
+    if _cancel_event.wait(timeout):
+        _cancel_ack.set()
+        return True
+    return False
 
 # Import controllers (assuming relative imports work)
 try:
@@ -38,6 +84,88 @@ except ImportError:
     from safety.safety_controller import SafetyController, SafetyResult
     from config import load_config
 
+class _AnalogCache:
+    """Short-lived cache of the last analog voltage frame read from the Arduino.
+
+    Each get_analog_voltages() call is a serial round-trip; callers that read
+    back-to-back (step checks, polling loops) within max_age share one frame.
+    When a SafetyController is given, a frame published by the GUI input poll
+    (SafetyController.publish_voltages) is reused as well.
+    """
+
+    def __init__(self):
+        self._arduino = None
+        self._timestamp = 0.0
+        self._values: Optional[Sequence[float]] = None
+        self._invalidated_at = 0.0
+
+    def get(self, arduino: ArduinoController, max_age: float = 0.1,
+            safety: Optional[SafetyController] = None) -> Optional[Sequence[float]]:
+        now = time.monotonic()
+        if (self._values is not None and arduino is self._arduino
+                and now - self._timestamp < max_age):
+            return self._values
+        if safety is not None:
+            snapshot = safety.get_latest_voltages(max_age, newer_than=self._invalidated_at)
+            if snapshot is not None:
+                return snapshot
+        values = arduino.get_analog_voltages()
+        if values is not None:
+            self._arduino, self._timestamp, self._values = arduino, now, values
+        return values
+
+    def invalidate(self) -> None:
+        self._values = None
+        self._invalidated_at = time.monotonic()
+
+_analog_cache = _AnalogCache()
+
+def get_voltages_cached(arduino: ArduinoController, max_age: float = 0.1,
+                        safety: Optional[SafetyController] = None) -> Optional[Sequence[float]]:
+    """Return analog voltages, reusing a reading taken less than max_age seconds ago.
+
+    Passing `safety` also allows reusing the GUI poll's latest published frame.
+    """
+    return _analog_cache.get(arduino, max_age, safety)
+
+def _threshold_predicate(idx: int, op: Callable[[float, float], bool],
+                         thr: float) -> Callable[[Sequence[float]], bool]:
+    """Build a wait predicate: `op(v[idx], thr)`, False if channel `idx` is missing.
+
+    `op` is a comparison from the operator module (lt, le, gt, ge). The
+    arguments are bound as defaults so each call only touches locals.
+    """
+    def predicate(v: Sequence[float], idx: int = idx, op=op, thr: float = thr) -> bool:
+        return len(v) > idx and op(v[idx], thr)
+    return predicate
+
+# Turbo spin thresholds on ai_volts[3] (4.5 V max gauge)
+TURBO_SPIN_90_VOLTS = 4.11   # ~90% speed
+TURBO_SPIN_80_VOLTS = 3.5    # ~80% speed
+
+_turbo_spin_below_90 = _threshold_predicate(3, operator.le, TURBO_SPIN_90_VOLTS)
+_turbo_spin_above_80 = _threshold_predicate(3, operator.ge, TURBO_SPIN_80_VOLTS)
+
+# Valve close order used by go_to_default_state, grouped into dependency tiers.
+# Tiers are processed in order (turbo gate before backing valve); valves within
+# a tier are independent and are closed concurrently.
+VALVE_CLOSE_TIERS = (
+    ('btnValveTurboGate',),     # Close turbo gate first
+    ('btnValveBacking',),       # Then backing valve
+    ('btnValveRough',           # Rough, vent and load-lock valves
+     'btnValveVent',
+     'btnValveLoadLockGate',
+     'btnValveLoadLockRough',
+     'btnValveLoadLockVent'),
+    ('btnValveGas1',            # Gas valves and shutters
+     'btnValveGas2',
+     'btnValveGas3',
+     'btnShutter1',
+     'btnShutter2'),
+)
+# Every relay handled by the tiered valve close, for O(1) "already handled" tests
+VALVE_CLOSE_SET = frozenset(name for tier in VALVE_CLOSE_TIERS for name in tier)
+
 def toggle_ion_gauge(desired_state: bool, arduino: ArduinoController, 
                      safety: SafetyController, relay_map: Dict[str, int]) -> bool:
     """
@@ -57,11 +185,11 @@ def toggle_ion_gauge(desired_state: bool, arduino: ArduinoController,
     """
     relay = relay_map.get('btnIonGauge')
     if relay is None:
-        print("❌ Error: btnIonGauge not found in relay_map")
+        progress.info("❌ Error: btnIonGauge not found in relay_map")
         return False
         
     if arduino is None:
-        print("❌ Error: Arduino controller is None")
+        progress.info("❌ Error: Arduino controller is None")
         return False
     
     try:
@@ -72,17 +200,19 @@ def toggle_ion_gauge(desired_state: bool, arduino: ArduinoController,
         
         # If we can determine current state and it matches desired, no action needed
         if current_state is not None and current_state == desired_state:
-            print(f"📏 Ion gauge already in desired state ({desired_state})")
+            progress.info("📏 Ion gauge already in desired state (%s)", desired_state)
             return True
             
         # Pulse the relay to toggle the ion gauge
-        print(f"📏 Pulsing ion gauge relay to set state to {desired_state}")
+        progress.info("📏 Pulsing ion gauge relay to set state to %s", desired_state)
         
         # Set relay ON
         if not arduino.set_relay(relay, True):
-            print("❌ Failed to pulse ion gauge relay ON")
+            progress.info("❌ Failed to pulse ion gauge relay ON")
             return False
             
+        _analog_cache.invalidate()
+
         # Update safety controller bookkeeping
         if safety is not None:
             safety.relay_states['btnIonGauge'] = desired_state
@@ -92,12 +222,12 @@ def toggle_ion_gauge(desired_state: bool, arduino: ArduinoController,
         
         # Set relay OFF
         if not arduino.set_relay(relay, False):
-            print("❌ Failed to turn off ion gauge relay after pulse")
+            progress.info("❌ Failed to turn off ion gauge relay after pulse")
             
         return True
         
     except Exception as e:
-        print(f"❌ Exception in toggle_ion_gauge: {e}")
+        progress.info("❌ Exception in toggle_ion_gauge: %s", e)
         return False
 
 def turbo_protection_procedure(safety: SafetyController, 
@@ -109,40 +239,108 @@ def turbo_protection_procedure(safety: SafetyController,
     """
 
     # Turn off Ion Gauge if on
-    print("📏 Turning OFF Ion Gauge if it is ON")
+    progress.info("📏 Turning OFF Ion Gauge if it is ON")
     if safety.is_ion_gauge_on():
         if not toggle_ion_gauge(False, arduino, safety, relay_map):
-            print("❌ Failed to turn off Ion Gauge")
+            progress.info("❌ Failed to turn off Ion Gauge")
             return False
     # Turn off turbo pump if on
-    print("🌀 Turning OFF turbo pump if it is ON")
+    progress.info("🌀 Turning OFF turbo pump if it is ON")
     if safety.relay_states.get('btnPumpTurbo', False):
         if not set_relay_safe('btnPumpTurbo', False, arduino, safety, relay_map):
-            print("❌ Failed to turn off turbo pump")
+            progress.info("❌ Failed to turn off turbo pump")
             return False
         time.sleep(4.0)  # brief pause to ensure turbo off 
 
     # Close turbo gate
-    print("🔀 Closing turbo gate valve to protect it from gas exposure.")
+    progress.info("🔀 Closing turbo gate valve to protect it from gas exposure.")
     if not set_relay_safe('btnValveTurboGate', False, arduino, safety, relay_map):
-        print("❌ Failed to close turbo gate valve")
+        progress.info("❌ Failed to close turbo gate valve")
         return False
     time.sleep(5.0)  # brief pause to ensure valve closed
 
     # Close turbo backing valve
-    print("🔀 Closing turbo backing valve to protect it from gas exposure.")
+    progress.info("🔀 Closing turbo backing valve to protect it from gas exposure.")
     if not set_relay_safe('btnValveBacking', False, arduino, safety, relay_map):
-        print("❌ Failed to close turbo backing valve")
+        progress.info("❌ Failed to close turbo backing valve")
         return False
     time.sleep(4.0)  # brief pause to ensure valve closed
     
     return True
 
+class _RelayWriteQueue:
+    """Background writer for deferred relay commands.
+
+    Deferred writes are safety-checked by the caller, then sent to the Arduino
+    from a single writer thread so the caller does not wait for each ACK.
+    flush() blocks until every queued write has been answered, records the
+    acknowledged writes in relay_states and returns False if any was rejected.
+    relay_states is only changed by the flushing thread, and only for writes
+    the Arduino has confirmed.
+    """
+
+    def __init__(self):
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        # Answered writes (safety, name, value, ok), handed from the writer to flush()
+        self._results_lock = threading.Lock()
+        self._results: List[Tuple[SafetyController, str, bool, bool]] = []
+
+    def submit(self, name: str, relay: int, value: bool,
+               arduino: ArduinoController, safety: SafetyController,
+               suppress_logging: bool = False) -> None:
+        if self._thread is None:
+            with self._start_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="RelayWriter",
+                                                    daemon=True)
+                    self._thread.start()
+        self._queue.put((name, relay, value, arduino, safety, suppress_logging))
+
+    def _run(self) -> None:
+        while True:
+            name, relay, value, arduino, safety, suppress_logging = self._queue.get()
+            try:
+                ok = bool(arduino.set_relay(relay, value, suppress_logging=suppress_logging))
+            except Exception as e:
+                progress.info("❌ Exception setting relay %s: %s", name, e)
+                ok = False
+            if ok:
+                _analog_cache.invalidate()
+            with self._results_lock:
+                self._results.append((safety, name, value, ok))
+            self._queue.task_done()
+
+    def flush(self) -> bool:
+        if self._thread is None:
+            return True
+        self._queue.join()
+        with self._results_lock:
+            results, self._results = self._results, []
+        failed = []
+        for safety, name, value, ok in results:
+            if ok:
+                # Look relay_states up now: the app swaps in a new dict on every poll
+                safety.relay_states[name] = value
+            else:
+                failed.append(name)
+        if failed:
+            progress.info("⚠️ Deferred relay writes failed: %s", ', '.join(failed))
+        return not failed
+
+_relay_writes = _RelayWriteQueue()
+
+def flush_relays() -> bool:
+    """Wait for all deferred relay writes; False if any was rejected."""
+    return _relay_writes.flush()
+
 # Helper to safely set relay and update safety.relay_states if available
 def set_relay_safe(name: str, value: bool, arduino: ArduinoController, 
                    safety: SafetyController, 
                    relay_map: Dict[str, int],
-                   suppress_logging: bool = False) -> bool:
+                   suppress_logging: bool = False,
+                   sync: bool = True) -> bool:
     """Set a relay via the Arduino and update the safety controller's relay state.
 
     Special-case for the Ion Gauge (`btnIonGauge`): the hardware expects a
@@ -154,53 +352,193 @@ def set_relay_safe(name: str, value: bool, arduino: ArduinoController,
     IMPORTANT: This function performs safety checks using is_auto_procedure=True,
     which bypasses mode restrictions in Normal mode but still enforces all other
     safety conditions including forbidden_conditions.
+
+    With sync=False the Arduino write is queued instead of waited for: the
+    return value only reports the safety check, and relay_states is only
+    updated by flush_relays() once the write is acknowledged. Later safety
+    checks therefore see the relay unswitched until the flush. Keep the
+    default wherever that matters, and for writes whose ordering matters
+    (mains power, pumps, gate valves, shutdown sequences).
     """
     relay = relay_map.get(name)
     if relay is None:
-        print(f"❌ Error: {name} not found in relay_map")
+        progress.info("❌ Error: %s not found in relay_map", name)
         return False
 
+    return _set_relay_fast(name, relay, value, arduino, safety, relay_map,
+                           suppress_logging=suppress_logging, sync=sync)
+
+def _set_relay_fast(name: str, relay: int, value: bool, arduino: ArduinoController,
+                    safety: SafetyController,
+                    relay_map: Dict[str, int],
+                    suppress_logging: bool = False,
+                    sync: bool = True) -> bool:
+    """Body of set_relay_safe for callers that have already resolved the relay number.
+
+    Used by loops that precompute (name, relay) pairs once so the relay_map
+    lookup is not repeated for every relay operation.
+    """
     # Defensive: ensure arduino provided
     if arduino is None:
-        print("❌ Error: Arduino controller is None")
+        progress.info("❌ Error: Arduino controller is None")
         return False
 
     try:
+        states = safety.relay_states
         # Check if relay is already in the desired state
-        current_state = safety.relay_states.get(name, False)
+        current_state = states.get(name, False)
         if current_state == value:
-            #print(f"Relay {name} is already in desired state ({value}) - no action needed")
+            #progress.info(f"Relay {name} is already in desired state ({value}) - no action needed")
             return True
         
         # Perform safety check for this button operation
         # Use is_auto_procedure=True to bypass mode restrictions but keep all other safety checks
         safety_result = safety.check_button_safety(name, is_auto_procedure=True)
         if not safety_result.allowed:
-            print(f"⚠️ Safety check failed for {name}: {safety_result.message}")
+            progress.info("⚠️ Safety check failed for %s: %s", name, safety_result.message)
             return False
         
         # Ion gauge requires special handling: use dedicated function
         if name == 'btnIonGauge':
             return toggle_ion_gauge(value, arduino, safety, relay_map)
 
+        if not sync:
+            _relay_writes.submit(name, relay, value, arduino, safety, suppress_logging)
+            return True
+
         # Default behavior for other relays: set to requested value
         ok = arduino.set_relay(relay, value, suppress_logging = suppress_logging)
         if ok:
+            # Switching a pump or valve may move the gauges; drop the cached frame
+            _analog_cache.invalidate()
             try:
-                safety.relay_states[name] = value
+                states[name] = value
             except Exception:
                 pass
-        return builtins.bool(ok)
+        return bool(ok)
     except Exception as e:
-        print(f"❌ Exception setting relay {name}: {e}")
+        progress.info("❌ Exception setting relay %s: %s", name, e)
         return False
 
+def _set_relays_bulk(specs: List[Tuple[str, int]], value: bool,
+                     arduino: ArduinoController,
+                     safety: SafetyController) -> bool:
+    """Switch several relays to `value` with one framed Arduino command.
+
+    Every relay still gets its own safety check, evaluated in order as if the
+    preceding relays had already switched, exactly like sequential
+    set_relay_safe calls. Relays already in the requested state or failing
+    their check are skipped. Not for the ion gauge (pulse-toggled).
+
+    Returns:
+        True if the frame was accepted (or nothing needed switching), False if
+        the Arduino rejected it; relay_states are then left unchanged so the
+        caller can fall back to per-relay writes.
+    """
+    states = safety.relay_states
+    previous: Dict[str, bool] = {}
+    to_switch: Dict[int, bool] = {}
+    for name, relay in specs:
+        if states.get(name, False) == value:
+            continue
+        safety_result = safety.check_button_safety(name, is_auto_procedure=True)
+        if not safety_result.allowed:
+            progress.info("⚠️ Safety check failed for %s: %s", name, safety_result.message)
+            continue
+        # Tentatively apply so later checks in this batch see the new state
+        previous[name] = states.get(name, False)
+        states[name] = value
+        to_switch[relay] = value
+
+    if not to_switch:
+        return True
+
+    try:
+        ok = arduino.set_relays_bulk(to_switch)
+    except Exception as e:
+        progress.info("❌ Exception sending bulk relay command: %s", e)
+        ok = False
+    if not ok:
+        states.update(previous)
+        return False
+    _analog_cache.invalidate()
+    return True
+
+def set_relays_safe_batch(changes: List[Tuple[str, bool]],
+                          arduino: ArduinoController,
+                          safety: SafetyController,
+                          relay_map: Dict[str, int]) -> bool:
+    """Apply several relay changes as one framed Arduino command.
+
+    All safety checks run up front, in order, each seeing the preceding
+    changes as already applied. If any check fails nothing is switched. The
+    passing changes then go out in a single RELAYS_ frame and relay_states
+    is updated together. If the firmware rejects the frame, the changes are
+    applied one at a time through set_relay_safe instead. Relays already in
+    the requested state are skipped. Not for the ion gauge (pulse-toggled).
+
+    Returns:
+        True if every relay ended in its requested state, False otherwise.
+    """
+    states = safety.relay_states
+    previous: Dict[str, bool] = {}
+    to_switch: Dict[int, bool] = {}
+    for name, value in changes:
+        relay = relay_map.get(name)
+        if relay is None:
+            progress.info("❌ Error: %s not found in relay_map", name)
+            states.update(previous)
+            return False
+        if states.get(name, False) == value:
+            continue
+        safety_result = safety.check_button_safety(name, is_auto_procedure=True)
+        if not safety_result.allowed:
+            progress.info("⚠️ Safety check failed for %s: %s", name, safety_result.message)
+            states.update(previous)
+            return False
+        # Tentatively apply so later checks in this batch see the new state
+        previous[name] = states.get(name, False)
+        states[name] = value
+        to_switch[relay] = value
+
+    if not to_switch:
+        return True
+
+    try:
+        ok = arduino.set_relays_bulk(to_switch)
+    except Exception as e:
+        progress.info("❌ Exception sending bulk relay command: %s", e)
+        ok = False
+    if ok:
+        _analog_cache.invalidate()
+        return True
+
+    # Firmware without bulk support: fall back to sequential writes
+    states.update(previous)
+    return all(set_relay_safe(name, value, arduino, safety, relay_map)
+               for name, value in changes)
+
+# Adaptive polling for threshold waits: sleep roughly half the estimated time
+# to reach the threshold, clamped so we neither hammer the serial port early
+# in a long pump-down nor overshoot the threshold by a full interval.
+ADAPTIVE_POLL_MIN = 0.1    # seconds
+ADAPTIVE_POLL_MAX = 2.0    # seconds
+ADAPTIVE_POLL_GAIN = 0.5
+RATE_EWMA_ALPHA = 0.3      # weight of the newest sample in the rate estimate
+
+def _adaptive_poll_interval(remaining: float, rate: float) -> float:
+    """Poll interval for a value `remaining` volts from threshold moving at `rate` V/s."""
+    return min(ADAPTIVE_POLL_MAX,
+               max(ADAPTIVE_POLL_MIN, ADAPTIVE_POLL_GAIN * remaining / max(rate, 1e-6)))
+
 def wait_for_analog_condition(
     arduino: ArduinoController,
     safety: SafetyController,
-    condition_fn: Callable[[List[float]], bool],
+    condition_fn: Callable[[Sequence[float]], bool],
     max_wait_time: int = 300,
     poll_interval: float = 1.0,
+    threshold_value: Optional[float] = None,
+    value_extractor: Optional[Callable[[Sequence[float]], float]] = None,
 ) -> bool:
     """Wait until an analog-read based condition is true or timeout.
 
@@ -210,35 +548,106 @@ def wait_for_analog_condition(
         condition_fn: callable taking the voltages list and returning True when condition met.
         max_wait_time: seconds to wait before giving up.
         poll_interval: seconds between polls.
+        threshold_value: see wait_for_any_analog_condition.
+        value_extractor: see wait_for_any_analog_condition.
 
     Returns:
         True when condition met, False on timeout.
     """
-    wait_start = time.time()
+    return wait_for_any_analog_condition(
+        arduino, safety, [condition_fn],
+        max_wait_time=max_wait_time,
+        poll_interval=poll_interval,
+        threshold_value=threshold_value,
+        value_extractor=value_extractor,
+    ) is not None
+
+def wait_for_any_analog_condition(
+    arduino: ArduinoController,
+    safety: SafetyController,
+    conditions: List[Callable[[Sequence[float]], bool]],
+    max_wait_time: int = 300,
+    poll_interval: float = 1.0,
+    threshold_value: Optional[float] = None,
+    value_extractor: Optional[Callable[[Sequence[float]], float]] = None,
+) -> Optional[int]:
+    """Wait until any of several analog-read based conditions is true or timeout.
+
+    All conditions are evaluated against the same reading, so one serial
+    round-trip serves every condition being watched.
+
+    Args:
+        arduino: ArduinoController instance to read analog voltages from.
+        safety: SafetyController to be updated with fresh readings.
+        conditions: callables taking the voltages list and returning True when met.
+        max_wait_time: seconds to wait before giving up.
+        poll_interval: seconds between polls.
+        threshold_value: optional threshold the watched value is approaching. When
+            given, the poll interval adapts to the distance from the threshold and
+            the estimated rate of change (between ADAPTIVE_POLL_MIN and ADAPTIVE_POLL_MAX).
+        value_extractor: callable returning the watched value from the voltages
+            list (defaults to the chamber pressure, v[1]).
+
+    Returns:
+        Index of the first condition met, or None on timeout, cancellation or
+        repeated read failures.
+    """
+    # Readings are only meaningful once queued relay writes have landed
+    flush_relays()
+
+    # Bind the per-poll callables once instead of resolving them every iteration
+    monotonic = time.monotonic
+    cancelled = is_procedure_cancelled
+    # Returns True as soon as a cancel arrives instead of sleeping out the interval
+    sleep = wait_cancelled
+    read_voltages = get_voltages_cached
+    update_state = safety.update_system_state
+
+    # Monotonic clock: immune to wall-clock (NTP) adjustments during long pump-downs
+    wait_start = monotonic()
+    deadline = wait_start + max_wait_time
     failed_attempts = 0
     max_failed_attempts = 5
-    
-    while time.time() - wait_start < max_wait_time:
+
+    adaptive = threshold_value is not None
+    # Oldest frame (ours or the GUI poll's) accepted in place of a fresh serial read
+    snapshot_age = ADAPTIVE_POLL_MIN if adaptive else poll_interval / 2
+    if value_extractor is None:
+        value_extractor = lambda v: v[1]
+    prev_value = None
+    prev_time = 0.0
+    rate = 0.0
+    # Polling-loop logging goes through `logger`, throttled to LOG_THROTTLE_INTERVAL
+    last_warning_time = last_info_time = wait_start - LOG_THROTTLE_INTERVAL
+    
+    while True:
+        now = monotonic()
+        if now >= deadline:
+            break
+
         # Check for cancellation signal
-        if is_procedure_cancelled():
-            print("🛑 wait_for_analog_condition cancelled by user")
-            return False
+        if cancelled():
+            progress.info("🛑 wait_for_analog_condition cancelled by user")
+            return None
             
         voltages = None
         try:
-            voltages = arduino.get_analog_voltages()
+            voltages = read_voltages(arduino, snapshot_age, safety)
         except Exception:
             voltages = None
 
         if voltages is None:
             failed_attempts += 1
-            print(f"Failed to read analog voltages (attempt {failed_attempts}/{max_failed_attempts})")
+            if now - last_warning_time >= LOG_THROTTLE_INTERVAL:
+                logger.warning("Failed to read analog voltages (attempt %d/%d)",
+                               failed_attempts, max_failed_attempts)
+                last_warning_time = now
             
             if failed_attempts >= max_failed_attempts:
-                print(f"Aborting: Failed to read analog voltages {max_failed_attempts} consecutive times")
-                return False
+                progress.info("Aborting: Failed to read analog voltages %s consecutive times", max_failed_attempts)
+                return None
                 
-            time.sleep(poll_interval)
+            sleep(poll_interval)
             continue
         
         # Reset failure counter on successful read
@@ -246,20 +655,111 @@ def wait_for_analog_condition(
 
         # Update safety controller with fresh readings if available
         try:
-            safety.update_system_state(analog_inputs=voltages)
+            update_state(analog_inputs=voltages)
         except Exception:
             pass
 
-        try:
-            if condition_fn(voltages):
-                return True
-        except Exception:
-            # If predicate raises, treat as not yet satisfied
-            pass
+        for index, condition_fn in enumerate(conditions):
+            try:
+                if condition_fn(voltages):
+                    return index
+            except Exception:
+                # If predicate raises, treat as not yet satisfied
+                pass
 
-        time.sleep(poll_interval)
+        if now - last_info_time >= LOG_THROTTLE_INTERVAL:
+            logger.info("Waiting for analog condition: %.0f s elapsed, voltages %s",
+                        now - wait_start, voltages)
+            last_info_time = now
 
-    return False
+        sleep_time = poll_interval
+        if adaptive:
+            try:
+                value = value_extractor(voltages)
+                if prev_value is not None and now > prev_time:
+                    sample_rate = abs(value - prev_value) / (now - prev_time)
+                    rate = RATE_EWMA_ALPHA * sample_rate + (1.0 - RATE_EWMA_ALPHA) * rate
+                prev_value, prev_time = value, now
+                sleep_time = _adaptive_poll_interval(abs(value - threshold_value), rate)
+            except Exception:
+                sleep_time = poll_interval
+
+        sleep(sleep_time)
+
+    return None
+
+class ProcedureStep(NamedTuple):
+    """One row of a table-driven procedure, executed by run_procedure_steps.
+
+    A step switches a relay, waits for an analog condition, or runs a custom
+    action (exactly one of relay / condition / action, or none for a pure pause).
+    """
+    message: str                      # printed when the step starts (skipped if empty)
+    relay: Optional[str] = None       # button name to switch via set_relay_safe
+    value: bool = False               # requested relay state
+    condition: Optional[Callable[[Sequence[float]], bool]] = None  # analog condition to wait for
+    max_wait: int = 300               # seconds allowed for `condition`
+    threshold: Optional[float] = None # enables adaptive polling for `condition`
+    action: Optional[Callable[[], bool]] = None  # custom step body
+    wait_after: float = 0.0           # fixed pause once the step succeeds
+    success_message: str = ""
+    failure_message: str = ""
+
+def validate_procedure_steps(steps: List[ProcedureStep], relay_map: Dict[str, int]) -> bool:
+    """Check up front that every relay a procedure will switch exists in relay_map.
+
+    Safety conditions depend on pressures reached during the procedure, so
+    they are still checked when each step runs.
+    """
+    missing = [step.relay for step in steps
+               if step.relay is not None and step.relay not in relay_map]
+    if missing:
+        progress.info("❌ Error: procedure relays not found in relay_map: %s", ', '.join(missing))
+        return False
+    return True
+
+def run_procedure_steps(steps: List[ProcedureStep],
+                        arduino: ArduinoController,
+                        safety: SafetyController,
+                        relay_map: Dict[str, int]) -> bool:
+    """Execute procedure steps in order, checking for cancellation between steps.
+
+    Returns:
+        True if every step succeeded, False on the first failure or cancellation.
+    """
+    for step in steps:
+        if is_procedure_cancelled():
+            progress.info("🛑 Procedure cancelled by user")
+            return False
+
+        if step.message:
+            progress.info(step.message)
+
+        if step.action is not None:
+            ok = step.action()
+        elif step.relay is not None:
+            ok = set_relay_safe(step.relay, step.value, arduino, safety, relay_map)
+        elif step.condition is not None:
+            ok = wait_for_analog_condition(
+                arduino=arduino,
+                safety=safety,
+                condition_fn=step.condition,
+                max_wait_time=step.max_wait,
+                poll_interval=1.0,
+                threshold_value=step.threshold,
+            )
+        else:
+            ok = True
+
+        if not ok:
+            if step.failure_message:
+                progress.info(step.failure_message)
+            return False
+        if step.success_message:
+            progress.info(step.success_message)
+        if step.wait_after:
+            time.sleep(step.wait_after)
+    return True
 
 def go_to_standby(arduino: ArduinoController, 
                         safety: SafetyController,
@@ -270,100 +770,186 @@ def go_to_standby(arduino: ArduinoController,
     
     # Check if already in standby state - avoid unnecessary operations
     current_state = getattr(safety, 'system_status', None)
-    if current_state == 'standby':
-        print("😴 System is already in standby state - no action needed")
+    if current_state == 'standby' or safety.is_in_canonical_state('standby'):
+        progress.info("😴 System is already in standby state - no action needed")
         return True
     
-    # If not in default state, go to default first
+    # If not in default state, go to default first (go_to_default_state itself
+    # returns immediately if a previous run left the relays untouched)
     if current_state != 'default':
         if not go_to_default_state(arduino, safety, relay_map):
-            print("❌ Failed to take system to default state. Aborting.")
+            progress.info("❌ Failed to take system to default state. Aborting.")
             return False
     
-    print("😴 Putting system in standby state.")
+    progress.info("😴 Putting system in standby state.")
     # Turn off scroll pump (standby has all pumps off)
+    scroll_was_on = safety.relay_states.get('btnPumpScroll', False)
     if not set_relay_safe('btnPumpScroll', False, arduino, safety, relay_map):
-        print("⚠️ Warning: Failed to turn off scroll pump")
+        progress.info("⚠️ Warning: Failed to turn off scroll pump")
         return False
 
-    time.sleep(3.0)
-    print("✅ System taken to standby state.")
+    # Only wait for the scroll pump to stop if it was actually running
+    if scroll_was_on:
+        time.sleep(3.0)
+    safety.mark_canonical_state('standby')
+    progress.info("✅ System taken to standby state.")
+    return True
+
+# Relay number of the mains power interlock (Arduino pin 22), used when
+# relay_map has no btnMainsPower entry
+MAINS_POWER_RELAY = 1
+
+# Relays switched OFF together when a sputter run ends. Mains power is relay 1,
+# the lowest bit of the RELAYS_ frame, so the firmware drops it first.
+SPUTTER_SHUTDOWN_RELAYS = ('btnMainsPower', 'btnValveGas1', 'btnValveGas2', 'btnValveGas3')
+
+def _mains_power_off(arduino: ArduinoController,
+                     safety: SafetyController,
+                     relay_map: Dict[str, int]) -> bool:
+    """Turn mains power OFF, falling back to direct Arduino commands.
+
+    The mains state is forced to ON first so the OFF command is always sent,
+    even if relay state tracking is incorrect. Attempts run in order and the
+    first success wins.
+    """
+    mains_relay = relay_map.get('btnMainsPower', MAINS_POWER_RELAY)
+    states = safety.relay_states
+    states['btnMainsPower'] = True
+
+    attempts = [
+        ("safety-checked", lambda: set_relay_safe('btnMainsPower', False, arduino, safety, relay_map)),
+        ("direct", lambda: arduino.set_relay(mains_relay, False)),
+    ]
+    if mains_relay != MAINS_POWER_RELAY:
+        # Relay 1 is wired to the mains interlock in the firmware, whatever relay_map says
+        attempts.append(("firmware mains relay", lambda: arduino.set_relay(MAINS_POWER_RELAY, False)))
+
+    failures = []
+    for label, attempt in attempts:
+        try:
+            ok = attempt()
+        except Exception as e:
+            ok = False
+            failures.append(f"{label}: {e}")
+        else:
+            if not ok:
+                failures.append(f"{label}: rejected")
+        if ok:
+            states['btnMainsPower'] = False
+            if failures:
+                progress.info("✅ Mains power turned off after fallback (%s)", '; '.join(failures))
+            return True
+
+    progress.info("❌ All mains power shutdown attempts failed: %s", '; '.join(failures))
+    return False
+
+def _sputter_shutdown(arduino: ArduinoController,
+                      safety: SafetyController,
+                      relay_map: Dict[str, int]) -> bool:
+    """Turn mains power OFF and close any open gas valves in one frame.
+
+    Falls back to switching the same relays directly, bypassing the safety
+    checks, if the safe batch fails.
+    """
+    mains_relay = relay_map.get('btnMainsPower', MAINS_POWER_RELAY)
+    states = safety.relay_states
+    # Force the mains state to ON so the OFF command is always sent
+    states['btnMainsPower'] = True
+    shutdown = [(name, False) for name in SPUTTER_SHUTDOWN_RELAYS
+                if states.get(name, False)]
+    # Named once in the summary line rather than one line per valve
+    open_valves = ", ".join(name for name, _ in shutdown if name != 'btnMainsPower') or "none open"
+    try:
+        if set_relays_safe_batch(shutdown, arduino, safety, relay_map):
+            progress.info("✅ Mains power disabled, gas valves closed (%s) - RF/DC supplies turned off", open_valves)
+            return True
+    except Exception as e:
+        progress.info("❌ Warning: Safe shutdown failed: %s", e)
+
+    progress.info("⚠️ Safe shutdown failed - trying direct Arduino command...")
+    # (name, relay) pairs, mains first for firmware that needs one write per relay
+    pairs = [('btnMainsPower', mains_relay)]
+    for name, _ in shutdown:
+        relay = relay_map.get(name)
+        if relay is not None and name != 'btnMainsPower':
+            pairs.append((name, relay))
+    try:
+        ok = arduino.set_relays_bulk({relay: False for _, relay in pairs})
+    except Exception as e2:
+        progress.info("❌ Direct shutdown frame failed: %s", e2)
+        ok = False
+    if ok:
+        for name, _ in pairs:
+            states[name] = False
+        progress.info("✅ Mains power and gas valves (%s) turned off via direct Arduino command", open_valves)
+        return True
+
+    # One write per relay; a failing relay does not stop the rest
+    failed = []
+    for name, relay in pairs:
+        try:
+            ok = arduino.set_relay(relay, False)
+        except Exception:
+            ok = False
+        if ok:
+            states[name] = False
+        else:
+            failed.append(name)
+    if failed:
+        progress.info("❌ Direct shutdown failed for: %s", ', '.join(failed))
+        return False
+    progress.info("✅ Mains power and gas valves (%s) turned off via direct Arduino command", open_valves)
     return True
 
 def go_to_default_state(arduino: ArduinoController, 
                         safety: SafetyController,
-                        relay_map: Dict[str, int]) -> bool:
+                        relay_map: Dict[str, int],
+                        fine_grained: bool = False) -> bool:
     """
     Go to the default state for the vacuum system.
     
     Default state per YAML: scroll pump ON, all other relays OFF.
     This provides a safe intermediate state for system operations.
+
+    After the ordered valve close, the remaining relays are switched off with a
+    single ALL_OFF command. Set fine_grained=True to switch them off one at a
+    time through set_relay_safe instead (useful when debugging a relay).
     """
-    print("🏠 Returning system to default state...")
+    progress.info("🏠 Returning system to default state...")
 
     try:
         # Check if already in default state - avoid unnecessary operations
         try:
             current_system_state = getattr(safety, 'system_status', None)
-            if current_system_state == 'default':
-                print("System is already in default state - no action needed")
+            if current_system_state == 'default' or safety.is_in_canonical_state('default'):
+                progress.info("System is already in default state - no action needed")
                 return True
         except Exception:
-            print("Could not determine current system state - proceeding with default procedure")
+            progress.info("Could not determine current system state - proceeding with default procedure")
 
         # Get current system state for logging
         try:
             current_state = safety.get_safety_status_summary()
-            print(f"Current relay states: {current_state.get('relay_states', {})}")
+            progress.info("Current relay states: %s", current_state.get('relay_states', {}))
         except Exception:
-            print("Could not read current system state")
+            progress.info("Could not read current system state")
 
         # Safe shutdown sequence for high-energy components
         
         # 1. Turn off mains power first for safety (ALWAYS attempt this for safety)
-        try:
-            print("Turning off mains power (RF/DC supplies)...")
-            
-            # Force update the relay state to ensure safety controller knows mains might be ON
-            safety.relay_states['btnMainsPower'] = True
-            
-            # Always attempt to turn off mains power during default state transition
-            # This ensures safety even if relay state tracking is incorrect
-            if not set_relay_safe('btnMainsPower', False, arduino, safety, relay_map):
-                print("⚠️ set_relay_safe failed for mains power - trying direct Arduino command...")
-                # Fallback: try direct Arduino command
-                try:
-                    mains_relay = relay_map.get('btnMainsPower')
-                    if mains_relay:
-                        arduino.set_relay(mains_relay, False)
-                        safety.relay_states['btnMainsPower'] = False  # Update state manually
-                        print("✅ Mains power turned off via direct Arduino command")
-                    else:
-                        print("❌ Cannot find mains power relay in relay_map")
-                except Exception as e2:
-                    print(f"❌ Direct mains power shutdown also failed: {e2}")
-            else:
-                print("✅ Mains power turned off successfully")
-            time.sleep(0.5)
-        except Exception as e:
-            print(f"❌ Warning: Could not turn off mains power: {e}")
-            # Last resort: try direct relay command
-            try:
-                mains_relay = relay_map.get('btnMainsPower', 22)  # Default to pin 22
-                arduino.set_relay(mains_relay, False)
-                safety.relay_states['btnMainsPower'] = False
-                print("✅ Mains power turned off via emergency direct command")
-            except Exception as e3:
-                print(f"❌ Emergency mains power shutdown failed: {e3}")
+        progress.info("Turning off mains power (RF/DC supplies)...")
+        if _mains_power_off(arduino, safety, relay_map):
+            progress.info("✅ Mains power turned off successfully")
+        time.sleep(0.5)
         
         # 2. Turn off Ion Gauge (if on) to protect filament
         try:
             if hasattr(safety, 'is_ion_gauge_on') and safety.is_ion_gauge_on():
-                print("Turning off Ion Gauge...")
+                progress.info("Turning off Ion Gauge...")
                 toggle_ion_gauge(False, arduino, safety, relay_map)
                 time.sleep(1.0)
         except Exception as e:
-            print(f"Warning: Could not safely turn off ion gauge: {e}")
+            progress.info("Warning: Could not safely turn off ion gauge: %s", e)
 
         # 3. Handle turbo pump shutdown if running
         turbo_running = False
@@ -373,78 +959,92 @@ def go_to_default_state(arduino: ArduinoController,
             pass
 
         if turbo_running:
-            print("Turbo pump is running - performing safe shutdown...")
+            progress.info("Turbo pump is running - performing safe shutdown...")
             
             # Turn off turbo pump
             if not set_relay_safe('btnPumpTurbo', False, arduino, safety, relay_map):
-                print("Warning: Failed to turn off turbo pump")
+                progress.info("Warning: Failed to turn off turbo pump")
             
             # Wait briefly for turbo to begin spinning down
             time.sleep(1.0)
 
-            # Wait for turbo spin to drop below 90% before closing valves
-            print("Waiting for turbo spin to drop below 90% (4.11 V)")
-            def spin_below_90(v: List[float]) -> bool:
-                try:
-                    return len(v) > 3 and float(v[3]) <= 4.11
-                except Exception:
-                    return False
-            
+            # Wait for turbo spin to drop below 90% before closing valves. The same
+            # readings are watched for a chamber pressure rise: if the chamber
+            # loses vacuum during spin-down, the valves are closed straight away.
+            chamber_medium_vacuum = safety.safety_config.get(
+                'pressure_thresholds', {}).get('chamber_medium_vacuum', 2.0)
+            chamber_pressure_rising = _threshold_predicate(1, operator.gt, chamber_medium_vacuum)
+            progress.info("Waiting for turbo spin to drop below 90%% (%s V)", TURBO_SPIN_90_VOLTS)
             # Wait up to 2 minutes for turbo to slow down
-            if not wait_for_analog_condition(arduino, safety, spin_below_90, max_wait_time=120):
-                print("Warning: Timeout waiting for turbo spin to drop - continuing anyway")
-
-        # 4. Close all valves in safe order
-        valve_close_order = [
-            'btnValveTurboGate',    # Close turbo gate first
-            'btnValveBacking',      # Then backing valve
-            'btnValveRough',        # Rough valve
-            'btnValveVent',         # Vent valve
-            'btnValveLoadLockGate', # Load lock gate
-            'btnValveLoadLockRough',# Load lock rough
-            'btnValveLoadLockVent', # Load lock vent
-            'btnValveGas1',         # Gas valves
-            'btnValveGas2',
-            'btnValveGas3',
-            'btnShutter1',          # Shutters
-            'btnShutter2',
-        ]
-        
-        print("Closing all valves and shutters...")
-        for valve_name in valve_close_order:
-            if valve_name in relay_map:
-                try:
-                    set_relay_safe(valve_name, False, arduino, safety, relay_map)
-                    time.sleep(0.5)  # Brief pause between valve operations
-                except Exception as e:
-                    print(f"Warning: Failed to close {valve_name}: {e}")
+            met = wait_for_any_analog_condition(
+                arduino, safety, [_turbo_spin_below_90, chamber_pressure_rising],
+                max_wait_time=120)
+            if met is None:
+                progress.info("Warning: Timeout waiting for turbo spin to drop - continuing anyway")
+            elif met == 1:
+                progress.info("⚠️ Chamber pressure rose above %s V during turbo spin-down - closing valves now", chamber_medium_vacuum)
+
+        # 4. Close all valves in safe order, one tier after another
+        progress.info("Closing all valves and shutters...")
+        for tier in VALVE_CLOSE_TIERS:
+            # Resolve relay numbers once rather than on every set_relay_safe call
+            tier_specs = [(n, relay_map[n]) for n in tier if n in relay_map]
+            if not tier_specs:
+                continue
+            # One framed command per tier; per-valve writes if the firmware
+            # does not support bulk commands
+            if not _set_relays_bulk(tier_specs, False, arduino, safety):
+                for valve_name, valve_relay in tier_specs:
+                    try:
+                        _set_relay_fast(valve_name, valve_relay, False, arduino, safety, relay_map)
+                    except Exception as e:
+                        progress.info("Warning: Failed to close %s: %s", valve_name, e)
+            time.sleep(0.5)  # Brief pause between valve tiers (keeps tier ordering)
+
+        # 5. Turn off any remaining relays with one ALL_OFF command rather than
+        # one command (and safety check) per relay. The per-relay path is kept
+        # for debugging (fine_grained=True) and as the fallback if ALL_OFF fails.
+        bulk_off = False
+        if not fine_grained:
+            progress.info("Turning off any remaining relays (ALL_OFF)...")
+            try:
+                bulk_off = arduino.all_relays_off()
+            except Exception as e:
+                progress.info("Warning: ALL_OFF command failed: %s", e)
+            if bulk_off:
+                # Ion gauge is pulse-toggled, its state was handled in step 2
+                safety.relay_states.update(
+                    {name: False for name in relay_map if name != 'btnIonGauge'})
+            else:
+                progress.info("Warning: ALL_OFF failed - turning relays off individually")
 
-        # 4. Ensure scroll pump is ON (default state requirement)
-        print("Ensuring scroll pump is ON for default state...")
+        if not bulk_off:
+            progress.info("Turning off any remaining relays...")
+            for name, relay in relay_map.items():
+                if name != 'btnPumpScroll' and name not in VALVE_CLOSE_SET:
+                    try:
+                        _set_relay_fast(name, relay, False, arduino, safety, relay_map)
+                    except Exception as e:
+                        progress.info("Warning: Failed to turn off %s: %s", name, e)
+
+        # 6. Ensure scroll pump is ON (default state requirement)
+        progress.info("Ensuring scroll pump is ON for default state...")
         try:
             if not set_relay_safe('btnPumpScroll', True, arduino, safety, relay_map):
-                print("Warning: Failed to turn on scroll pump")
+                progress.info("Warning: Failed to turn on scroll pump")
         except Exception as e:
-            print(f"Warning: Exception turning on scroll pump: {e}")
+            progress.info("Warning: Exception turning on scroll pump: %s", e)
 
-        # 5. Turn off any remaining relays except scroll pump
-        print("Turning off any remaining relays...")
-        for name, relay in relay_map.items():
-            if name != 'btnPumpScroll' and name not in valve_close_order:
-                try:
-                    set_relay_safe(name, False, arduino, safety, relay_map)
-                except Exception as e:
-                    print(f"Warning: Failed to turn off {name}: {e}")
-
-        print("System returned to default state (scroll pump ON, all others OFF)")
+        progress.info("System returned to default state (scroll pump ON, all others OFF)")
         time.sleep(1.0)  # Brief pause to ensure all commands processed
+        safety.mark_canonical_state('default')
         return True
 
     except Exception as e:
-        print(f"❌ Error in go_to_default_state: {e}")
+        progress.info("❌ Error in go_to_default_state: %s", e)
         # Emergency fallback: try to turn everything off
         try:
-            print("Attempting emergency all relays off...")
+            progress.info("Attempting emergency all relays off...")
             arduino.all_relays_off()
             time.sleep(1.0)
             # Turn scroll pump back on for default state
@@ -452,7 +1052,7 @@ def go_to_default_state(arduino: ArduinoController,
             if scroll_relay:
                 arduino.set_relay(scroll_relay, True)
         except Exception as e2:
-            print(f"Emergency fallback also failed: {e2}")
+            progress.info("Emergency fallback also failed: %s", e2)
         return False
 
 def pump_procedure(arduino: ArduinoController, 
@@ -489,82 +1089,133 @@ def pump_procedure(arduino: ArduinoController,
 
     # Reset cancellation flag at start of procedure
     reset_cancellation_flag()
+    # Safety checks are memoized per procedure run
+    safety.clear_check_cache()
+
+    # Get pressure thresholds once; the wait predicates bind them as default arguments
+    pressure_thresholds = safety.safety_config.get('pressure_thresholds', {})
+    chamber_medium_vacuum = pressure_thresholds.get('chamber_medium_vacuum', 2.0)
+    chamber_medium_vacuum_margin = chamber_medium_vacuum - 0.5
+    chamber_atmospheric = pressure_thresholds.get('chamber_atmospheric', 4.5)
+    chamber_high_vacuum = pressure_thresholds.get('chamber_high_vacuum', 0.7)
+
+    below_medium_margin = _threshold_predicate(1, operator.lt, chamber_medium_vacuum_margin)
+    below_medium_vacuum = _threshold_predicate(1, operator.lt, chamber_medium_vacuum)
 
-    # Get pressure thresholds
-    safety_config = safety.safety_config
-    chamber_medium_vacuum = safety_config.get('pressure_thresholds', {}).get('chamber_medium_vacuum', 2.0)
     # Default wait times
     chamber_wait_time = 1500  # seconds to wait for chamber to reach medium vacuum
-    
-    print("🚀 Starting pump procedure...")
+
+    def check_pumping_starts() -> bool:
+        return _check_initial_pressure_drop(arduino, safety, relay_map, chamber_atmospheric)
+
+    def ion_gauge_on_at_high_vacuum() -> bool:
+        if get_voltages_cached(arduino)[1] < chamber_high_vacuum:
+            # Check safety
+            safety_result = safety.check_button_safety('btnIonGauge', is_auto_procedure=True)
+            if not safety_result.allowed:
+                progress.info("Safety check failed for btnIonGauge: %s", safety_result.message)
+                return False
+            # Use the dedicated toggle function
+            if not toggle_ion_gauge(True, arduino, safety, relay_map):
+                progress.info("Failed to turn on Ion Gauge")
+                return False
+        return True
+
+    steps = [
+        ProcedureStep("🌊 Step 1: Turning on scroll pump",
+                      relay='btnPumpScroll', value=True,
+                      success_message="✅ Scroll pump turned on",
+                      failure_message="❌ Failed to turn on scroll pump"),
+        ProcedureStep("⏳ Step 2: Waiting 15 seconds for scroll pump to stabilize", wait_after=15),
+        ProcedureStep("🔀 Step 3: Opening rough valve",
+                      relay='btnValveRough', value=True,
+                      success_message="✅ Rough valve opened",
+                      failure_message="❌ Failed to open rough valve"),
+        # Guards against a slightly-open door when pumping from atmosphere
+        ProcedureStep("", action=check_pumping_starts),
+        ProcedureStep(f"⏳ Step 4: Waiting for chamber pressure to drop below {chamber_medium_vacuum} V.\n"
+                      f"Maximum wait time: {chamber_wait_time} seconds",
+                      condition=below_medium_margin, max_wait=chamber_wait_time,
+                      threshold=chamber_medium_vacuum_margin,
+                      failure_message="⏰ Timeout waiting for chamber pressure to drop"),
+        ProcedureStep("🔀 Step 5: Closing rough valve",
+                      relay='btnValveRough', value=False,
+                      success_message="Rough valve closed",
+                      failure_message="Failed to close rough valve"),
+        ProcedureStep("🔀 Step 6: Opening backing valve",
+                      relay='btnValveBacking', value=True,
+                      success_message="✅ Backing valve opened",
+                      failure_message="❌ Failed to open backing valve"),
+        ProcedureStep("⏳ Step 7: Waiting 5 seconds for backing valve", wait_after=5),
+        ProcedureStep("🔀 Step 8: Opening turbo gate valve",
+                      relay='btnValveTurboGate', value=True,
+                      success_message="✅ Turbo gate valve opened",
+                      failure_message="❌ Failed to open turbo gate valve"),
+        ProcedureStep(f"⏳ Step 9: Waiting for chamber pressure to drop below {chamber_medium_vacuum} V again",
+                      condition=below_medium_vacuum, max_wait=chamber_wait_time,
+                      threshold=chamber_medium_vacuum,
+                      wait_after=10,  # brief pause before next step
+                      failure_message="⏰ Timeout waiting for chamber pressure to drop again"),
+        ProcedureStep("🌀 Step 10: Turning on turbo pump",
+                      relay='btnPumpTurbo', value=True,
+                      success_message="✅ Turbo pump turned on",
+                      failure_message="❌ Failed to turn on turbo pump"),
+        ProcedureStep("🌀 Step 11: Waiting for turbo pump to reach > 80% spin speed",
+                      condition=_turbo_spin_above_80, max_wait=300,
+                      failure_message="Timeout waiting for turbo pump to reach spin speed"),
+        ProcedureStep("Step 12: Turning on Ion Gauge", action=ion_gauge_on_at_high_vacuum),
+    ]
+
+    progress.info("🚀 Starting pump procedure...")
+    # Fail fast on a bad relay_map before touching any hardware
+    if not validate_procedure_steps(steps, relay_map):
+        return False
+
     # Ensure system is in the default starting configuration before pumping
     try:
         if not go_to_default_state(arduino, safety, relay_map):
-            print("Failed to return to default state before pump procedure")
+            progress.info("Failed to return to default state before pump procedure")
             return False
     except Exception as e:
-        print(f"Exception while returning to default state: {e}")
-        return False
-    
-    # Step 1: Turn on scroll pump
-    print("🌊 Step 1: Turning on scroll pump")
-    # Check safety before turning on scroll pump
-    safety_result = safety.check_button_safety('btnPumpScroll', is_auto_procedure=True)
-    if not safety_result.allowed:
-        print(f"⚠️ Safety check failed for btnPumpScroll: {safety_result.message}")
+        progress.info("Exception while returning to default state: %s", e)
         return False
 
-    if not set_relay_safe('btnPumpScroll', True, arduino, safety, relay_map):
-        print("❌ Failed to turn on scroll pump")
+    if not run_procedure_steps(steps, arduino, safety, relay_map):
         return False
 
-    print("✅ Scroll pump turned on")
-    
-    # Step 2: Wait 15 seconds
-    print("⏳ Step 2: Waiting 15 seconds for scroll pump to stabilize")
-    time.sleep(15)
-    
-    # Step 3: Open rough valve
-    print("🔀 Step 3: Opening rough valve")
-    # Check safety
-    safety_result = safety.check_button_safety('btnValveRough', is_auto_procedure=True)
-    if not safety_result.allowed:
-        print(f"⚠️ Safety check failed for btnValveRough: {safety_result.message}")
-        return False
+    progress.info("✅ Pump procedure completed successfully!")
+    return True
 
-    if not set_relay_safe('btnValveRough', True, arduino, safety, relay_map):
-        print("❌ Failed to open rough valve")
-        return False
+def _check_initial_pressure_drop(arduino: ArduinoController,
+                                 safety: SafetyController,
+                                 relay_map: Dict[str, int],
+                                 chamber_atmospheric: float) -> bool:
+    """Door-leak check run right after the rough valve opens in pump_procedure.
 
-    print("✅ Rough valve opened")
-    
-    # Check if we're starting from atmospheric pressure - only then do the initial drop check
-    # This guards against a slightly-open door causing continued leakage when pumping from atmosphere
-    chamber_atmospheric = safety_config.get('pressure_thresholds', {}).get('chamber_atmospheric', 4.5)
-    
+    Only applies when starting from atmosphere: if the chamber pressure does not
+    begin to drop within 20 s, the rough valve is closed and False is returned.
+    Read errors do not abort the pump procedure.
+    """
     try:
         # Read current chamber pressure to see if we're starting from atmosphere
         baseline_volts = None
         try:
             volts = arduino.get_analog_voltages()
             if volts and len(volts) > 1:
-                baseline_volts = float(volts[1])
+                baseline_volts = volts[1]
         except Exception:
             baseline_volts = None
 
         # Only do the pressure drop check if starting from atmospheric pressure
         if baseline_volts is not None and baseline_volts > chamber_atmospheric:
-            print(f"📈 Starting from atmospheric pressure ({baseline_volts:.3f} V > {chamber_atmospheric} V)")
-            print("🔍 Performing initial pressure drop check to detect door leaks...\n\
+            progress.info("📈 Starting from atmospheric pressure (%.3f V > %s V)", baseline_volts, chamber_atmospheric)
+            progress.info("🔍 Performing initial pressure drop check to detect door leaks...\n\
                   ⚡📝 If pressure does not begin to drop within 20s, the procedure will abort.")
 
             # Define small drop threshold (0.02 V) to indicate pressure is beginning to fall
             drop_threshold = 0.02
-            def pressure_begins_to_drop(v: List[float]) -> bool:
-                try:
-                    return len(v) > 1 and float(v[1]) < (baseline_volts - drop_threshold)
-                except Exception:
-                    return False
+            pressure_begins_to_drop = _threshold_predicate(
+                1, operator.lt, baseline_volts - drop_threshold)
 
             # Wait up to 20 seconds for any sign of pressure decreasing
             began_drop = wait_for_analog_condition(
@@ -576,154 +1227,140 @@ def pump_procedure(arduino: ArduinoController,
             )
 
             if not began_drop:
-                print("🚨 Abort: Chamber pressure did not begin to drop within 20s after opening rough valve. Closing rough valve and aborting pump procedure.")
+                progress.info("🚨 Abort: Chamber pressure did not begin to drop within 20s after opening rough valve. Closing rough valve and aborting pump procedure.")
                 try:
                     set_relay_safe('btnValveRough', False, arduino, safety, relay_map)
                 except Exception:
-                    print("❌ Failed to close rough valve during abort")
+                    progress.info("❌ Failed to close rough valve during abort")
                 return False
             else:
-                print("✅ Pressure has begun to drop after opening rough valve; continuing pump procedure.")
+                progress.info("✅ Pressure has begun to drop after opening rough valve; continuing pump procedure.")
         else:
             if baseline_volts is not None:
-                print(f"📈 Starting from lower pressure ({baseline_volts:.3f} V <= {chamber_atmospheric} V) - skipping initial drop check")
+                progress.info("📈 Starting from lower pressure (%.3f V <= %s V) - skipping initial drop check", baseline_volts, chamber_atmospheric)
             else:
-                print("⚠️ Warning: could not read baseline chamber pressure - skipping initial drop check")
+                progress.info("⚠️ Warning: could not read baseline chamber pressure - skipping initial drop check")
     except Exception as e:
-        print(f"❌ Error while checking for initial pressure drop: {e}")
+        progress.info("❌ Error while checking for initial pressure drop: %s", e)
         # If the check fails unexpectedly, just continue (don't abort unless we know there's a problem)
-        print("⚠️ Continuing pump procedure despite pressure check error")
-
-    # Step 4: Wait until chamber pressure < chamber_medium_vacuum
-    print(f"⏳ Step 4: Waiting for chamber pressure to drop below {chamber_medium_vacuum} V.\nMaximum wait time: {chamber_wait_time} seconds")
-    # Wait for chamber to reach medium vacuum
-    if not wait_for_analog_condition(
-        arduino=arduino,
-        safety=safety,
-        condition_fn=lambda v: len(v) > 1 and float(v[1]) < chamber_medium_vacuum - 0.5,
-        max_wait_time=chamber_wait_time,
-        poll_interval=1.0
-    ):
-        print("⏰ Timeout waiting for chamber pressure to drop")
-        return False
-    
-    # Step 5: Close rough valve
-    print("🔀 Step 5: Closing rough valve")
-    # Check safety (though closing should always be safe)
-    safety_result = safety.check_button_safety('btnValveRough', is_auto_procedure=True)
-    if not safety_result.allowed:
-        print(f"Safety check failed for closing btnValveRough: {safety_result.message}")
-        return False
-
-    if not set_relay_safe('btnValveRough', False, arduino, safety, relay_map):
-        print("Failed to close rough valve")
-        return False
-
-    print("Rough valve closed")
-    
-    # Step 6: Open backing valve
-    print("🔀 Step 6: Opening backing valve")
-    # Check safety
-    safety_result = safety.check_button_safety('btnValveBacking', is_auto_procedure=True)
-    if not safety_result.allowed:
-        print(f"⚠️ Safety check failed for btnValveBacking: {safety_result.message}")
-        return False
+        progress.info("⚠️ Continuing pump procedure despite pressure check error")
+    return True
 
-    if not set_relay_safe('btnValveBacking', True, arduino, safety, relay_map):
-        print("❌ Failed to open backing valve")
-        return False
 
-    print("✅ Backing valve opened")
-    
-    # Step 7: Wait 5 seconds
-    print("⏳ Step 7: Waiting 5 seconds for backing valve")
-    time.sleep(5)
-    
-    # Step 8: Open turbo gate valve
-    print("🔀 Step 8: Opening turbo gate valve")
-    # Check safety
-    safety_result = safety.check_button_safety('btnValveTurboGate', is_auto_procedure=True)
-    if not safety_result.allowed:
-        print(f"⚠️ Safety check failed for btnValveTurboGate: {safety_result.message}")
-        return False
-
-    if not set_relay_safe('btnValveTurboGate', True, arduino, safety, relay_map):
-        print("❌ Failed to open turbo gate valve")
-        return False
+# Placeholder for other procedures
+# Turbo braking vent pulses (vent_procedure step 3): 150 ms vent openings, the
+# first VENT_BRAKE_SLOW_PULSES spaced 10 s apart and the rest back-to-back,
+# stopped early once the turbo spins below VENT_BRAKE_DONE_VOLTS
+VENT_BRAKE_PULSE_MS = 150
+VENT_BRAKE_SLOW_INTERVAL_MS = 10000
+VENT_BRAKE_SLOW_PULSES = 8
+VENT_BRAKE_FAST_INTERVAL_MS = 300
+VENT_BRAKE_FAST_PULSES = 12
+VENT_BRAKE_DONE_VOLTS = 1.3   # ~25% turbo spin
+
+def _turbo_brake_vent_pulses(arduino: ArduinoController,
+                             safety: SafetyController,
+                             relay_map: Dict[str, int]) -> bool:
+    """Brake the turbo with short vent pulses timed by the Arduino firmware.
+
+    One PULSE_RELAY command per pulse train replaces three serial round-trips
+    per pulse, and the 150 ms pulse width is timed by the Arduino rather than
+    by time.sleep. Python only watches the turbo speed and cancellation,
+    stopping the train with ABORT_PULSE. Falls back to Python-timed pulses on
+    firmware without pulse support.
 
-    print("✅ Turbo gate valve opened")
-    
-    # Step 9: Wait until chamber pressure < chamber_medium_vacuum again
-    print(f"⏳ Step 9: Waiting for chamber pressure to drop below {chamber_medium_vacuum} V again")
-    # Wait again after opening turbo gate for chamber pressure to reach medium vacuum
-    if not wait_for_analog_condition(
-        arduino=arduino,
-        safety=safety,
-        condition_fn=lambda v: len(v) > 1 and float(v[1]) < chamber_medium_vacuum,
-        max_wait_time=chamber_wait_time,
-        poll_interval=1.0
-    ):
-        print("⏰ Timeout waiting for chamber pressure to drop again")
+    Returns:
+        True when braking is done, False on failure or cancellation.
+    """
+    relay = relay_map.get('btnValveVent')
+    if relay is None:
+        progress.info("❌ Error: btnValveVent not found in relay_map")
         return False
-    
-    time.sleep(10)  # brief pause before next step
-
-    # Step 10: Turn on turbo pump
-    print("🌀 Step 10: Turning on turbo pump")
-    # Check safety
-    safety_result = safety.check_button_safety('btnPumpTurbo', is_auto_procedure=True)
+    # The train only opens the vent valve; check once that opening it is allowed
+    safety_result = safety.check_button_safety('btnValveVent', is_auto_procedure=True)
     if not safety_result.allowed:
-        print(f"⚠️ Safety check failed for btnPumpTurbo: {safety_result.message}")
+        progress.info("⚠️ Safety check failed for btnValveVent: %s", safety_result.message)
+        progress.info("Failed to open vent valve for braking")
         return False
 
-    if not set_relay_safe('btnPumpTurbo', True, arduino, safety, relay_map):
-        print("❌ Failed to turn on turbo pump")
-        return False
-
-    print("✅ Turbo pump turned on")
-
-    # Step 11: Wait for turbo pump > 80 % spin speed
-    print("🌀 Step 11: Waiting for turbo pump to reach > 80% spin speed")
-
-    def turbo_spin_condition(v: List[float]) -> bool:
-        # v[3] expected to be turbo spin percentage (0-100) or scaled value
+    trains = ((VENT_BRAKE_SLOW_PULSES, VENT_BRAKE_SLOW_INTERVAL_MS),
+              (VENT_BRAKE_FAST_PULSES, VENT_BRAKE_FAST_INTERVAL_MS))
+    for train_index, (count, interval_ms) in enumerate(trains):
         try:
-            if len(v) <= 3:
-                return False
-            spin_val = float(v[3])
-            return spin_val >= 3.5 # 3.5 V is about 80% speed for a 4.5V max gauge
-        except Exception:
+            started = arduino.pulse_relay(relay, VENT_BRAKE_PULSE_MS, interval_ms, count)
+        except Exception as e:
+            progress.info("❌ Exception starting vent pulse train: %s", e)
+            started = False
+        if not started:
+            if train_index == 0:
+                progress.info("Firmware pulse train unavailable - timing vent pulses in software")
+                return _turbo_brake_vent_pulses_software(arduino, safety, relay_map)
+            progress.info("Failed to start vent pulse train")
             return False
 
-    if not wait_for_analog_condition(
-        arduino=arduino,
-        safety=safety,
-        condition_fn=turbo_spin_condition,
-        max_wait_time=300,
-        poll_interval=1.0
-    ):
-        print("Timeout waiting for turbo pump to reach spin speed")
-        return False
-    
-    # Step 12: Turn on Ion Gauge
-    print("Step 12: Turning on Ion Gauge")  
-    chamber_high_vacuum = safety_config.get('pressure_thresholds', {}).get('chamber_high_vacuum', 0.7)
-    if arduino.get_analog_voltages()[1] < chamber_high_vacuum:
-        # Check safety
-        safety_result = safety.check_button_safety('btnIonGauge', is_auto_procedure=True)
-        if not safety_result.allowed:
-            print(f"Safety check failed for btnIonGauge: {safety_result.message}")
+        progress.info("Vent braking: %d x %d ms pulses, %g s apart (firmware-timed)",
+                      count, VENT_BRAKE_PULSE_MS, interval_ms / 1000)
+        deadline = time.monotonic() + ((count - 1) * interval_ms + VENT_BRAKE_PULSE_MS) / 1000.0
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                if wait_cancelled(min(1.0, remaining)):
+                    progress.info("🛑 Short vent cycles cancelled by user")
+                    return False
+                # A GUI-poll frame from the last second will do
+                volts = get_voltages_cached(arduino, max_age=1.0, safety=safety)
+                if volts and volts[3] < VENT_BRAKE_DONE_VOLTS:
+                    progress.info("Turbo spin < 25%, ready for constant vent.")
+                    return True
+        finally:
+            # Always stop the train: the firmware keeps pulsing the vent valve on
+            # its own if we leave early, and rejects the next PULSE_RELAY until
+            # the previous train is cleared. Harmless once the train has finished.
+            try:
+                arduino.abort_pulse()
+            except Exception as e:
+                progress.info("❌ Exception stopping vent pulse train: %s", e)
+    return True
+
+def _turbo_brake_vent_pulses_software(arduino: ArduinoController,
+                                      safety: SafetyController,
+                                      relay_map: Dict[str, int]) -> bool:
+    """Python-timed version of _turbo_brake_vent_pulses for older firmware."""
+    total_pulses = VENT_BRAKE_SLOW_PULSES + VENT_BRAKE_FAST_PULSES
+    pulse_s = VENT_BRAKE_PULSE_MS / 1000.0
+    for cycle in range(total_pulses):
+        # Check for cancellation before each cycle
+        if is_procedure_cancelled():
+            progress.info("🛑 Short vent cycles cancelled by user")
+            return False
+            
+        progress.info("Short vent cycle %d/%d: opening vent for %d ms",
+                      cycle + 1, total_pulses, VENT_BRAKE_PULSE_MS)
+        if not set_relay_safe('btnValveVent', True, arduino, safety, relay_map):
+            progress.info("Failed to open vent valve for braking")
             return False
-        # Use the dedicated toggle function
-        if not toggle_ion_gauge(True, arduino, safety, relay_map):
-            print("Failed to turn on Ion Gauge")
+        time.sleep(pulse_s)
+        if not set_relay_safe('btnValveVent', False, arduino, safety, relay_map):
+            progress.info("Failed to close vent valve after braking pulse")
             return False
-    
-    print("✅ Pump procedure completed successfully!")
+        # sleep until next 10s interval
+        if cycle < VENT_BRAKE_SLOW_PULSES - 1:
+            # Wakes immediately if cancelled during the sleep
+            if wait_cancelled(VENT_BRAKE_SLOW_INTERVAL_MS / 1000.0 - pulse_s):
+                progress.info("🛑 Short vent cycles cancelled during sleep")
+                return False
+        #break if turbo spin < 25 % to save time (a GUI-poll frame from this cycle will do)
+        volts = get_voltages_cached(arduino, max_age=1.0, safety=safety)
+        if volts and volts[3] < VENT_BRAKE_DONE_VOLTS:
+            progress.info("Turbo spin < 25%, ready for constant vent.")
+            break
     return True
 
+# Seconds allowed for the turbo gate and backing valves to close before venting
+VALVE_CLOSE_SETTLE_TIME = 5.0
 
-# Placeholder for other procedures
 def vent_procedure(arduino: ArduinoController, 
                    safety: SafetyController, 
                    relay_map: Dict[str, int],
@@ -744,189 +1381,159 @@ def vent_procedure(arduino: ArduinoController,
 
     Returns True on success, False on failure.
     """
-    print("💨 Starting vent procedure...")
+    progress.info("💨 Starting vent procedure...")
 
     # Reset cancellation flag at start of procedure
     reset_cancellation_flag()
 
-    # Get pressure thresholds from safety config
-    safety_config = safety.safety_config
+    # Resolve thresholds once, outside the polling loops
+    pressure_thresholds = safety.safety_config.get('pressure_thresholds', {})
+    chamber_atmospheric = float(pressure_thresholds.get('chamber_atmospheric', 4.5))
 
     if go_default_first:
         # Ensure system is in the default starting configuration before venting
         try:
             if not go_to_default_state(arduino, safety, relay_map):
-                print("Failed to return to default state before vent procedure")
+                progress.info("Failed to return to default state before vent procedure")
                 return False
         except Exception as e:
-            print(f"Exception while returning to default state: {e}")
+            progress.info("Exception while returning to default state: %s", e)
             return False
 
     try:
         # Step 0: Turn off Ion Gauge if on
-        print("Step 0: Turning OFF Ion Gauge if it is ON")
+        progress.info("Step 0: Turning OFF Ion Gauge if it is ON")
         if not toggle_ion_gauge(False, arduino, safety, relay_map):
-            print("Failed to turn off Ion Gauge")
+            progress.info("Failed to turn off Ion Gauge")
             return False
         
         # Step 1: Turn OFF turbo
-        print("Step 1: Turning OFF turbo pump")
+        progress.info("Step 1: Turning OFF turbo pump")
         # If turbo already off, skip below step
         if not safety.relay_states.get('btnPumpTurbo', False):
-            print("Turbo pump is already OFF")
+            progress.info("Turbo pump is already OFF")
         else:
             if not set_relay_safe('btnPumpTurbo', False, arduino, safety, relay_map):
-                print("Failed to turn off turbo pump")
+                progress.info("Failed to turn off turbo pump")
                 return False
 
         # Step 2: Wait for turbo spin < 65% (3.05 V)
-        print("Step 2: Waiting for turbo spin < 65% (3.05 V)")
-        def spin_below_65(v: List[float]) -> bool:
-            try:
-                return len(v) > 3 and float(v[3]) <= 3.05
-            except Exception:
-                return False
+        progress.info("Step 2: Waiting for turbo spin < 65% (3.05 V)")
+        spin_below_65 = _threshold_predicate(3, operator.le, 3.05)
 
         if not wait_for_analog_condition(arduino=arduino, safety=safety, condition_fn=spin_below_65, max_wait_time=300, poll_interval=1.0):
-            print("Timeout waiting for turbo spin < 65%")
+            progress.info("Timeout waiting for turbo spin < 65%")
             return False
 
         # Step 3: Short vent cycles for turbo braking
-        
-        print("Step 3: Performing turbo braking vent cycles")
-        for cycle in range(20):
-            # Check for cancellation before each cycle
-            if is_procedure_cancelled():
-                print("🛑 Short vent cycles cancelled by user")
-                return False
-                
-            print(f"Short vent cycle {cycle+1}/20: opening vent for 150 ms")
-            if not set_relay_safe('btnValveVent', True, arduino, safety, relay_map):
-                print("Failed to open vent valve for braking")
-                return False
-            time.sleep(0.15)
-            if not set_relay_safe('btnValveVent', False, arduino, safety, relay_map):
-                print("Failed to close vent valve after braking pulse")
+        # Skipped when the turbo is already slow, e.g. re-running a cancelled vent
+        volts = get_voltages_cached(arduino, max_age=1.0, safety=safety)
+        if volts and len(volts) > 3 and volts[3] < VENT_BRAKE_DONE_VOLTS:
+            progress.info("Step 3: Turbo already spun down, skipping braking vent cycles")
+        else:
+            progress.info("Step 3: Performing turbo braking vent cycles")
+            if not _turbo_brake_vent_pulses(arduino, safety, relay_map):
                 return False
-            # sleep until next 10s interval
-            if cycle < 7:
-                # Check cancellation during the 10s sleep too (split into 1s intervals)
-                for _ in range(int(10.0 - 0.15)):
-                    if is_procedure_cancelled():
-                        print("🛑 Short vent cycles cancelled during sleep")
-                        return False
-                    time.sleep(1.0)
-            #break if turbo spin < 25 % to save time
-            volts = arduino.get_analog_voltages()
-            if volts and float(volts[3]) < 1.3:
-                print("Turbo spin < 25%, ready for constant vent.")
-                break
 
         # Step 4: Wait for turbo spin < 20% (1.3 V)
-        print("Step 4: Waiting for turbo spin < 20% (1.3 V)")
-        def spin_below_20(v: List[float]) -> bool:
-            try:
-                return len(v) > 3 and float(v[3]) <= 1.3
-            except Exception:
-                return False
+        progress.info("Step 4: Waiting for turbo spin < 20% (1.3 V)")
+        spin_below_20 = _threshold_predicate(3, operator.le, 1.3)
 
         if not wait_for_analog_condition(arduino=arduino, safety=safety, condition_fn=spin_below_20, max_wait_time=300, poll_interval=1.0):
-            print("Timeout waiting for turbo spin < 20%")
+            progress.info("Timeout waiting for turbo spin < 20%")
             return False
 
         # Step 4.5: Close turbo gate valve and then backing valve for safety
-        print("Step 4.5: Closing turbo gate valve and backing valve.")
-        if not set_relay_safe('btnValveTurboGate', False, arduino, safety, relay_map):
-            print("Failed to close turbo gate valve")
+        progress.info("Step 4.5: Closing turbo gate valve and backing valve.")
+        if not set_relays_safe_batch([('btnValveTurboGate', False), ('btnValveBacking', False)],
+                                     arduino, safety, relay_map):
+            progress.info("Failed to close turbo gate valve and backing valve")
             return False
-        if not set_relay_safe('btnValveBacking', False, arduino, safety, relay_map):
-            print("Failed to close backing valve")
+        # Brief pause to ensure valves closed. There is no valve position feedback
+        # on the digital inputs, so this stays time-based but can be cancelled.
+        if wait_cancelled(VALVE_CLOSE_SETTLE_TIME):
+            progress.info("🛑 Vent procedure cancelled while valves were closing")
             return False
-        time.sleep(5.0)  # brief pause to ensure valves closed
         
         # Step 5: Open vent valve
-        print("Step 5: Opening vent valve")
+        progress.info("Step 5: Opening vent valve")
         if not set_relay_safe('btnValveVent', True, arduino, safety, relay_map):
-            print("Failed to open vent valve")
+            progress.info("Failed to open vent valve")
             return False
 
-        # Step 6: Wait for chamber pressure > chamber_atmospheric threshold and then digital input 2 -> False
-        chamber_atmospheric = safety_config.get('pressure_thresholds', {}).get('chamber_atmospheric', 4.5)
-        print(f"💨 Step 6: Waiting for chamber pressure > {chamber_atmospheric} V (atmosphere) and door open signal")
-
-        # First wait for chamber pressure to indicate atmosphere
-        def chamber_atm(v: List[float]) -> bool:
-            try:
-                is_atm = len(v) > 1 and float(v[1]) > chamber_atmospheric
-                if is_atm:
-                    print(f"🎯 Chamber pressure reached atmosphere: {float(v[1]):.2f} V")
-                return is_atm
-            except Exception:
-                return False
-
-        if not wait_for_analog_condition(arduino=arduino, safety=safety, condition_fn=chamber_atm, max_wait_time=3600, poll_interval=2.0):
-            print("⏱️ Timeout waiting for chamber to reach atmosphere")
-            # Ensure vent valve closed before returning
-            set_relay_safe('btnValveVent', False, arduino, safety, relay_map)
-            return False
+        # Step 6: Wait for chamber pressure > chamber_atmospheric threshold and digital input 2 -> False.
+        # Both are watched from one poll loop, so whichever comes first is latched and
+        # the step ends as soon as both hold.
+        progress.info("💨 Step 6: Waiting for chamber pressure > %s V (atmosphere) and door open signal", chamber_atmospheric)
 
-        # Now poll the door interlock until it indicates "opened".
-        # Prefer using safety.digital_inputs (normalized booleans). Fall back to reading
-        # raw arduino.get_digital_inputs() and normalize to bools.
-        print("🚪 Chamber at atmosphere, now waiting for door-open digital input to indicate open")
-        wait_start = time.time()
-        max_wait = 600  # seconds
-        door_opened = False
-        # Door input: digital_inputs[2] = Door interlock (Arduino pin 49)
-        # Per sput.yml and safety_conditions.yml: [0]=Water, [1]=Rod, [2]=Door, [3]=Spare
+        # Door input: digital_inputs[2] = Door interlock (Arduino pin 49), tested as a bit
+        # of safety.digital_inputs_bits (kept in step with safety.digital_inputs by the
+        # GUI input poll). Per sput.yml and safety_conditions.yml: [0]=Water, [1]=Rod,
+        # [2]=Door, [3]=Spare
         door_idx = 2
-        while time.time() - wait_start < max_wait:
-            di_list = None
-            try:
-                # Use safety.digital_inputs if available (already normalized to bool)
-                if hasattr(safety, 'digital_inputs') and safety.digital_inputs is not None:
-                    di_list = list(safety.digital_inputs)
-                else:
-                    # Fall back to reading from Arduino directly
-                    raw_di = arduino.get_digital_inputs()
-                    if raw_di is not None:
-                        di_list = [bool(x) for x in raw_di]
-            except Exception:
-                di_list = None
-
-            if di_list is None:
-                time.sleep(1.0)
-                continue
+        door_mask = 1 << door_idx
+        atm_deadline = time.monotonic() + 3600  # seconds to reach atmosphere
+        door_deadline = None                     # 600 s door wait, started at atmosphere
+        atm_reached = False
+        door_opened = False
+        while True:
+            now = time.monotonic()
+            if not atm_reached:
+                if now >= atm_deadline:
+                    break
+                volts = get_voltages_cached(arduino, max_age=1.0, safety=safety)
+                if volts is not None:
+                    try:
+                        safety.update_system_state(analog_inputs=volts)
+                    except Exception:
+                        pass
+                    if len(volts) > 1 and volts[1] > chamber_atmospheric:
+                        atm_reached = True
+                        door_deadline = now + 600
+                        progress.info("🎯 Chamber pressure reached atmosphere: %.2f V", volts[1])
+            elif now >= door_deadline:
+                break
 
-            # If the door input exists and reports False (unsafe/open), treat as door opened
-            if len(di_list) > door_idx and (not bool(di_list[door_idx])):
+            # A cleared door bit (unsafe/open) means the door has been opened
+            if not door_opened and not safety.digital_inputs_bits & door_mask:
                 door_opened = True
-                print(f"🚪 Door opened detected via digital_input[{door_idx}] = {di_list[door_idx]}")
+                progress.info("🚪 Door opened detected via digital_input[%s] = False", door_idx)
+            if atm_reached and door_opened:
                 break
-            else:
+            if atm_reached:
                 # Debug: show current door state while waiting
-                if len(di_list) > door_idx:
-                    print(f"⏳ Waiting for door... digital_input[{door_idx}] = {di_list[door_idx]} (need False for door open)")
+                progress.info("⏳ Waiting for door... digital_input[%d] = True (need False for door open)",
+                              door_idx)
 
-            time.sleep(1.0)
+            if wait_cancelled(1.0):
+                progress.info("🛑 Vent step 6 cancelled by user")
+                break
+
+        if not atm_reached:
+            if not is_procedure_cancelled():
+                progress.info("⏱️ Timeout waiting for chamber to reach atmosphere")
+            # Ensure vent valve closed before returning
+            set_relay_safe('btnValveVent', False, arduino, safety, relay_map)
+            return False
 
         # Close vent valve regardless; ensure we always attempt to close it.
         try:
-            print("🔀 Closing vent valve after venting complete")
+            progress.info("🔀 Closing vent valve after venting complete")
             if not set_relay_safe('btnValveVent', False, arduino, safety, relay_map):
-                print("❌ Failed to close vent valve")
+                progress.info("❌ Failed to close vent valve")
         except Exception:
-            print("⚠️ Warning: exception while attempting to close vent valve after venting")
+            progress.info("⚠️ Warning: exception while attempting to close vent valve after venting")
 
         if not door_opened:
-            print("⏱️ Timeout waiting for door open signal after atmosphere reached")
+            if not is_procedure_cancelled():
+                progress.info("⏱️ Timeout waiting for door open signal after atmosphere reached")
             return False
 
-        print("✅ Vent procedure completed successfully")
+        progress.info("✅ Vent procedure completed successfully")
         return True
 
     except Exception as e:
-        print(f"Exception in vent_procedure: {e}")
+        progress.info("Exception in vent_procedure: %s", e)
         try:
             set_relay_safe('btnValveVent', False, arduino, safety, relay_map)
         except Exception:
@@ -941,7 +1548,7 @@ def vent_loadlock_procedure(arduino: ArduinoController,
     Automated vent load-lock procedure.
     """
 
-    print("💨 Starting vent load-lock procedure...")
+    progress.info("💨 Starting vent load-lock procedure...")
     
     # Reset cancellation flag at start of procedure
     reset_cancellation_flag()
@@ -950,57 +1557,61 @@ def vent_loadlock_procedure(arduino: ArduinoController,
         # Ensure system is in the default starting configuration before venting
         try:
             if not go_to_default_state(arduino, safety, relay_map):
-                print("Failed to return to default state before vent load-lock procedure")
+                progress.info("Failed to return to default state before vent load-lock procedure")
                 return False
         except Exception as e:
-            print(f"❌ Error while returning to default state: {e}")
+            progress.info("❌ Error while returning to default state: %s", e)
             return False
     else:
         if not turbo_protection_procedure(safety, arduino, relay_map):
-            print("Failed to perform turbo protection procedure before venting load-lock, aborting...")
+            progress.info("Failed to perform turbo protection procedure before venting load-lock, aborting...")
             return False
 
     # Open load-lock vent valve
-    print("Opening load-lock vent valve")     
+    progress.info("Opening load-lock vent valve")     
     safety_result = safety.check_button_safety('btnValveLoadLockVent', is_auto_procedure=True)
     if not safety_result.allowed:
-        print(f"Safety check failed for btnValveLoadLockVent: {safety_result.message}")
+        progress.info("Safety check failed for btnValveLoadLockVent: %s", safety_result.message)
         return False
     if not set_relay_safe('btnValveLoadLockVent', True, arduino, safety, relay_map):
-        print("Failed to open load-lock vent valve")
+        progress.info("Failed to open load-lock vent valve")
         return False
 
     # Wait for load-lock pressure to indicate atmosphere (ai_volts[0] > 2.7 V)
-    print("Waiting for load-lock pressure to reach atmosphere (> 2.7 V)")
-    def loadlock_atm(v: List[float]) -> bool:
-        try:
-            return len(v) > 0 and float(v[0]) > 2.7
-        except Exception:
-            return False
+    progress.info("Waiting for load-lock pressure to reach atmosphere (> 2.7 V)")
+    loadlock_atm = _threshold_predicate(0, operator.gt, 2.7)
     
     if not wait_for_analog_condition(arduino=arduino, safety=safety, condition_fn=loadlock_atm, max_wait_time=20, poll_interval=1.0):
-        print("Timeout waiting for load-lock to reach atmosphere (20s timeout)")
+        progress.info("Timeout waiting for load-lock to reach atmosphere (20s timeout)")
         # Ensure vent valve closed before returning
         set_relay_safe('btnValveLoadLockVent', False, arduino, safety, relay_map)
-        print("Load-lock vent valve closed due to timeout - load-lock should be at atmosphere")
-        print("Load-lock vent procedure completed (with timeout)")
+        progress.info("Load-lock vent valve closed due to timeout - load-lock should be at atmosphere")
+        progress.info("Load-lock vent procedure completed (with timeout)")
         return True  # Return True since load-lock should be vented even if gauge didn't reach exact threshold
-    print("Load-lock has reached atmosphere")
+    progress.info("Load-lock has reached atmosphere")
     time.sleep(3.0)  # brief pause to ensure pressure stabilized
 
     # Close load-lock vent valve
-    print("Closing load-lock vent valve")
+    progress.info("Closing load-lock vent valve")
     set_relay_safe('btnValveLoadLockVent', False, arduino, safety, relay_map)   
-    print("Load-lock vent procedure completed successfully, load-lock is at atmosphere, proceed to load sample/s on stage.\n\
+    progress.info("Load-lock vent procedure completed successfully, load-lock is at atmosphere, proceed to load sample/s on stage.\n\
           Replace sample stage on load-lock arm once samples are in place. Then run load/unload procedure to pump down load-lock\n\
           and enable loading/unloading samples.")
-    # print("Load-lock vent procedure completed successfully, load-lock is at atmosphere, putting system back to default state.")
+    # progress.info("Load-lock vent procedure completed successfully, load-lock is at atmosphere, putting system back to default state.")
     # if not go_to_default_state(arduino, safety, relay_map):
-    #     print("Warning: Failed to return to default state after venting load-lock")
+    #     progress.info("Warning: Failed to return to default state after venting load-lock")
     #     return False
 
     return True
 
+# Relay states required before the load-lock rough valve opens for pumpdown:
+# scroll pump running, chamber rough and load-lock vent valves closed.
+LOADLOCK_PUMPDOWN_PREP_STATES = (
+    ('btnPumpScroll', True),
+    ('btnValveRough', False),
+    ('btnValveLoadLockVent', False),
+)
+
 def load_unload_procedure(arduino: ArduinoController, 
                           safety: SafetyController, 
                             relay_map: Dict[str, int]) -> bool:
@@ -1017,72 +1628,66 @@ def load_unload_procedure(arduino: ArduinoController,
         up new dialog saying "Load-lock arm is not in home position, please return it to home and then click button below."
         e) Close load-lock gate valve only if load-lock arm is in home position as confirmed by digital_inputs[1] going from False to True.
        """
-    print("🔄 Starting load/unload procedure...")
+    progress.info("🔄 Starting load/unload procedure...")
     
     # Reset cancellation flag at start of procedure
     reset_cancellation_flag()
     
     # Step 1: Turbo protection procedure
     if not turbo_protection_procedure(safety, arduino, relay_map):
-        print("Failed to perform turbo protection procedure before load/unload, aborting...")
+        progress.info("Failed to perform turbo protection procedure before load/unload, aborting...")
         return False
 
     # Step 2: Check load-lock vacuum state, pumpdown if needed
-    print("Step 2: Checking load-lock vacuum state...")
+    progress.info("Step 2: Checking load-lock vacuum state...")
     
     # Get pressure thresholds from safety config
-    safety_config = safety.safety_config
-    loadlock_rough_vacuum = safety_config.get('pressure_thresholds', {}).get('loadlock_rough_vacuum', 1.6)
-    chamber_medium_vacuum = safety_config.get('pressure_thresholds', {}).get('chamber_medium_vacuum', 2.0)
+    pressure_thresholds = safety.safety_config.get('pressure_thresholds', {})
+    loadlock_rough_vacuum = float(pressure_thresholds.get('loadlock_rough_vacuum', 1.6))
+    chamber_medium_vacuum = float(pressure_thresholds.get('chamber_medium_vacuum', 2.0))
     
     # Check current load-lock pressure
     try:
         voltages = arduino.get_analog_voltages()
         if voltages is None or len(voltages) < 1:
-            print("Failed to read analog voltages")
+            progress.info("Failed to read analog voltages")
             return False
             
-        loadlock_pressure = float(voltages[0])  # ai_volts[0] is load-lock pressure
-        chamber_pressure = float(voltages[1])   # ai_volts[1] is chamber pressure
+        loadlock_pressure = voltages[0]  # ai_volts[0] is load-lock pressure
+        chamber_pressure = voltages[1]   # ai_volts[1] is chamber pressure
         
-        print(f"Load-lock pressure: {loadlock_pressure:.3f} V, Chamber pressure: {chamber_pressure:.3f} V")
+        progress.info("Load-lock pressure: %.3f V, Chamber pressure: %.3f V", loadlock_pressure, chamber_pressure)
 
         if chamber_pressure > chamber_medium_vacuum:
-            print(f"Abort: Chamber pressure too high for load/unload: {chamber_pressure:.3f} V >= {chamber_medium_vacuum} V, pump chamber first.")
+            progress.info("Abort: Chamber pressure too high for load/unload: %.3f V >= %s V, pump chamber first.", chamber_pressure, chamber_medium_vacuum)
             return False
         
     except Exception as e:
-        print(f"❌ Error reading pressures: {e}")
+        progress.info("❌ Error reading pressures: %s", e)
         return False
     
     # If load-lock pressure is too high, pump it down
     if loadlock_pressure >= loadlock_rough_vacuum:
-        print("Load-lock pressure too high, pumping down...")
+        progress.info("Load-lock pressure too high, pumping down...")
         
         # Ensure scroll pump is ON & chamber rough valve is closed and load-lock vent valve is closed
-        print("Ensuring scroll pump is ON and relevant valves are closed...")
-        system = safety.get_safety_status_summary()
-        for relay in ['btnPumpScroll', 'btnValveRough', 'btnValveLoadLockVent']:
-            desired_state = True if relay == 'btnPumpScroll' else False
-            current_state = system['relay_states'].get(relay, None)
-            if current_state != desired_state:
-                if not set_relay_safe(relay, desired_state, arduino, safety, relay_map):
-                    print(f"Failed to set {relay} to {'ON' if desired_state else 'OFF'}")
-                    return False
-        print("Relevant relays are in correct state.")
+        progress.info("Ensuring scroll pump is ON and relevant valves are closed...")
+        states = safety.relay_states
+        pending = [(name, desired) for name, desired in LOADLOCK_PUMPDOWN_PREP_STATES
+                   if states.get(name, False) != desired]
+        if pending and not set_relays_safe_batch(pending, arduino, safety, relay_map):
+            progress.info("Failed to turn on scroll pump and close rough / load-lock vent valves")
+            return False
+        progress.info("Relevant relays are in correct state.")
 
         # Open load-lock rough valve to pump down
         if not set_relay_safe('btnValveLoadLockRough', True, arduino, safety, relay_map):
-            print("Failed to open load-lock rough valve")
+            progress.info("Failed to open load-lock rough valve")
             return False
             
         # Wait for load-lock to reach rough vacuum
-        print(f"Waiting for load-lock pressure to drop below {loadlock_rough_vacuum} V...")
-        def loadlock_rough(v: List[float]) -> bool:
-            try:
-                return len(v) > 0 and float(v[0]) < loadlock_rough_vacuum
-            except Exception:
-                return False
+        progress.info("Waiting for load-lock pressure to drop below %s V...", loadlock_rough_vacuum)
+        loadlock_rough = _threshold_predicate(0, operator.lt, loadlock_rough_vacuum)
         
         if not wait_for_analog_condition(
             arduino=arduino,
@@ -1091,66 +1696,57 @@ def load_unload_procedure(arduino: ArduinoController,
             max_wait_time=300,
             poll_interval=1.0
         ):
-            print("Timeout waiting for load-lock to reach rough vacuum")
+            progress.info("Timeout waiting for load-lock to reach rough vacuum")
             # Close rough valve and abort
             set_relay_safe('btnValveLoadLockRough', False, arduino, safety, relay_map)
             return False
+
+        # The waiter stored the frame that satisfied loadlock_rough in the safety
+        # controller; use it rather than issuing another serial read
+        loadlock_pressure, chamber_pressure = safety.analog_inputs[0], safety.analog_inputs[1]
             
         # Close load-lock rough valve
-        print("Load-lock pumped down, closing rough valve")
+        progress.info("Load-lock pumped down, closing rough valve")
         if not set_relay_safe('btnValveLoadLockRough', False, arduino, safety, relay_map):
-            print("Warning: Failed to close load-lock rough valve")
-    
-    # Step 3: Check if conditions are met to open gate valve
-    print("Step 3: Checking conditions for gate valve opening...")
+            progress.info("Warning: Failed to close load-lock rough valve")
     
-    # Re-read pressures after potential pumpdown
-    try:
-        voltages = arduino.get_analog_voltages()
-        if voltages is None or len(voltages) < 2:
-            print("Failed to read analog voltages")
-            return False
-            
-        loadlock_pressure = float(voltages[0])
-        chamber_pressure = float(voltages[1])
-        
-    except Exception as e:
-        print(f"❌ Error reading pressures: {e}")
-        return False
+    # Step 3: Check if conditions are met to open gate valve. The pressures come from
+    # the Step 2 reading, or from the pumpdown wait's last frame if one was needed.
+    progress.info("Step 3: Checking conditions for gate valve opening...")
     
     # Check if both chambers have sufficient vacuum
     if loadlock_pressure >= loadlock_rough_vacuum:
-        print(f"Load-lock pressure still too high: {loadlock_pressure:.3f} V >= {loadlock_rough_vacuum} V")
+        progress.info("Load-lock pressure still too high: %.3f V >= %s V", loadlock_pressure, loadlock_rough_vacuum)
         return False
         
     if chamber_pressure >= chamber_medium_vacuum:
-        print(f"Chamber pressure too high: {chamber_pressure:.3f} V >= {chamber_medium_vacuum} V")
+        progress.info("Chamber pressure too high: %.3f V >= %s V", chamber_pressure, chamber_medium_vacuum)
         return False
     
-    print("Pressure conditions met for gate valve opening")
+    progress.info("Pressure conditions met for gate valve opening")
     
     # Step 3a: Open load-lock gate valve
-    print("Step 3a: Opening load-lock gate valve...")
+    progress.info("Step 3a: Opening load-lock gate valve...")
     if not set_relay_safe('btnValveLoadLockGate', True, arduino, safety, relay_map):
-        print("Failed to open load-lock gate valve")
+        progress.info("Failed to open load-lock gate valve")
         return False
     
-    print("Load-lock gate valve opened - load/unload access available")
+    progress.info("Load-lock gate valve opened - load/unload access available")
     
     # Turn on chamber light for visibility during load/unload
-    print("💡 Turning on chamber light...")
+    progress.info("💡 Turning on chamber light...")
     if not set_relay_safe('btnLightBulb', True, arduino, safety, relay_map):
-        print("Warning: Failed to turn on chamber light (non-critical)")
+        progress.info("Warning: Failed to turn on chamber light (non-critical)")
     else:
-        print("✅ Chamber light turned on")
+        progress.info("✅ Chamber light turned on")
     
     # Steps 3b-3e: Handle load-lock arm and user interaction with real dialog
-    print("Step 3b-3e: Load/unload arm management...")
+    progress.info("Step 3b-3e: Load/unload arm management...")
     
     # NOTE: Dialog display causes Qt threading issues when called from background thread
     # Instead, we'll return a special status that tells the GUI to handle the dialog
-    print("Load-lock gate valve is open - procedure paused for user interaction")
-    print("IMPORTANT: User must return load-lock arm to home position before closing gate valve")
+    progress.info("Load-lock gate valve is open - procedure paused for user interaction")
+    progress.info("IMPORTANT: User must return load-lock arm to home position before closing gate valve")
     
     # Return a special value indicating that the gate valve is open and waiting for user
     # The GUI thread will handle the dialog and complete the procedure
@@ -1172,30 +1768,30 @@ def sputter_procedure(arduino: ArduinoController,
     Note: This procedure runs indefinitely until cancelled by clicking the sputter button again.
     When cancelled, the system will be returned to default state via abort_and_go_default.
     """
-    print("⚡ Starting sputter procedure...")
-    print("🌀 Turbo pump will maintain standby speed (60% spin)for sputtering operations")
-    print("💨 User can manually control gas valves. Set gas flow and open valve to bring in gas.")
-    print("🛑 Click the sputter button again to cancel this procedure and return to default state")
+    progress.info("⚡ Starting sputter procedure...")
+    progress.info("🌀 Turbo pump will maintain standby speed (60% spin)for sputtering operations")
+    progress.info("💨 User can manually control gas valves. Set gas flow and open valve to bring in gas.")
+    progress.info("🛑 Click the sputter button again to cancel this procedure and return to default state")
 
     # Reset cancellation flag at start of procedure
     reset_cancellation_flag()
     
     #Turn off ion gauge if it is on:
     if not toggle_ion_gauge(False, arduino, safety, relay_map):  # Ensure ion gauge is off
-        print("Failed to turn off ion gauge")
+        progress.info("Failed to turn off ion gauge")
         return False
     
     # Set sputter procedure active state to enable gas valve override
     safety.set_sputter_procedure_active(True)
-    print("🌟 Gas valves are now available for manual control during sputter procedure")
+    progress.info("🌟 Gas valves are now available for manual control during sputter procedure")
 
     # Turn ON mains power for RF/DC supplies (pin 22)
-    print("⚡ Turning ON mains power for sputtering supplies...")
+    progress.info("⚡ Turning ON mains power for sputtering supplies...")
     if not set_relay_safe('btnMainsPower', True, arduino, safety, relay_map):
-        print("❌ Failed to turn ON mains power - aborting sputter procedure")
+        progress.info("❌ Failed to turn ON mains power - aborting sputter procedure")
         safety.set_sputter_procedure_active(False)
         return False
-    print("✅ Mains power enabled - RF/DC supplies ready")
+    progress.info("✅ Mains power enabled - RF/DC supplies ready")
 
     try:
         # Run turbo standby spin control indefinitely until cancelled
@@ -1204,65 +1800,26 @@ def sputter_procedure(arduino: ArduinoController,
         
         # Check results after turbo standby control completes
         if is_procedure_cancelled():
-            print("🛑 Sputter procedure was cancelled")
+            progress.info("🛑 Sputter procedure was cancelled")
             # Don't return here - let finally block handle cleanup
         elif not result:
-            print("Failed to perform turbo standby spin control for sputter procedure")
+            progress.info("Failed to perform turbo standby spin control for sputter procedure")
             # Don't return here - let finally block handle cleanup
         else:
             # If we reach here, the turbo standby control completed normally
-            print("Sputter procedure completed")
+            progress.info("Sputter procedure completed")
         
     finally:
         # Always clean up when procedure ends (whether cancelled, failed, or completed)
-        print("🧹 Cleaning up sputter procedure...")
-        
-        # Turn OFF mains power first for safety
-        try:
-            print("⚡ Turning OFF mains power...")
-            
-            # Force update the relay state to ensure safety controller knows mains is currently ON
-            safety.relay_states['btnMainsPower'] = True
-            
-            # Try the safe method first
-            if not set_relay_safe('btnMainsPower', False, arduino, safety, relay_map):
-                print("⚠️ set_relay_safe failed for mains power - trying direct Arduino command...")
-                # Fallback: try direct Arduino command
-                try:
-                    mains_relay = relay_map.get('btnMainsPower')
-                    if mains_relay:
-                        arduino.set_relay(mains_relay, False)
-                        safety.relay_states['btnMainsPower'] = False  # Update state manually
-                        print("✅ Mains power turned off via direct Arduino command")
-                    else:
-                        print("❌ Cannot find mains power relay in relay_map")
-                except Exception as e2:
-                    print(f"❌ Direct mains power shutdown also failed: {e2}")
-            else:
-                print("✅ Mains power disabled - RF/DC supplies turned off")
-        except Exception as e:
-            print(f"❌ Warning: Failed to turn OFF mains power: {e}")
-            # Last resort: try direct relay command
-            try:
-                mains_relay = relay_map.get('btnMainsPower', 22)  # Default to pin 22
-                arduino.set_relay(mains_relay, False)
-                print("✅ Mains power turned off via emergency direct command")
-            except Exception as e3:
-                print(f"❌ Emergency mains power shutdown failed: {e3}")
-        
-        # Close all gas valves for safety
-        gas_valves = ['btnValveGas1', 'btnValveGas2', 'btnValveGas3']
-        for gas_valve in gas_valves:
-            try:
-                if safety.relay_states.get(gas_valve, False):  # Only close if currently open
-                    print(f"Closing {gas_valve} after sputter procedure")
-                    set_relay_safe(gas_valve, False, arduino, safety, relay_map)
-            except Exception as e:
-                print(f"Warning: Failed to close {gas_valve}: {e}")
+        progress.info("🧹 Cleaning up sputter procedure...")
         
+        # Turn OFF mains power and close any open gas valves in one frame
+        progress.info("⚡ Turning OFF mains power and closing gas valves...")
+        _sputter_shutdown(arduino, safety, relay_map)
+
         # Clear sputter procedure active state
         safety.set_sputter_procedure_active(False)
-        print("🌟 Gas valve override disabled - sputter procedure ended")
+        progress.info("🌟 Gas valve override disabled - sputter procedure ended")
     
     # Return success if cancelled or completed normally, failure if turbo control failed
     if is_procedure_cancelled():
@@ -1270,6 +1827,45 @@ def sputter_procedure(arduino: ArduinoController,
     else:
         return result  # Return the actual result from turbo standby control
 
+# Turbo standby control acts on the median of this many recent speed samples
+TURBO_STANDBY_SMOOTHING_SAMPLES = 5
+# Standby status line is printed once per this many seconds
+TURBO_STANDBY_LOG_INTERVAL = 30
+# A fault repeating on every tick is logged once, then summarized every N repeats
+TURBO_STANDBY_ERROR_SUMMARY_EVERY = 50
+# Oldest GUI-poll frame (seconds) the standby loop uses instead of its own read
+TURBO_STANDBY_FRAME_AGE = 1.0
+
+# Turbo spin gauge scaling (turbo_spin in safety_conditions.yml):
+# percentage = voltage * TURBO_SPIN_SCALE + TURBO_SPIN_OFFSET
+TURBO_SPIN_SCALE = 25.0
+TURBO_SPIN_OFFSET = -12.5
+
+def _turbo_volts_to_percent(volts: float) -> float:
+    return volts * TURBO_SPIN_SCALE + TURBO_SPIN_OFFSET
+
+def _turbo_percent_to_volts(percent: float) -> float:
+    return (percent - TURBO_SPIN_OFFSET) / TURBO_SPIN_SCALE
+
+def _standby_control_step(samples: Sequence[float], pump_state: bool,
+                          low: float, high: float) -> Tuple[bool, float]:
+    """One tick of the turbo standby hysteresis controller.
+
+    Pure function of the recent speed samples and the current pump state, so
+    the control law can be exercised without hardware.
+
+    Args:
+        samples: Recent turbo speed voltages (at least one)
+        pump_state: Whether the turbo pump is currently ON
+        low: An OFF pump is turned on below this voltage
+        high: An ON pump stays on until the speed reaches this voltage
+
+    Returns:
+        (should_pump_on, smoothed_voltage)
+    """
+    smoothed = median(samples)
+    return smoothed < (high if pump_state else low), smoothed
+
 def turbo_standby_spin_control(arduino: ArduinoController,
                               safety: SafetyController,
                               relay_map: Dict[str, int],
@@ -1293,95 +1889,134 @@ def turbo_standby_spin_control(arduino: ArduinoController,
     Returns:
         True if standby mode completed successfully, False on error
     """
-    print(f"Starting turbo pump standby spin control at {target_speed_percent}% target speed")
+    progress.info("Starting turbo pump standby spin control at %s%% target speed", target_speed_percent)
     
     # Convert target percentage to voltage using scaling factors from safety_conditions.yml
-    # turbo_spin scaling_factor: 25.0, offset: -12.5
-    # Formula: percentage = (voltage * scaling_factor) + offset
-    # Inverse: voltage = (percentage - offset) / scaling_factor
-    target_voltage = (target_speed_percent - (-12.5)) / 25.0
+    target_voltage = _turbo_percent_to_volts(target_speed_percent)
     
     # Control parameters
     tolerance = 0.1  # Voltage tolerance (±0.1V around target)
     hysteresis = 0.05  # Hysteresis to prevent rapid cycling
     
+    # Hysteresis band: an OFF pump restarts below `low`, an ON pump stops at `high`
+    low = target_voltage - hysteresis
+    high = target_voltage + hysteresis
+
     start_time = time.time()
     pump_state = False  # Track current pump state
+    # Recent turbo speed samples; the median rejects single noisy readings that
+    # would otherwise toggle the pump near the hysteresis edges
+    speed_samples = deque(maxlen=TURBO_STANDBY_SMOOTHING_SAMPLES)
+    last_log_bucket = -1
     
-    print(f"Target voltage: {target_voltage:.2f}V (±{tolerance:.2f}V tolerance)")
-    print(f"Will run for maximum {max_run_time} seconds")
+    progress.info("Target voltage: %.2fV (±%.2fV tolerance)", target_voltage, tolerance)
+    progress.info("Will run for maximum %s seconds", max_run_time)
     
     # Ensure turbo pump starts in OFF state
     if not set_relay_safe('btnPumpTurbo', False, arduino, safety, relay_map):
-        print("Failed to ensure turbo pump starts OFF")
+        progress.info("Failed to ensure turbo pump starts OFF")
         return False
     
-    while time.time() - start_time < max_run_time:
+    # Bind the per-iteration callables once, outside the control loop
+    now = time.time
+    monotonic = time.monotonic
+    cancelled = is_procedure_cancelled
+    # The GUI input poll reads the analog channels every 700 ms; reuse its frame
+    # and only query the Arduino when no recent frame has been published
+    read_voltages = partial(get_voltages_cached, arduino, TURBO_STANDBY_FRAME_AGE, safety)
+    update_state = safety.update_system_state
+
+    last_error: Optional[str] = None
+    error_repeats = 0
+    overruns = 0
+
+    def report_error(message: str) -> None:
+        # A persistent fault (e.g. Arduino unplugged) would otherwise log every tick
+        nonlocal last_error, error_repeats
+        if message != last_error:
+            progress.info(message)
+            last_error, error_repeats = message, 0
+            return
+        error_repeats += 1
+        if error_repeats % TURBO_STANDBY_ERROR_SUMMARY_EVERY == 0:
+            progress.info("%s (repeated %d times)", message, error_repeats)
+
+    next_tick = monotonic() + poll_interval
+    while True:
+        # Read the clock once per tick
+        elapsed = now() - start_time
+        if elapsed >= max_run_time:
+            break
+
         # Check for cancellation signal
-        if is_procedure_cancelled():
-            print("🛑 Turbo standby spin control cancelled by user")
+        if cancelled():
+            progress.info("🛑 Turbo standby spin control cancelled by user")
             break
             
         try:
             # Read current turbo speed voltage
-            voltages = arduino.get_analog_voltages()
+            voltages = read_voltages()
             if voltages is None or len(voltages) <= 3:
-                print("Failed to read turbo speed voltage")
-                time.sleep(poll_interval)
-                continue
-                
-            current_speed_voltage = float(voltages[3])  # ai_volts[3] is turbo speed
-            # Convert voltage to percentage using scaling factors from safety_conditions.yml
-            # turbo_spin scaling_factor: 25.0, offset: -12.5
-            current_speed_percent = (current_speed_voltage * 25.0) + (-12.5)
-            
-            # Determine if we need to turn pump on or off
-            should_pump_on = False
-            
-            if not pump_state:  # Pump is currently OFF
-                # Turn on if speed is below target minus hysteresis
-                if current_speed_voltage < (target_voltage - hysteresis):
-                    should_pump_on = True
-            else:  # Pump is currently ON
-                # Turn off if speed is above target plus hysteresis
-                if current_speed_voltage < (target_voltage + hysteresis):
-                    should_pump_on = True
+                report_error("Failed to read turbo speed voltage")
+            else:
+                last_error = None
+
+                speed_samples.append(voltages[3])  # ai_volts[3] is turbo speed
+                should_pump_on, current_speed_voltage = _standby_control_step(
+                    speed_samples, pump_state, low, high)
+                # Convert voltage to percentage using scaling factors from safety_conditions.yml
+                current_speed_percent = _turbo_volts_to_percent(current_speed_voltage)
             
-            # Update pump state if needed
-            if should_pump_on != pump_state:
-                action = "ON" if should_pump_on else "OFF"
-                #print(f"Speed: {current_speed_percent:.1f}% ({current_speed_voltage:.2f}V) - Turning pump {action}")
+                # Update pump state if needed
+                if should_pump_on != pump_state:
+                    action = "ON" if should_pump_on else "OFF"
+                    #progress.info(f"Speed: {current_speed_percent:.1f}% ({current_speed_voltage:.2f}V) - Turning pump {action}")
                 
-                if not set_relay_safe('btnPumpTurbo', should_pump_on, arduino, safety, relay_map, suppress_logging=True):
-                    print(f"Failed to turn turbo pump {action}")
-                    return False
+                    if not set_relay_safe('btnPumpTurbo', should_pump_on, arduino, safety, relay_map, suppress_logging=True):
+                        progress.info("Failed to turn turbo pump %s", action)
+                        return False
                     
-                pump_state = should_pump_on
-            else:
-                # Just log current status occasionally
-                if int(time.time() - start_time) % 30 == 0:  # Every 30 seconds
-                    status = "ON" if pump_state else "OFF"
-                    print(f"Standby mode: Speed {current_speed_percent:.1f}% (target {target_speed_percent:.1f}%), pump {status}")
+                    pump_state = should_pump_on
+                else:
+                    # Just log current status occasionally: once on entering each interval
+                    log_bucket = int(elapsed) // TURBO_STANDBY_LOG_INTERVAL
+                    if log_bucket != last_log_bucket:
+                        last_log_bucket = log_bucket
+                        status = "ON" if pump_state else "OFF"
+                        progress.info("Standby mode: Speed %.1f%% (target %.1f%%), pump %s",
+                                      current_speed_percent, target_speed_percent, status)
             
-            # Update safety controller with fresh readings
-            try:
-                safety.update_system_state(analog_inputs=voltages)
-            except Exception:
-                pass
-                
+                # Update safety controller with fresh readings
+                try:
+                    update_state(analog_inputs=voltages)
+                except Exception:
+                    pass
+
         except Exception as e:
-            print(f"❌ Error in standby spin control: {e}")
-            time.sleep(poll_interval)
-            continue
-            
-        time.sleep(poll_interval)
+            report_error(f"❌ Error in standby spin control: {e}")
+
+        # Sleep until the next tick of a fixed-period schedule, so the time spent
+        # reading and switching does not stretch the poll period
+        sleep_for = next_tick - monotonic()
+        if sleep_for < 0:
+            overruns += 1
+            if overruns == 1 or overruns % TURBO_STANDBY_ERROR_SUMMARY_EVERY == 0:
+                progress.info("⚠️ Standby control overran its %.1f s period (%d times)",
+                              poll_interval, overruns)
+            # Resynchronize rather than running back-to-back ticks to catch up
+            next_tick = monotonic()
+            sleep_for = 0.0
+        next_tick += poll_interval
+        if wait_cancelled(sleep_for):
+            progress.info("🛑 Turbo standby spin control cancelled by user")
+            break
     
-    print(f"Turbo standby spin control completed after {max_run_time} seconds")
+    progress.info("Turbo standby spin control completed after %s seconds", max_run_time)
     
     # Turn off turbo pump when done
-    print("Turning OFF turbo pump after standby mode")
+    progress.info("Turning OFF turbo pump after standby mode")
     if not set_relay_safe('btnPumpTurbo', False, arduino, safety, relay_map):
-        print("Warning: Failed to turn off turbo pump after standby mode")
+        progress.info("Warning: Failed to turn off turbo pump after standby mode")
         return False
         
     return True
@@ -1406,11 +2041,11 @@ def quick_reset_to_standby(arduino: ArduinoController,
     Returns:
         True if all relays were successfully set to OFF, False otherwise
     """
-    print("⚡ QUICK RESET TO STANDBY - Forcing all relays OFF immediately")
-    print("⚠️  WARNING: Bypassing normal safety checks and shutdown sequences")
+    progress.info("⚡ QUICK RESET TO STANDBY - Forcing all relays OFF immediately")
+    progress.info("⚠️  WARNING: Bypassing normal safety checks and shutdown sequences")
     
     if arduino is None or not arduino.is_connected:
-        print("❌ Error: Arduino not connected")
+        progress.info("❌ Error: Arduino not connected")
         return False
     
     # Cancel any running procedures
@@ -1421,7 +2056,7 @@ def quick_reset_to_standby(arduino: ArduinoController,
     failed_relays = []
     
     # Force all relays OFF, suppress logging to reduce console spam
-    print("🔌 Setting all relays to OFF state...")
+    progress.info("🔌 Setting all relays to OFF state...")
     for button_name, relay_num in relay_map.items():
         try:
             # Direct Arduino call bypassing safety checks
@@ -1434,18 +2069,18 @@ def quick_reset_to_standby(arduino: ArduinoController,
                 all_success = False
                 failed_relays.append(button_name)
         except Exception as e:
-            print(f"❌ Exception setting {button_name} OFF: {e}")
+            progress.info("❌ Exception setting %s OFF: %s", button_name, e)
             all_success = False
             failed_relays.append(button_name)
     
     if all_success:
-        print("✅ Quick reset completed - all relays set to OFF (standby state)")
+        progress.info("✅ Quick reset completed - all relays set to OFF (standby state)")
         # Update system status to standby
         if safety is not None:
             safety.system_status = 'standby'
         return True
     else:
-        print(f"⚠️  Quick reset completed with errors. Failed relays: {', '.join(failed_relays)}")
+        progress.info("⚠️  Quick reset completed with errors. Failed relays: %s", ', '.join(failed_relays))
         return False
 
 
@@ -1454,6 +2089,9 @@ def abort_and_go_default(arduino: ArduinoController,
                          relay_map: Dict[str, int]) -> tuple[bool, str]:
     """Abort current procedure by returning system to the configured default state.
 
+    If a sputter run is active, mains power and any open gas valves are
+    switched off first in a single RELAYS_ frame (see _sputter_shutdown).
+
     Returns:
         (success: bool, message: str)
     """
@@ -1461,62 +2099,20 @@ def abort_and_go_default(arduino: ArduinoController,
         # First, signal any running procedures to cancel
         cancel_running_procedures()
         
-        # Give running procedures a moment to notice the cancellation
-        time.sleep(0.5)
+        # Give running procedures a moment to notice the cancellation; returns
+        # as soon as one acknowledges it
+        _cancel_ack.wait(CANCEL_ACK_TIMEOUT)
         
         # Special handling for sputter procedure - close gas valves and clear state
         if safety.is_sputter_procedure_active():
-            print("🧹 Aborting sputter procedure - closing gas valves and turning off mains power...")
+            progress.info("🧹 Aborting sputter procedure - closing gas valves and turning off mains power...")
             
-            # Turn OFF mains power first for safety
-            try:
-                print("⚡ Shutdown: Turning OFF mains power...")
-                
-                # Force update the relay state to ensure safety controller knows mains is currently ON
-                safety.relay_states['btnMainsPower'] = True
-                
-                # Try the safe method first
-                if not set_relay_safe('btnMainsPower', False, arduino, safety, relay_map):
-                    print("⚠️ set_relay_safe failed for mains power during abort - trying direct Arduino command...")
-                    # Fallback: try direct Arduino command
-                    try:
-                        mains_relay = relay_map.get('btnMainsPower')
-                        if mains_relay:
-                            arduino.set_relay(mains_relay, False)
-                            safety.relay_states['btnMainsPower'] = False  # Update state manually
-                            print("✅ Mains power turned off via direct Arduino command during abort")
-                        else:
-                            print("❌ Cannot find mains power relay in relay_map during abort")
-                            raise Exception("Cannot find mains power relay in relay_map")
-                    except Exception as e2:
-                        print(f"❌ Direct mains power shutdown also failed during abort: {e2}")
-                        raise Exception(f"Direct mains power shutdown failed: {e2}")
-                else:
-                    print("✅ Mains power disabled - RF/DC supplies turned off")
-            except Exception as e:
-                print(f"❌ Warning: Failed to turn OFF mains power during abort: {e}")
-                # Last resort: try direct relay command
-                try:
-                    mains_relay = relay_map.get('btnMainsPower', 22)  # Default to pin 22
-                    arduino.set_relay(mains_relay, False)
-                    safety.relay_states['btnMainsPower'] = False
-                    print("✅ Mains power turned off via emergency direct command during abort")
-                except Exception as e3:
-                    print(f"❌ Emergency mains power shutdown failed during abort: {e3}")
-            
-            gas_valves = ['btnValveGas1', 'btnValveGas2', 'btnValveGas3']
-            for gas_valve in gas_valves:
-                try:
-                    if safety.relay_states.get(gas_valve, False):  # Only close if currently open
-                        print(f"Emergency closing {gas_valve}")
-                        set_relay_safe(gas_valve, False, arduino, safety, relay_map)
-                except Exception as e:
-                    print(f"Warning: Failed to emergency close {gas_valve}: {e}")
+            _sputter_shutdown(arduino, safety, relay_map)
             
             # Clear sputter procedure active state
 
             safety.set_sputter_procedure_active(False)
-            print("🌟 Gas valve override disabled due to procedure abort")
+            progress.info("🌟 Gas valve override disabled due to procedure abort")
         
         # Now proceed with going to default state
         ok = go_to_default_state(arduino, safety, relay_map)
@@ -1,41 +1,142 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import os
 import yaml
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
 
+# libyaml's C loader when PyYAML was built with it, else the pure-Python one
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
 
-@dataclass
+
+@dataclass(slots=True)
 class SerialConfig:
     baud: int = 9600
     preferred_ports: List[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     serial: SerialConfig
     relays: Dict[str, int]
     inputs_labels: List[str]
     analog_channels: List[Dict[str, float]]
     # Order of Arduino pins used by firmware for RELAY_1..N (1-based index)
-    relay_pins: List[int]
+    relay_pins: Tuple[int, ...]
     # Gas control configuration (optional)
     gas_control: Optional[Dict] = None
+    # Per-channel scale/offset from analog_channels, resolved to floats at load
+    analog_scales: Tuple[float, ...] = ()
+    analog_offsets: Tuple[float, ...] = ()
+    # Arduino pin -> 1-based RELAY_n index, built from relay_pins
+    pin_to_relay_index: Dict[int, int] = field(default_factory=dict)
 
 
 DEFAULT_CONFIG: AppConfig | None = None
 
+# Defaults for keys missing from sput.yml
+DEFAULT_INPUT_LABELS = ("Door", "Water", "Rod")
+DEFAULT_ANALOG_CHANNELS = tuple(
+    {"label": f"AI{i + 1}", "scale": 1.0, "offset": 0.0} for i in range(4)
+)
+# Default firmware mapping for Arduino Mega (matching relay_controller.ino and sput.yml)
+DEFAULT_RELAY_PINS = (
+    22,  # Mains power (relay 1) - CRITICAL SAFETY
+    23, 24, 25, 26, 36, 28, 29,
+    30, 31, 32, 33, 34, 35, 27, 37,
+    38, 39, 40, 41,
+    44,  # Scroll pump (relay 21)
+    46,  # Spare relay (relay 22)
+    48   # Spare relay (relay 23)
+)
+
+# Project root auto_control/sput.yml, used when load_config gets no path
+DEFAULT_CONFIG_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "sput.yml")
+
+# Parsed configs: absolute path -> ((mtime_ns, size), config). An edited file
+# no longer matches its stamp and is parsed again, replacing the old entry.
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], AppConfig]] = {}
+
+
+def clear_config_cache() -> None:
+    """Drop cached configs so the next load_config re-reads the file."""
+    _CONFIG_CACHE.clear()
+
+# Sidecar written next to the YAML file holding its parsed contents, so a fresh
+# process can skip the YAML parse while the source file is unchanged. It is
+# keyed on a hash of the file's bytes: mtimes are too coarse on some lab shares
+# (FAT/SMB) to catch a same-size edit, and hashing is cheap next to parsing.
+SIDECAR_SUFFIX = ".cache.json"
+
+
+def _read_sidecar(path: str, digest: str) -> Optional[dict]:
+    """Return the parsed YAML data cached for `path`, or None if stale or unreadable."""
+    try:
+        with open(path + SIDECAR_SUFFIX, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("sha256") == digest:
+            return cached["data"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+    return None
+
+
+def _write_sidecar(path: str, digest: str, data: dict) -> None:
+    """Cache parsed YAML data for `path`; best effort, failures are ignored."""
+    try:
+        # Only cache data that survives JSON unchanged (e.g. no non-string keys)
+        if json.loads(json.dumps(data)) != data:
+            return
+        with open(path + SIDECAR_SUFFIX, "w", encoding="utf-8") as f:
+            json.dump({"sha256": digest, "data": data}, f)
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def _normalize_analog_channel(index: int, channel: dict) -> dict:
+    """Return a copy of an analog channel entry with label, scale and offset coerced.
+
+    Raises:
+        ValueError: If the entry is not a mapping or scale/offset are not numeric.
+    """
+    if not isinstance(channel, dict):
+        raise ValueError(f"analog.channels[{index}] must be a mapping, got {channel!r}")
+    try:
+        scale = float(channel.get("scale", 1.0))
+        offset = float(channel.get("offset", 0.0))
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"analog.channels[{index}] has a non-numeric scale/offset: {e}") from e
+    return {**channel, "label": str(channel.get("label", f"AI{index + 1}")),
+            "scale": scale, "offset": offset}
+
 
 def load_config(path: Optional[str] = None) -> AppConfig:
     """Load YAML config (sput.yml)."""
-    if path is None:
-        # default to project root auto_control/sput.yml
-        here = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        path = os.path.join(here, "sput.yml")
+    path = DEFAULT_CONFIG_PATH if path is None else os.fspath(path)
 
-    with open(path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+    global DEFAULT_CONFIG
+    st = os.stat(path)
+    abs_path = os.path.abspath(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _CONFIG_CACHE.get(abs_path)
+    if cached is not None and cached[0] == stamp:
+        DEFAULT_CONFIG = cached[1]
+        return cached[1]
+
+    with open(path, "rb") as f:
+        raw = f.read()
+    digest = hashlib.sha256(raw).hexdigest()
+    data = _read_sidecar(path, digest)
+    if data is None:
+        # Bytes go straight to the YAML reader, which detects the encoding itself
+        data = yaml.load(raw, Loader=_SafeLoader) or {}
+        _write_sidecar(path, digest, data)
 
     serial = data.get("serial", {})
     serial_cfg = SerialConfig(
@@ -46,27 +147,15 @@ def load_config(path: Optional[str] = None) -> AppConfig:
     relays = {str(k): int(v) for k, v in (data.get("relays", {}) or {}).items()}
 
     inputs = data.get("inputs", {})
-    inputs_labels = list(inputs.get("digital_labels", ["Door", "Water", "Rod"]))
+    inputs_labels = list(inputs.get("digital_labels", DEFAULT_INPUT_LABELS))
 
     analog = data.get("analog", {})
-    analog_channels = list(analog.get("channels", [
-        {"label": "AI1", "scale": 1.0, "offset": 0.0},
-        {"label": "AI2", "scale": 1.0, "offset": 0.0},
-        {"label": "AI3", "scale": 1.0, "offset": 0.0},
-        {"label": "AI4", "scale": 1.0, "offset": 0.0},
-    ]))
-
-    # Default firmware mapping for Arduino Mega (matching relay_controller.ino and sput.yml)
-    default_relay_pins = [
-        22,  # Mains power (relay 1) - CRITICAL SAFETY
-        23, 24, 25, 26, 36, 28, 29,
-        30, 31, 32, 33, 34, 35, 27, 37,
-        38, 39, 40, 41,
-        44,  # Scroll pump (relay 21)
-        46,  # Spare relay (relay 22)
-        48   # Spare relay (relay 23)
-    ]
-    relay_pins = list(data.get("relay_pins", default_relay_pins))
+    channels = analog.get("channels")
+    if channels is None:
+        channels = DEFAULT_ANALOG_CHANNELS
+    analog_channels = [_normalize_analog_channel(i, channel) for i, channel in enumerate(channels)]
+
+    relay_pins = tuple(data.get("relay_pins", DEFAULT_RELAY_PINS))
 
     # Load gas control configuration if present
     gas_control = data.get("gas_control", None)
@@ -78,8 +167,11 @@ def load_config(path: Optional[str] = None) -> AppConfig:
         analog_channels=analog_channels,
         relay_pins=relay_pins,
         gas_control=gas_control,
+        analog_scales=tuple(c["scale"] for c in analog_channels),
+        analog_offsets=tuple(c["offset"] for c in analog_channels),
+        pin_to_relay_index={pin: idx + 1 for idx, pin in enumerate(relay_pins)},
     )
 
-    global DEFAULT_CONFIG
+    _CONFIG_CACHE[abs_path] = (stamp, cfg)
     DEFAULT_CONFIG = cfg
     return cfg
@@ -13,9 +13,7 @@ Functions:
     create_gas_controller: Factory function for controller creation
 """
 
-from .controller import GasFlowController, MFCChannel
-from .recipes import GasRecipe, RecipeManager
-from .safety_integration import GasFlowSafetyIntegration
+from importlib import import_module
 
 __version__ = "1.0.0"
 __all__ = [
@@ -27,6 +25,31 @@ __all__ = [
     "create_gas_controller"
 ]
 
+# Public name -> submodule defining it. Submodules are imported on first
+# attribute access (PEP 562), so importing the package (e.g. for
+# gas_control.subprocess_controller) does not pull in alicat.
+_LAZY_ATTRS = {
+    "GasFlowController": ".controller",
+    "MFCChannel": ".controller",
+    "GasRecipe": ".recipes",
+    "RecipeManager": ".recipes",
+    "GasFlowSafetyIntegration": ".safety_integration",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
+
 def create_gas_controller(config_dict: dict, safety_controller=None):
     """Factory function to create a GasFlowController instance.
     
@@ -37,4 +60,5 @@ def create_gas_controller(config_dict: dict, safety_controller=None):
     Returns:
         GasFlowController: Configured gas flow controller instance
     """
+    from .controller import GasFlowController
     return GasFlowController(config_dict, safety_controller)
\ No newline at end of file
@@ -10,15 +10,18 @@ from __future__ import annotations
 import asyncio
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from dataclasses import dataclass
+from operator import attrgetter
+from functools import partial
 from pathlib import Path
-from queue import Queue, Empty
 from typing import Dict, List, Optional, Tuple, Callable, Any
 import logging
 
 # Alicat driver import - adjust path as needed
 import sys
 sys.path.append(str(Path(__file__).resolve().parents[4] / 'alicat'))
+
 from alicat import FlowController
 
 # Support both package and script execution
@@ -31,7 +34,13 @@ except ImportError:
         SafetyController = None
 
 
-@dataclass
+# MFCReading fields in to_dict order, and one getter that reads them all
+_READING_FIELDS = ('timestamp', 'pressure', 'temperature', 'volumetric_flow',
+                   'mass_flow', 'setpoint', 'gas', 'control_point')
+_get_reading_fields = attrgetter(*_READING_FIELDS)
+
+
+@dataclass(slots=True, frozen=True)
 class MFCReading:
     """Data structure for MFC readings."""
     timestamp: float
@@ -45,19 +54,10 @@ class MFCReading:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary format."""
-        return {
-            'timestamp': self.timestamp,
-            'pressure': self.pressure,
-            'temperature': self.temperature,
-            'volumetric_flow': self.volumetric_flow,
-            'mass_flow': self.mass_flow,
-            'setpoint': self.setpoint,
-            'gas': self.gas,
-            'control_point': self.control_point
-        }
+        return dict(zip(_READING_FIELDS, _get_reading_fields(self)))
 
 
-@dataclass
+@dataclass(slots=True)
 class MFCChannel:
     """Configuration and state for a single MFC channel."""
     name: str  # e.g., "Ar", "O2", "N2"
@@ -97,9 +97,13 @@ class GasFlowController:
         self.logger = logging.getLogger(__name__)
         
         # Initialize state tracking BEFORE channels
+        # Latest reading per channel. Rebound to a new dict once per read cycle
+        # and never mutated afterwards, so other threads can read it unlocked.
         self._last_readings: Dict[str, MFCReading] = {}
         self._setpoints: Dict[str, float] = {}
         self._total_flow_rate = 0.0
+        # name -> (inputs it was built from, status dict) for get_channel_status
+        self._status_cache: Dict[str, Tuple[tuple, Dict[str, Any]]] = {}
         
         # Initialize MFC channels from config
         self.channels: Dict[str, MFCChannel] = {}
@@ -108,11 +112,22 @@ class GasFlowController:
         # Thread management
         self._running = False
         self._control_thread: Optional[threading.Thread] = None
-        self._command_queue: Queue = Queue()
-        self._result_queues: Dict[str, Queue] = {}
+        # Event loop owned by the control thread (set while it runs); public
+        # methods submit coroutines to it. MFC I/O is all serial waits, so one
+        # loop thread serves every channel.
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop_event: Optional[asyncio.Event] = None
+        # Set by the control thread once the initial connection pass is done
+        self._connected_event = threading.Event()
+        
+        # Worker threads for blocking driver calls (serial port open), sized to
+        # the channel count; created and shut down by the control thread
+        self._serial_executor: Optional[ThreadPoolExecutor] = None
         
         # MFC connection objects (created in control thread)
         self._mfc_connections: Dict[str, FlowController] = {}
+        # One lock per serial port: MFCs sharing a bus must not interleave frames
+        self._port_locks: Dict[str, asyncio.Lock] = {}
         
         # Safety and status callbacks
         self._status_callbacks: List[Callable] = []
@@ -121,14 +136,25 @@ class GasFlowController:
         # Auto-reconnect settings
         self.auto_reconnect = config.get('auto_reconnect', True)
         self.reconnect_interval = config.get('reconnect_interval', 5.0)
+        self.reconnect_max_interval = config.get('reconnect_max_interval', 60.0)
+        # name -> (consecutive failed reconnects, monotonic time of next attempt)
+        self._reconnect_state: Dict[str, Tuple[int, float]] = {}
+        
+        # Read back each new setpoint (one extra round-trip); otherwise the
+        # next periodic read reports it
+        self.verify_setpoints = config.get('verify_setpoints', False)
+        self.connect_timeout = config.get('connect_timeout', 10.0)
         
     def _init_channels(self) -> None:
         """Initialize MFC channels from configuration."""
         mfc_config = self.config.get('mfcs', {})
-        print(f"DEBUG: GasFlowController initializing with MFC config: {mfc_config}")
+        # Driver gas list as a set for connect/reconnect lookups, taken here in
+        # case the driver fills FlowController.gases after import
+        self._known_gases = frozenset(FlowController.gases)
+        self.logger.debug("GasFlowController initializing with MFC config: %s", mfc_config)
         
         for name, channel_config in mfc_config.items():
-            print(f"DEBUG: Creating channel {name} with config: {channel_config}")
+            self.logger.debug("Creating channel %s with config: %s", name, channel_config)
             channel = MFCChannel(
                 name=name,
                 unit_id=channel_config.get('unit_id', 'A'),
@@ -138,7 +164,7 @@ class GasFlowController:
                 enabled=channel_config.get('enabled', True),
                 baudrate=channel_config.get('baudrate')  # Optional baud rate
             )
-            print(f"DEBUG: Channel {name} created with serial_port: {channel.serial_port}")
+            self.logger.debug("Channel %s created with serial_port: %s", name, channel.serial_port)
             self.channels[name] = channel
             self._setpoints[name] = 0.0
             
@@ -156,11 +182,15 @@ class GasFlowController:
             
         try:
             self._running = True
+            self._connected_event.clear()
             self._control_thread = threading.Thread(target=self._control_loop, daemon=True)
             self._control_thread.start()
             
             # Wait for initial connection attempts
-            time.sleep(2.0)
+            if not self._connected_event.wait(timeout=self.connect_timeout):
+                self.logger.warning(
+                    f"MFC connections still pending after {self.connect_timeout:.1f}s; continuing in background"
+                )
             
             self.logger.info("Gas flow controller started successfully")
             return True
@@ -179,7 +209,10 @@ class GasFlowController:
         self._running = False
         
         # Send stop command to control thread
-        self._send_command('stop', {})
+        try:
+            self._send_command('stop', {})
+        except RuntimeError:
+            pass  # Control loop already gone
         
         # Wait for control thread to finish
         if self._control_thread and self._control_thread.is_alive():
@@ -190,141 +223,227 @@ class GasFlowController:
     def _control_loop(self) -> None:
         """Main control loop running in separate thread."""
         self.logger.info("Gas flow control loop started")
-        
-        # Initialize asyncio event loop for this thread
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
+        try:
+            asyncio.run(self._async_main())
+        except Exception as e:
+            self.logger.error(f"Error in gas flow control loop: {e}")
+        finally:
+            self.logger.info("Gas flow control loop ended")
+
+    async def _async_main(self) -> None:
+        """Connect, then serve commands and periodic reads on one event loop."""
+        # asyncio locks bind to the loop that first contends them, so every run builds its own
+        self._port_locks = {}
+        self._stop_event = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        self._serial_executor = ThreadPoolExecutor(
+            max_workers=max(1, len(self.channels)), thread_name_prefix='mfc-io'
+        )
+        reader: Optional[asyncio.Task] = None
+
         try:
             # Connect to all MFCs
-            loop.run_until_complete(self._connect_all_mfcs())
-            
-            last_read_time = time.time()
+            try:
+                await self._connect_all_mfcs()
+            finally:
+                self._connected_event.set()
+
             read_interval = self.config.get('read_interval', 1.0)
-            
-            while self._running:
-                current_time = time.time()
-                
-                # Process commands from queue
-                self._process_commands(loop)
-                
-                # Periodic reading of all MFCs
-                if current_time - last_read_time >= read_interval:
-                    loop.run_until_complete(self._read_all_mfcs())
-                    last_read_time = current_time
-                
-                # Brief sleep to prevent high CPU usage
-                time.sleep(0.01)
-                
+            reader = asyncio.create_task(self._periodic_reader(read_interval))
+
+            # Commands run as they are submitted; wait here for 'stop'
+            await self._stop_event.wait()
+
         except Exception as e:
             self.logger.error(f"Error in gas flow control loop: {e}")
         finally:
+            # Refuse new commands before tearing down
+            self._loop = None
+            if reader is not None:
+                reader.cancel()
+                try:
+                    await reader
+                except asyncio.CancelledError:
+                    pass
+
             # Clean shutdown
-            loop.run_until_complete(self._disconnect_all_mfcs())
-            loop.close()
-            self.logger.info("Gas flow control loop ended")
+            await self._disconnect_all_mfcs()
+            self._serial_executor.shutdown(wait=False)
+
+    async def _periodic_reader(self, read_interval: float) -> None:
+        """Read all MFCs every `read_interval` seconds until stopped."""
+        while self._running:
+            try:
+                await self._read_all_mfcs()
+            except Exception as e:
+                self.logger.error("Error in periodic MFC read: %s", e)
+            await asyncio.sleep(read_interval)
     
+    async def _on_port(self, name: str, func: Callable[..., Any], *args: Any) -> Any:
+        """Await func(*args) while holding the serial port lock of channel `name`.
+
+        Channels on different ports run concurrently; channels that share a
+        port (multi-drop bus with different unit IDs) take turns.
+        """
+        channel = self.channels.get(name)
+        port = channel.serial_port if channel is not None else name
+        lock = self._port_locks.get(port)
+        if lock is None:
+            lock = self._port_locks[port] = asyncio.Lock()
+        async with lock:
+            return await func(*args)
+
     async def _connect_all_mfcs(self) -> None:
-        """Connect to all enabled MFC channels."""
-        for name, channel in self.channels.items():
-            if not channel.enabled:
-                continue
-                
-            try:
-                self.logger.info(f"Connecting to MFC {name} at {channel.serial_port}")
-                
-                # Prepare connection parameters
-                connection_params = {
-                    'address': channel.serial_port,
-                    'unit': channel.unit_id,
-                    'timeout': 2.0
-                }
-                
-                # Add baud rate if specified in channel config
-                if channel.baudrate is not None:
-                    connection_params['baudrate'] = channel.baudrate
-                    self.logger.info(f"Using custom baud rate {channel.baudrate} for MFC {name}")
+        """Connect to all enabled MFC channels concurrently."""
+        await asyncio.gather(*(
+            self._on_port(name, self._connect_mfc, name, channel)
+            for name, channel in self.channels.items() if channel.enabled
+        ))
+
+    async def _connect_mfc(self, name: str, channel: MFCChannel) -> None:
+        """Connect to one MFC channel, recording failures on the channel."""
+        try:
+            self.logger.info(f"Connecting to MFC {name} at {channel.serial_port}")
+            
+            mfc = await self._open_mfc(name, channel)
+            
+            # Test connection by reading current state
+            state = await mfc.get()
+            if state:
+                self._mfc_connections[name] = mfc
+                channel.connection_status = "connected"
+                channel.last_error = None
                 
-                # Create FlowController instance
-                mfc = FlowController(**connection_params)
+                # Set gas type if needed
+                if channel.gas_type in self._known_gases:
+                    await mfc.set_gas(channel.gas_type)
                 
-                # Test connection by reading current state
-                state = await mfc.get()
-                if state:
-                    self._mfc_connections[name] = mfc
-                    channel.connection_status = "connected"
-                    channel.last_error = None
-                    
-                    # Set gas type if needed
-                    if channel.gas_type in FlowController.gases:
-                        await mfc.set_gas(channel.gas_type)
-                    
-                    self.logger.info(f"Successfully connected to MFC {name}")
-                else:
-                    channel.connection_status = "error"
-                    channel.last_error = "Failed to read initial state"
-                    
-            except Exception as e:
-                self.logger.error(f"Failed to connect to MFC {name}: {e}")
+                self.logger.info(f"Successfully connected to MFC {name}")
+            else:
                 channel.connection_status = "error"
-                channel.last_error = str(e)
+                channel.last_error = "Failed to read initial state"
+                
+        except Exception as e:
+            self.logger.error(f"Failed to connect to MFC {name}: {e}")
+            channel.connection_status = "error"
+            channel.last_error = str(e)
     
+    async def _open_mfc(self, name: str, channel: MFCChannel) -> FlowController:
+        """Create the FlowController for a channel without blocking the event loop.
+
+        The driver opens the serial port in its constructor, which can stall on
+        a missing or busy device, so it runs on the serial executor.
+        """
+        # Prepare connection parameters
+        connection_params = {
+            'address': channel.serial_port,
+            'unit': channel.unit_id,
+            'timeout': 2.0
+        }
+        
+        # Add baud rate if specified in channel config
+        if channel.baudrate is not None:
+            connection_params['baudrate'] = channel.baudrate
+            self.logger.info(f"Using custom baud rate {channel.baudrate} for MFC {name}")
+        
+        # Create FlowController instance
+        return await asyncio.get_running_loop().run_in_executor(
+            self._serial_executor, partial(FlowController, **connection_params)
+        )
+
     async def _disconnect_all_mfcs(self) -> None:
-        """Disconnect from all MFC channels."""
-        for name, mfc in self._mfc_connections.items():
-            try:
-                # Set flow to zero before disconnecting
-                await mfc.set_flow_rate(0.0)
-                mfc.close()
-                self.logger.info(f"Disconnected from MFC {name}")
-            except Exception as e:
-                self.logger.error(f"Error disconnecting MFC {name}: {e}")
-                
+        """Disconnect from all MFC channels concurrently."""
+        await asyncio.gather(*(
+            self._on_port(name, self._disconnect_mfc, name, mfc) for name, mfc in list(self._mfc_connections.items())
+        ))
         self._mfc_connections.clear()
         
         # Update channel status
         for channel in self.channels.values():
             channel.connection_status = "disconnected"
+
+    async def _disconnect_mfc(self, name: str, mfc: FlowController) -> None:
+        """Zero one MFC's flow and close its connection."""
+        try:
+            # Set flow to zero before disconnecting
+            await mfc.set_flow_rate(0.0)
+            mfc.close()
+            self.logger.info(f"Disconnected from MFC {name}")
+        except Exception as e:
+            self.logger.error(f"Error disconnecting MFC {name}: {e}")
     
     async def _read_all_mfcs(self) -> None:
-        """Read current state from all connected MFCs."""
-        for name, mfc in self._mfc_connections.items():
-            try:
-                state = await mfc.get()
-                if state:
-                    reading = MFCReading(
-                        timestamp=time.time(),
-                        pressure=state.get('pressure', 0.0),
-                        temperature=state.get('temperature', 0.0),
-                        volumetric_flow=state.get('volumetric_flow', 0.0),
-                        mass_flow=state.get('mass_flow', 0.0),
-                        setpoint=state.get('setpoint', 0.0),
-                        gas=state.get('gas', ''),
-                        control_point=state.get('control_point', 'mass flow')
-                    )
-                    
-                    self._last_readings[name] = reading
-                    self.channels[name].current_reading = reading
-                    self.channels[name].connection_status = "connected"
-                    self.channels[name].last_error = None
-                    
-            except Exception as e:
-                self.logger.error(f"Error reading MFC {name}: {e}")
-                self.channels[name].connection_status = "error"
-                self.channels[name].last_error = str(e)
-                
-                # Try to reconnect if auto-reconnect is enabled
-                if self.auto_reconnect:
-                    await self._try_reconnect(name)
+        """Read current state from all connected MFCs concurrently."""
+        connections = list(self._mfc_connections.items())
+        # One timestamp for the whole cycle; the reads are issued together
+        now = time.time()
+        results = await asyncio.gather(
+            *(self._on_port(name, self._read_mfc, mfc, now) for name, mfc in connections),
+            return_exceptions=True
+        )
+
+        failed = []
+        readings = dict(self._last_readings)
+        for (name, _), result in zip(connections, results):
+            channel = self.channels[name]
+            if isinstance(result, Exception):
+                self.logger.error("Error reading MFC %s: %s", name, result)
+                channel.connection_status = "error"
+                channel.last_error = str(result)
+                failed.append(name)
+            elif result is not None:
+                readings[name] = result
+                channel.current_reading = result
+                channel.connection_status = "connected"
+                channel.last_error = None
+
+        # Publish the cycle's snapshot and total in one rebind each
+        self._last_readings = readings
+        self._total_flow_rate = sum(reading.mass_flow for reading in readings.values())
+
+        # Try to reconnect if auto-reconnect is enabled: channels that just
+        # failed, plus enabled ones still without a connection (backoff permitting)
+        if self.auto_reconnect:
+            lost = failed + [
+                name for name, channel in self.channels.items()
+                if channel.enabled and name not in self._mfc_connections
+            ]
+            if lost:
+                await asyncio.gather(*(self._on_port(name, self._try_reconnect, name) for name in lost))
+
+    async def _read_mfc(self, mfc: FlowController, timestamp: float) -> Optional[MFCReading]:
+        """Read one MFC, returning None if it gave no state."""
+        state = await mfc.get()
+        if not state:
+            return None
+        return MFCReading(
+            timestamp=timestamp,
+            pressure=state.get('pressure', 0.0),
+            temperature=state.get('temperature', 0.0),
+            volumetric_flow=state.get('volumetric_flow', 0.0),
+            mass_flow=state.get('mass_flow', 0.0),
+            setpoint=state.get('setpoint', 0.0),
+            gas=state.get('gas', ''),
+            control_point=state.get('control_point', 'mass flow')
+        )
     
     async def _try_reconnect(self, name: str) -> None:
-        """Attempt to reconnect to a specific MFC."""
+        """Attempt to reconnect to a specific MFC.
+
+        Failed attempts back off exponentially from reconnect_interval up to
+        reconnect_max_interval, so a dead MFC doesn't hold up every read cycle.
+        """
         if name not in self.channels:
             return
+        
+        failures, next_attempt = self._reconnect_state.get(name, (0, 0.0))
+        if time.monotonic() < next_attempt:
+            return
             
         channel = self.channels[name]
+        mfc = None
         try:
-            self.logger.info(f"Attempting to reconnect to MFC {name}")
+            self.logger.info("Attempting to reconnect to MFC %s", name)
             
             # Remove old connection
             if name in self._mfc_connections:
@@ -335,65 +454,51 @@ class GasFlowController:
                 del self._mfc_connections[name]
             
             # Create new connection
-            mfc = FlowController(
-                address=channel.serial_port,
-                unit=channel.unit_id,
-                timeout=2.0
-            )
+            mfc = await self._open_mfc(name, channel)
             
             # Test connection
             state = await mfc.get()
-            if state:
-                self._mfc_connections[name] = mfc
-                channel.connection_status = "connected"
-                channel.last_error = None
-                
-                # Restore gas type and setpoint
-                if channel.gas_type in FlowController.gases:
-                    await mfc.set_gas(channel.gas_type)
-                await mfc.set_flow_rate(self._setpoints.get(name, 0.0))
-                
-                self.logger.info(f"Successfully reconnected to MFC {name}")
+            if not state:
+                raise RuntimeError("Failed to read initial state")
+            self._mfc_connections[name] = mfc
+            channel.connection_status = "connected"
+            channel.last_error = None
+            
+            # Restore gas type and setpoint
+            if channel.gas_type in self._known_gases:
+                await mfc.set_gas(channel.gas_type)
+            await mfc.set_flow_rate(self._setpoints.get(name, 0.0))
+            
+            self.logger.info("Successfully reconnected to MFC %s", name)
+            self._reconnect_state.pop(name, None)
                 
         except Exception as e:
-            self.logger.error(f"Failed to reconnect to MFC {name}: {e}")
+            failures += 1
+            delay = min(self.reconnect_interval * 2 ** (failures - 1), self.reconnect_max_interval)
+            self._reconnect_state[name] = (failures, time.monotonic() + delay)
+            self.logger.error("Failed to reconnect to MFC %s: %s (next attempt in %.1fs)", name, e, delay)
             channel.connection_status = "error"
             channel.last_error = str(e)
-    
-    def _process_commands(self, loop: asyncio.AbstractEventLoop) -> None:
-        """Process commands from the command queue."""
-        try:
-            while True:
+            if mfc is not None and self._mfc_connections.get(name) is not mfc:
                 try:
-                    command_id, command, args = self._command_queue.get_nowait()
-                    result = loop.run_until_complete(self._execute_command(command, args))
-                    
-                    # Send result back if there's a result queue
-                    if command_id in self._result_queues:
-                        self._result_queues[command_id].put(result)
-                        
-                except Empty:
-                    break
-                except Exception as e:
-                    self.logger.error(f"Error processing command: {e}")
-                    if command_id in self._result_queues:
-                        self._result_queues[command_id].put(f"Error: {e}")
-        except Exception as e:
-            self.logger.error(f"Error in command processing: {e}")
+                    mfc.close()
+                except Exception:
+                    pass
     
     async def _execute_command(self, command: str, args: Dict[str, Any]) -> Any:
         """Execute a command asynchronously."""
         if command == 'set_flow':
-            return await self._cmd_set_flow(args['channel'], args['flow_rate'])
+            return await self._on_port(args['channel'], self._cmd_set_flow, args['channel'], args['flow_rate'])
         elif command == 'set_gas':
-            return await self._cmd_set_gas(args['channel'], args['gas_type'])
+            return await self._on_port(args['channel'], self._cmd_set_gas, args['channel'], args['gas_type'])
         elif command == 'stop_flow':
-            return await self._cmd_stop_flow(args['channel'])
+            return await self._on_port(args['channel'], self._cmd_stop_flow, args['channel'])
         elif command == 'stop_all':
             return await self._cmd_stop_all()
         elif command == 'get_reading':
             return self._cmd_get_reading(args['channel'])
         elif command == 'stop':
+            self._stop_event.set()
             return True
         else:
             raise ValueError(f"Unknown command: {command}")
@@ -415,39 +520,33 @@ class GasFlowController:
         if self.safety_controller:
             # This would be implemented based on your safety system
             # For now, just log
-            self.logger.info(f"Safety check passed for {channel} flow rate {flow_rate}")
+            self.logger.info("Safety check passed for %s flow rate %s", channel, flow_rate)
         
         try:
             mfc = self._mfc_connections[channel]
             
-            # Debug: Check current control point and setpoint before setting
-            try:
-                current_state = await mfc.get()
-                self.logger.info(f"Before setting {channel}: current_setpoint={current_state.get('setpoint', 'unknown')}, control_point={getattr(mfc, 'control_point', 'unknown')}")
-            except Exception as e:
-                self.logger.warning(f"Could not read current state before setting {channel}: {e}")
-            
             # Set the flow rate (no artificial delay needed - separate serial port)
             await mfc.set_flow_rate(flow_rate)
             self._setpoints[channel] = flow_rate
             
-            # Quick verification without blocking delay
-            try:
-                verification_state = await mfc.get()
-                actual_setpoint = verification_state.get('setpoint', 0.0)
-                self.logger.info(f"After setting {channel}: requested={flow_rate}, actual_setpoint={actual_setpoint}")
-                
-                if abs(actual_setpoint - flow_rate) > 0.1:
-                    self.logger.warning(f"Setpoint verification failed for {channel}: requested {flow_rate}, got {actual_setpoint}")
+            # Optional verification without blocking delay
+            if self.verify_setpoints:
+                try:
+                    verification_state = await mfc.get()
+                    actual_setpoint = verification_state.get('setpoint', 0.0)
+                    self.logger.debug("After setting %s: requested=%s, actual_setpoint=%s", channel, flow_rate, actual_setpoint)
                     
-            except Exception as e:
-                self.logger.warning(f"Could not verify setpoint for {channel}: {e}")
+                    if abs(actual_setpoint - flow_rate) > 0.1:
+                        self.logger.warning("Setpoint verification failed for %s: requested %s, got %s", channel, flow_rate, actual_setpoint)
+                        
+                except Exception as e:
+                    self.logger.warning("Could not verify setpoint for %s: %s", channel, e)
             
-            self.logger.info(f"Set {channel} flow rate to {flow_rate}")
+            self.logger.info("Set %s flow rate to %s", channel, flow_rate)
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to set flow rate for {channel}: {e}")
+            self.logger.error("Failed to set flow rate for %s: %s", channel, e)
             raise
     
     async def _cmd_set_gas(self, channel: str, gas_type: str) -> bool:
@@ -460,11 +559,11 @@ class GasFlowController:
             await mfc.set_gas(gas_type)
             self.channels[channel].gas_type = gas_type
             
-            self.logger.info(f"Set {channel} gas type to {gas_type}")
+            self.logger.info("Set %s gas type to %s", channel, gas_type)
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to set gas type for {channel}: {e}")
+            self.logger.error("Failed to set gas type for %s: %s", channel, e)
             raise
     
     async def _cmd_stop_flow(self, channel: str) -> bool:
@@ -472,32 +571,43 @@ class GasFlowController:
         return await self._cmd_set_flow(channel, 0.0)
     
     async def _cmd_stop_all(self) -> bool:
-        """Stop flow for all channels."""
-        results = []
-        for channel in self._mfc_connections.keys():
-            try:
-                result = await self._cmd_set_flow(channel, 0.0)
-                results.append(result)
-            except Exception as e:
-                self.logger.error(f"Failed to stop flow for {channel}: {e}")
-                results.append(False)
+        """Stop flow for all channels concurrently.
+
+        Writes a zero setpoint straight to every MFC, skipping the limit checks
+        and read-back of _cmd_set_flow, so the stop takes one round-trip.
+        """
+        connections = list(self._mfc_connections.items())
+        results = await asyncio.gather(
+            *(self._on_port(channel, mfc.set_flow_rate, 0.0) for channel, mfc in connections),
+            return_exceptions=True
+        )
+        stopped = True
+        for (channel, _), result in zip(connections, results):
+            if isinstance(result, Exception):
+                self.logger.error("Failed to stop flow for %s: %s", channel, result)
+                stopped = False
+            else:
+                self._setpoints[channel] = 0.0
         
-        return all(results)
+        if stopped:
+            self.logger.info("Stopped flow on %d MFC(s)", len(connections))
+        return stopped
     
     def _cmd_get_reading(self, channel: str) -> Optional[MFCReading]:
         """Get latest reading for a specific channel."""
         return self._last_readings.get(channel)
     
     def _send_command(self, command: str, args: Dict[str, Any], wait_for_result: bool = False) -> Any:
-        """Send a command to the control thread."""
-        import uuid
-        command_id = str(uuid.uuid4())
-        
-        if wait_for_result:
-            result_queue = Queue()
-            self._result_queues[command_id] = result_queue
-        
-        self._command_queue.put((command_id, command, args))
+        """Run a command on the control thread's event loop."""
+        loop = self._loop
+        coro = self._execute_command(command, args)
+        try:
+            if loop is None:
+                raise RuntimeError("control loop is not running")
+            future = asyncio.run_coroutine_threadsafe(coro, loop)
+        except RuntimeError:
+            coro.close()
+            raise RuntimeError(f"Command '{command}' failed: gas flow control loop is not running")
         
         if wait_for_result:
             enabled_channels = sum(1 for ch in self.channels.values() if ch.enabled)
@@ -506,22 +616,12 @@ class GasFlowController:
             wait_timeout = 15.0 if command != 'stop_all' else max(15.0, 5.0 * enabled_channels)
 
             try:
-                result = result_queue.get(timeout=wait_timeout)
-                del self._result_queues[command_id]
-                
-                if isinstance(result, str) and result.startswith("Error:"):
-                    raise RuntimeError(result[6:])  # Remove "Error:" prefix
-                
-                return result
-            except Empty:
-                if command_id in self._result_queues:
-                    del self._result_queues[command_id]
+                return future.result(timeout=wait_timeout)
+            except FutureTimeoutError:
                 raise RuntimeError(
                     f"Command '{command}' timed out after {wait_timeout:.1f}s (channels={enabled_channels})"
                 )
             except Exception as e:
-                if command_id in self._result_queues:
-                    del self._result_queues[command_id]
                 raise RuntimeError(f"Command '{command}' failed: {e}")
         
         return None
@@ -579,40 +679,53 @@ class GasFlowController:
             return False
     
     def get_reading(self, channel: str) -> Optional[MFCReading]:
-        """Get the latest reading for a channel (thread-safe)."""
-        try:
-            return self._send_command('get_reading', {
-                'channel': channel
-            }, wait_for_result=True)
-        except Exception as e:
-            self.logger.error(f"Failed to get reading: {e}")
-            return None
+        """Get the latest reading for a channel (thread-safe).
+
+        The control thread publishes readings as an immutable snapshot, so this
+        reads the latest one directly instead of queueing behind MFC commands.
+        """
+        return self._cmd_get_reading(channel)
     
     def get_all_readings(self) -> Dict[str, MFCReading]:
         """Get latest readings for all channels."""
-        readings = {}
-        for channel in self.channels.keys():
-            reading = self.get_reading(channel)
-            if reading:
-                readings[channel] = reading
-        return readings
+        return dict(self._last_readings)
     
     def get_channel_status(self, channel: str) -> Dict[str, Any]:
-        """Get status information for a specific channel."""
+        """Get status information for a specific channel.
+
+        The status is rebuilt only when the channel's state has changed since
+        the last call; each caller gets its own copy, so editing the returned
+        dict cannot corrupt the cached one.
+        """
         if channel not in self.channels:
             return {}
             
         ch = self.channels[channel]
-        return {
+        setpoint = self._setpoints.get(channel, 0.0)
+        key = (ch.enabled, ch.connection_status, ch.last_error, setpoint,
+               ch.max_flow, ch.gas_type, ch.current_reading)
+        cached = self._status_cache.get(channel)
+        if cached is not None and cached[0] == key:
+            return self._copy_status(cached[1])
+
+        status = {
             'name': ch.name,
             'enabled': ch.enabled,
             'connection_status': ch.connection_status,
             'last_error': ch.last_error,
-            'setpoint': self._setpoints.get(channel, 0.0),
+            'setpoint': setpoint,
             'max_flow': ch.max_flow,
             'gas_type': ch.gas_type,
             'current_reading': ch.current_reading.to_dict() if ch.current_reading else None
         }
+        self._status_cache[channel] = (key, status)
+        return self._copy_status(status)
+
+    @staticmethod
+    def _copy_status(status: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a cached status dict, including its nested reading dict."""
+        reading = status['current_reading']
+        return {**status, 'current_reading': dict(reading) if reading is not None else None}
     
     def get_all_status(self) -> Dict[str, Dict[str, Any]]:
         """Get status for all channels."""
@@ -623,11 +736,8 @@ class GasFlowController:
         return self._running
     
     def get_total_flow_rate(self) -> float:
-        """Get total flow rate across all channels."""
-        total = 0.0
-        for reading in self._last_readings.values():
-            total += reading.mass_flow
-        return total
+        """Get total flow rate across all channels (as of the last read cycle)."""
+        return self._total_flow_rate
     
     def add_status_callback(self, callback: Callable[[Dict[str, Any]], None]) -> None:
         """Add a callback for status updates."""
@@ -12,12 +12,18 @@ import threading
 import time
 import json
 import logging
+import os
 import platform
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from dataclasses import dataclass
+from operator import attrgetter
 from queue import Queue, Empty
 from typing import Dict, List, Optional, Tuple, Callable, Any
 import uuid
+import yaml
+import serial
 from serial.tools import list_ports
 
 # Support both package and script execution
@@ -30,7 +36,79 @@ except ImportError:
         SafetyController = None
 
 
-@dataclass
+# USB (VID, PID) of the FTDI adapters Alicat ships (FT232R, FT232H, FT231X)
+ALICAT_USB_IDS = frozenset({(0x0403, 0x6001), (0x0403, 0x6014), (0x0403, 0x6015)})
+
+# Serial port enumeration is slow on some hosts (Windows with Bluetooth COM
+# ports); reuse one listing for this many seconds
+PORT_LIST_TTL = 5.0
+_port_list_cache: Tuple[float, list] = (float('-inf'), [])
+
+
+def _list_serial_ports() -> list:
+    """Return list_ports.comports(), cached for PORT_LIST_TTL seconds."""
+    global _port_list_cache
+    listed_at, ports = _port_list_cache
+    now = time.monotonic()
+    if now - listed_at >= PORT_LIST_TTL:
+        ports = list(list_ports.comports())
+        _port_list_cache = (now, ports)
+    return ports
+
+
+def _set_global_serial_port(content: str, new_port: str) -> Optional[str]:
+    """Return config.yml text with gas_control.serial_port set to `new_port`.
+
+    Only a key sitting directly under gas_control (at the indent of its other
+    settings) is replaced, including a commented-out one; per-MFC serial_port
+    entries are left alone. Without such a key, one is inserted as the first
+    setting. Returns None if there is no gas_control section.
+    """
+    lines = content.splitlines()
+    try:
+        start = next(i for i, line in enumerate(lines) if line.rstrip() == 'gas_control:')
+    except StopIteration:
+        return None
+    
+    indent = None
+    target = None
+    for i in range(start + 1, len(lines)):
+        stripped = lines[i].strip()
+        if not stripped:
+            continue
+        line_indent = len(lines[i]) - len(lines[i].lstrip())
+        if line_indent == 0:
+            break  # Next top-level section
+        if indent is None and not stripped.startswith('#'):
+            indent = line_indent
+        if stripped.lstrip('# ').startswith('serial_port:') and (indent is None or line_indent == indent):
+            target = i
+            if not stripped.startswith('#'):
+                break  # Prefer a live key over a commented one
+    
+    new_line = f"{' ' * (indent or 2)}serial_port: '{new_port}'  # Auto-detected"
+    if target is None:
+        lines.insert(start + 1, new_line)
+    else:
+        lines[target] = new_line
+    return '\n'.join(lines) + '\n'
+
+
+# Keep each alicat CLI call from opening (and flashing) a console window on Windows
+CLI_CREATION_FLAGS = subprocess.CREATE_NO_WINDOW if platform.system() == 'Windows' else 0
+
+# Longest the control loop blocks waiting for a command before re-checking its
+# periodic-read settings (commands themselves wake it immediately)
+COMMAND_WAIT_MAX = 0.5
+
+
+# MFCReading fields in to_dict order, and one getter that reads them all
+_READING_FIELDS = ('timestamp', 'pressure', 'temperature', 'volumetric_flow',
+                   'mass_flow', 'setpoint', 'gas', 'control_point')
+_get_reading_fields = attrgetter(*_READING_FIELDS)
+
+
+@dataclass(slots=True, frozen=True)
 class MFCReading:
     """Data structure for MFC readings."""
     timestamp: float
@@ -44,19 +122,10 @@ class MFCReading:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary format."""
-        return {
-            'timestamp': self.timestamp,
-            'pressure': self.pressure,
-            'temperature': self.temperature,
-            'volumetric_flow': self.volumetric_flow,
-            'mass_flow': self.mass_flow,
-            'setpoint': self.setpoint,
-            'gas': self.gas,
-            'control_point': self.control_point
-        }
+        return dict(zip(_READING_FIELDS, _get_reading_fields(self)))
 
 
-@dataclass
+@dataclass(slots=True)
 class MFCChannel:
     """Configuration and state for a single MFC channel."""
     name: str  # e.g., "Ar", "O2", "N2"
@@ -126,6 +195,10 @@ class GasFlowController:
         self.cli_timeout = config.get('cli_timeout', 3.0)  # Timeout for CLI commands
         self.max_retries = config.get('max_retries', 3)  # Increased retries for Unicode issues
         
+        # Port auto-detection: poll units over pyserial, or via the alicat CLI if set
+        self.probe_timeout = config.get('probe_timeout', 0.5)  # Seconds to wait for a poll reply
+        self.cli_port_probe = config.get('cli_port_probe', False)
+        
         # Periodic reading settings
         self.read_interval = config.get('read_interval', 10.0)  # Read all MFCs every 10 seconds (reduced frequency)
         self.auto_read_enabled = config.get('auto_read_enabled', False)  # Disable auto-reading by default to prevent conflicts
@@ -136,7 +209,7 @@ class GasFlowController:
         
         # Command spacing to prevent serial port conflicts
         self.command_spacing = config.get('command_spacing', 0.5)  # Minimum time between commands (seconds)
-        self._last_command_time = 0.0
+        self._last_command_time: Dict[str, float] = {}  # serial port -> last command time
         
         # Status callbacks
         self._status_callbacks: List[Callable] = []
@@ -151,19 +224,15 @@ class GasFlowController:
         if not mfc_config:
             return
             
-        # Find a valid unit ID to test
-        test_unit_id = 'A'
-        for cfg in mfc_config.values():
-            if 'unit_id' in cfg:
-                test_unit_id = cfg['unit_id']
-                break
+        # Unit IDs to poll; any one of them answering identifies the bus
+        unit_ids = [str(cfg['unit_id']) for cfg in mfc_config.values() if 'unit_id' in cfg] or ['A']
         
         if configured_port:
-            self.logger.info(f"Checking Alicat connection on {configured_port} (Unit {test_unit_id})...")
+            self.logger.info(f"Checking Alicat connection on {configured_port} (Units {', '.join(unit_ids)})...")
             
             # 1. Try configured port first (if not excluded)
             if configured_port not in self.excluded_ports:
-                if self._test_port(configured_port, test_unit_id):
+                if self._probe_port_for_units(configured_port, unit_ids):
                     self.logger.info(f"✅ Alicat found on configured port: {configured_port}")
                     return
             else:
@@ -174,7 +243,7 @@ class GasFlowController:
             self.logger.info("ℹ️ No serial port configured. Scanning available ports...")
         
         # 2. Scan available ports
-        found_port = self._scan_ports(test_unit_id)
+        found_port = self._scan_ports(unit_ids)
         
         if found_port:
             self.logger.info(f"✅ Found Alicat on port: {found_port}")
@@ -187,46 +256,114 @@ class GasFlowController:
         else:
             self.logger.error("❌ Could not find Alicat MFCs on any port")
 
-    def _scan_ports(self, unit_id: str) -> Optional[str]:
-        """Scan available serial ports for Alicat device."""
-        ports = list_ports.comports()
-        candidates = []
-        
-        # Prioritize USB serial devices
-        for p in ports:
-            desc = p.description.lower()
-            if "usb" in desc or "serial" in desc:
-                candidates.append(p.device)
+    def _scan_ports(self, unit_ids: List[str]) -> Optional[str]:
+        """Scan available serial ports for Alicat device.
+
+        Ports on an FTDI USB adapter (what Alicat ships) are probed first; the
+        remaining ports are only probed if none of those answers.
+        """
+        ftdi = []
+        usb_serial = []
+        others = []
         
-        # Add remaining ports
-        for p in ports:
-            if p.device not in candidates:
-                candidates.append(p.device)
+        # One pass: FTDI first, then USB serial devices, then remaining ports
+        for p in _list_serial_ports():
+            if (p.vid, p.pid) in ALICAT_USB_IDS:
+                ftdi.append(p.device)
+                continue
+            info = f"{p.description or ''} {getattr(p, 'manufacturer', None) or ''}".lower()
+            if "bluetooth" in info:
+                continue  # Bluetooth virtual ports can hang on open
+            if "usb" in info or "serial" in info:
+                usb_serial.append(p.device)
+            else:
+                others.append(p.device)
+        candidates = usb_serial + others
                 
-        for port in candidates:
+        for port in ftdi + candidates:
             if port in self.excluded_ports:
                 self.logger.info(f"Skipping excluded port {port}")
-                continue
-                
-            self.logger.info(f"Scanning {port}...")
-            if self._test_port(port, unit_id):
-                return port
+        
+        for group in (ftdi, candidates):
+            found = self._probe_ports([port for port in group if port not in self.excluded_ports], unit_ids)
+            if found:
+                return found
+        return None
+
+    def _probe_ports(self, ports: List[str], unit_ids: List[str]) -> Optional[str]:
+        """Probe `ports` for `unit_ids` concurrently; return the first port that answers."""
+        if not ports:
+            return None
+        
+        # One worker per port, each owning its port, so probe them all at once;
+        # the scan then takes one probe sweep, not one per port
+        self.logger.info(f"Scanning {', '.join(ports)}...")
+        executor = ThreadPoolExecutor(max_workers=len(ports), thread_name_prefix='mfc-scan')
+        found = threading.Event()
+        try:
+            futures = {executor.submit(self._probe_port_for_units, port, unit_ids, found): port for port in ports}
+            for future in as_completed(futures):
+                unit_id = future.result()
+                if unit_id is not None:
+                    self.logger.info(f"Unit {unit_id} answered on {futures[future]}")
+                    return futures[future]
+        finally:
+            # Don't wait for the probes still running once one has answered;
+            # they stop before polling their next unit and close their port
+            found.set()
+            executor.shutdown(wait=False, cancel_futures=True)
                 
         return None
 
-    def _test_port(self, port: str, unit_id: str) -> bool:
-        """Test if an Alicat unit responds on a port."""
+    def _probe_port_for_units(self, port: str, unit_ids: List[str],
+                              cancel: Optional[threading.Event] = None) -> Optional[str]:
+        """Return the unit ID that answers on a port, or None if none does.
+
+        Opens the port once and sends each unit's poll frame in turn until one
+        replies with its ID; one reply identifies the bus, so the remaining
+        units aren't polled. No CLI process is started unless cli_port_probe
+        is set. Stops early once `cancel` is set (another port already answered).
+        """
+        if self.cli_port_probe:
+            return next((unit_id for unit_id in unit_ids
+                         if not (cancel and cancel.is_set()) and self._test_port_cli(port, unit_id)), None)
+        
+        baudrate = 19200
+        for cfg in self.config.get('mfcs', {}).values():
+            if cfg.get('baudrate'):
+                baudrate = int(cfg['baudrate'])
+                break
+        
+        try:
+            with serial.Serial(port, baudrate=baudrate, timeout=self.probe_timeout,
+                               write_timeout=self.probe_timeout) as ser:
+                ser.reset_input_buffer()
+                for unit_id in unit_ids:
+                    if cancel is not None and cancel.is_set():
+                        break
+                    ser.write(f"{unit_id}\r".encode('ascii'))
+                    reply = ser.read_until(b'\r', 128)
+                    if reply.startswith(unit_id.encode('ascii') + b' '):
+                        return unit_id
+        except Exception:
+            pass
+        return None
+
+    def _test_port_cli(self, port: str, unit_id: str) -> bool:
+        """Test if an Alicat unit responds on a port using the alicat CLI."""
         try:
             # Run alicat CLI command to check state
             # alicat <port> --unit <id> (no args returns state)
             cmd = ['alicat', port, '--unit', unit_id]
             
-            # Run with short timeout
+            # Run with short timeout; only the exit code matters, so don't
+            # capture (or decode) the output
             result = subprocess.run(
                 cmd, 
-                capture_output=True, 
-                text=True, 
-                timeout=2.0
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=2.0,
+                creationflags=CLI_CREATION_FLAGS
             )
             
             if result.returncode == 0:
@@ -243,26 +380,39 @@ class GasFlowController:
                 self.logger.warning(f"Config file not found at {config_path}")
                 return
                 
-            content = config_path.read_text()
-            
-            lines = content.splitlines()
-            new_lines = []
-            updated = False
+            content = config_path.read_text(encoding='utf-8')
+            data = yaml.safe_load(content) or {}  # Refuse to edit a file that doesn't parse
+            if (data.get('gas_control') or {}).get('serial_port') == new_port:
+                return  # Already recorded; leave the file untouched
             
-            for line in lines:
-                if 'serial_port:' in line and not updated:
-                    # Check if this is likely the global setting (indentation)
-                    if line.strip().startswith('serial_port:'):
-                        new_lines.append(f"  serial_port: '{new_port}'  # Auto-detected")
-                        updated = True
-                        continue
-                new_lines.append(line)
+            new_content = _set_global_serial_port(content, new_port)
+            if new_content is None:
+                self.logger.warning("Could not find gas_control section in config.yml to update")
+                return
             
-            if updated:
-                config_path.write_text('\n'.join(new_lines) + '\n')
-                self.logger.info(f"Updated config.yml with new port: {new_port}")
-            else:
+            # Only write a file that parses back to the requested port
+            parsed = yaml.safe_load(new_content) or {}
+            if (parsed.get('gas_control') or {}).get('serial_port') != new_port:
                 self.logger.warning("Could not find serial_port key in config.yml to update")
+                return
+            
+            # Write a sibling temp file and rename it over config.yml, so a crash
+            # or power cut mid-write can't leave a truncated config behind
+            fd, tmp_path = tempfile.mkstemp(dir=config_path.parent, prefix='.config.', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as tmp:
+                    tmp.write(new_content)
+                    tmp.flush()
+                    os.fsync(tmp.fileno())
+                os.chmod(tmp_path, os.stat(config_path).st_mode & 0o7777)  # mkstemp makes it 0600
+                os.replace(tmp_path, config_path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+            self.logger.info(f"Updated config.yml with new port: {new_port}")
                 
         except Exception as e:
             self.logger.error(f"Failed to update config file: {e}")
@@ -327,13 +477,13 @@ class GasFlowController:
             try:
                 # Enforce command spacing to prevent serial conflicts
                 current_time = time.time()
-                time_since_last = current_time - self._last_command_time
+                time_since_last = current_time - self._last_command_time.get(channel.serial_port, 0.0)
                 if time_since_last < self.command_spacing:
                     delay_needed = self.command_spacing - time_since_last
                     self.logger.debug(f"Enforcing command spacing: waiting {delay_needed:.3f}s")
                     time.sleep(delay_needed)
                 
-                self._last_command_time = time.time()
+                self._last_command_time[channel.serial_port] = time.time()
                 start_time = time.perf_counter()
                 
                 # Add --timeout parameter to CLI command for better reliability
@@ -349,7 +499,8 @@ class GasFlowController:
                     text=True,
                     timeout=self.cli_timeout,
                     encoding='utf-8',
-                    errors='replace'  # Handle Unicode decode errors gracefully
+                    errors='replace',  # Handle Unicode decode errors gracefully
+                    creationflags=CLI_CREATION_FLAGS
                 )
                 
                 end_time = time.perf_counter()
@@ -584,21 +735,23 @@ class GasFlowController:
         
         try:
             while self._running:
-                current_time = time.time()
+                # Wait for commands until the next periodic read is due; a
+                # queued command wakes the loop at once instead of after a
+                # fixed sleep. Capped so auto_read_enabled changes are seen.
+                wait = COMMAND_WAIT_MAX
+                if self.auto_read_enabled:
+                    wait = min(wait, max(0.0, last_read_time + self.read_interval - time.time()))
                 
                 # Process commands from queue
-                self._process_commands()
+                self._process_commands(wait)
                 
                 # Periodic reading of all MFCs
+                current_time = time.time()
                 if (self.auto_read_enabled and 
                     current_time - last_read_time >= self.read_interval):
                     self._read_all_mfcs()
                     last_read_time = current_time
                 
-                # Sleep to prevent high CPU usage
-                # Increased from 0.01s to 0.1s to reduce load on RPi
-                time.sleep(0.1)
-                
         except Exception as e:
             self.logger.error(f"Error in subprocess gas flow control loop: {e}")
         finally:
@@ -681,12 +834,16 @@ class GasFlowController:
             except Exception as e:
                 self.logger.error(f"Error reading MFC {channel_name}: {e}")
     
-    def _process_commands(self) -> None:
-        """Process commands from the command queue."""
+    def _process_commands(self, wait: float = 0.0) -> None:
+        """Process commands from the command queue, waiting up to `wait` s for the first."""
         try:
-            while not self._command_queue.empty():
+            while True:
                 try:
-                    command_id, command, args = self._command_queue.get_nowait()
+                    if wait > 0:
+                        command_id, command, args = self._command_queue.get(timeout=wait)
+                        wait = 0.0
+                    else:
+                        command_id, command, args = self._command_queue.get_nowait()
                     result = self._execute_command(command, args)
                     
                     # Return result if someone is waiting
@@ -721,11 +878,20 @@ class GasFlowController:
                 return self._cli_set_gas_type(channel, gas_type)
                 
             elif command == 'stop_all':
-                results = []
+                # Channels on one port go in turn; separate ports in parallel
+                by_port: Dict[str, List[str]] = {}
                 for channel in self.channels.keys():
                     if self.channels[channel].enabled:
-                        result = self._cli_set_flow_rate(channel, 0.0)
-                        results.append(result)
+                        by_port.setdefault(self.channels[channel].serial_port, []).append(channel)
+                
+                def stop_port(channels: List[str]) -> List[bool]:
+                    return [self._cli_set_flow_rate(channel, 0.0) for channel in channels]
+                
+                if len(by_port) <= 1:
+                    results = [r for channels in by_port.values() for r in stop_port(channels)]
+                else:
+                    with ThreadPoolExecutor(max_workers=len(by_port), thread_name_prefix='mfc-stop') as executor:
+                        results = [r for rs in executor.map(stop_port, by_port.values()) for r in rs]
                 return all(results)
                 
             elif command == 'stop':
@@ -5,12 +5,20 @@ This module handles all safety condition checking and interlock logic
 for the vacuum system operations.
 """
 
+import re
+import threading
+import time
 import yaml
 from pathlib import Path
 from typing import Dict, List, Tuple, Any, Optional
 from dataclasses import dataclass
 
 
+# Forbidden conditions of the form "relay_state['btnX'] == True" can be checked
+# by bit arithmetic instead of eval
+_RELAY_CONDITION_RE = re.compile(r"^relay_state\['(\w+)'\]\s*==\s*(True|False)$")
+
+
 @dataclass
 class SafetyResult:
     """Result of a safety condition check."""
@@ -36,6 +44,8 @@ class SafetyController:
         self.analog_inputs: List[float] = [0.0, 0.0, 0.0, 0.0]
         # Digital input states (Door, Water, Rod, Spare)
         self.digital_inputs: List[bool] = [False, False, False, False]
+        # Same inputs packed into an int (bit i = digital_inputs[i]) for single-bit tests
+        self.digital_inputs_bits: int = 0
         self.relay_states: Dict[str, bool] = {}
         self.current_mode: str = "Normal"
         
@@ -45,6 +55,25 @@ class SafetyController:
         
         # Special flag for sputter procedure gas valve override
         self._sputter_procedure_active: bool = False
+
+        # Memo of auto-procedure safety checks: button -> (state fingerprint, result)
+        self._check_cache: Dict[str, Tuple[tuple, SafetyResult]] = {}
+        # Bumped whenever update_system_state receives new analog/digital inputs,
+        # so the fingerprint need not copy the input frames on every check
+        self._inputs_version = 0
+
+        # Last canonical state reached by a procedure ('default', 'standby') and
+        # the relay states it left behind; valid while those relay states hold.
+        self.canonical_state: Optional[str] = None
+        self._canonical_relay_states: Optional[tuple] = None
+
+        # Latest analog frame read by the GUI poll, shared with auto procedures
+        self.latest_voltages: Optional[Tuple[float, ...]] = None
+        self._latest_voltages_time = 0.0
+        self._voltages_lock = threading.Lock()
+
+        # Per-button forbidden conditions compiled to relay bitmasks
+        self._compiled_forbidden = self._compile_forbidden_conditions()
         
     def _load_safety_config(self) -> Dict[str, Any]:
         """Load safety configuration from YAML file."""
@@ -58,6 +87,61 @@ class SafetyController:
             print(f"❌ Error loading safety config: {e}")
             return {}
     
+    def _compile_forbidden_conditions(self) -> Dict[str, Tuple[Tuple[str, ...], int, List[str], List[str]]]:
+        """Compile each button's forbidden_conditions into a relay bitmask check.
+
+        Conditions on a single relay state become one bit each: bit i is the
+        state of names[i] and the pattern holds the forbidden value. Any other
+        condition is kept as a string and evaluated as before.
+
+        Returns:
+            button -> (names, pattern, relay condition strings, residual conditions)
+        """
+        compiled = {}
+        for button, conditions in (self.safety_config or {}).get('button_safety_conditions', {}).items():
+            names: List[str] = []
+            texts: List[str] = []
+            residual: List[str] = []
+            pattern = 0
+            for condition in (conditions or {}).get('forbidden_conditions', None) or []:
+                match = _RELAY_CONDITION_RE.match(condition.strip()) if isinstance(condition, str) else None
+                if match is None:
+                    residual.append(condition)
+                    continue
+                if match.group(2) == 'True':
+                    pattern |= 1 << len(names)
+                names.append(match.group(1))
+                texts.append(condition)
+            compiled[button] = (tuple(names), pattern, texts, residual)
+        return compiled
+
+    def _find_forbidden_condition(self, button_name: str, forbidden: List[str]) -> Optional[str]:
+        """Return the first forbidden condition currently true for a button, if any."""
+        entry = self._compiled_forbidden.get(button_name)
+        if entry is None:
+            for condition in forbidden:
+                if self._evaluate_condition(condition):
+                    return condition
+            return None
+
+        names, pattern, texts, residual = entry
+        if names:
+            states = self.relay_states
+            bits = present = 0
+            for i, name in enumerate(names):
+                # A relay missing from relay_states fails eval, so it never matches
+                if name in states:
+                    present |= 1 << i
+                    if states[name]:
+                        bits |= 1 << i
+            hit = ~(bits ^ pattern) & present
+            if hit:
+                return texts[(hit & -hit).bit_length() - 1]
+        for condition in residual:
+            if self._evaluate_condition(condition):
+                return condition
+        return None
+
     def update_system_state(self, 
                            analog_inputs: List[float] = None,
                            digital_inputs: List[bool] = None,
@@ -66,10 +150,17 @@ class SafetyController:
                            current_procedure: str = None,
                            system_status: str = None):
         """Update the current system state for safety evaluation."""
+        if analog_inputs is not None or digital_inputs is not None:
+            self._inputs_version += 1
         if analog_inputs is not None:
             self.analog_inputs = analog_inputs
         if digital_inputs is not None:
             self.digital_inputs = digital_inputs
+            bits = 0
+            for i, state in enumerate(digital_inputs):
+                if state:
+                    bits |= 1 << i
+            self.digital_inputs_bits = bits
         if relay_states is not None:
             self.relay_states = relay_states
         if current_mode is not None:
@@ -79,6 +170,27 @@ class SafetyController:
         if system_status is not None:
             self.system_status = system_status
 
+    def publish_voltages(self, voltages: List[float]) -> None:
+        """Record an analog frame just read from the Arduino for other readers."""
+        snapshot = tuple(voltages)
+        with self._voltages_lock:
+            self.latest_voltages = snapshot
+            self._latest_voltages_time = time.monotonic()
+
+    def get_latest_voltages(self, max_age: float,
+                            newer_than: float = 0.0) -> Optional[Tuple[float, ...]]:
+        """Return the last published analog frame if younger than max_age seconds.
+
+        Frames read before `newer_than` (a time.monotonic() value, e.g. the
+        last relay switch) are ignored.
+        """
+        with self._voltages_lock:
+            if (self.latest_voltages is not None
+                    and self._latest_voltages_time > newer_than
+                    and time.monotonic() - self._latest_voltages_time < max_age):
+                return self.latest_voltages
+        return None
+
     def set_procedure_state_override(self, procedure_name: str, target_state: str) -> None:
         """
         Force set system status for procedure execution.
@@ -116,6 +228,37 @@ class SafetyController:
         """
         return self._sputter_procedure_active
 
+    def _state_fingerprint(self) -> tuple:
+        """Snapshot of every input that check_button_safety depends on.
+
+        Input frames only arrive through update_system_state, which bumps
+        _inputs_version. Relay states and the status fields are assigned
+        directly by the procedures and the GUI, so those are compared instead
+        of relying on the setters to signal changes.
+        """
+        return (
+            self._inputs_version,
+            tuple(self.relay_states.items()),
+            self.current_mode,
+            self.current_procedure,
+            self.system_status,
+            self._sputter_procedure_active,
+        )
+
+    def mark_canonical_state(self, state: str) -> None:
+        """Record that a procedure has just left the relays in canonical `state`."""
+        self.canonical_state = state
+        self._canonical_relay_states = tuple(self.relay_states.items())
+
+    def is_in_canonical_state(self, state: str) -> bool:
+        """True if `state` was reached and no relay has been switched since."""
+        return (self.canonical_state == state
+                and self._canonical_relay_states == tuple(self.relay_states.items()))
+
+    def clear_check_cache(self) -> None:
+        """Drop memoized safety check results (call at the start of a procedure)."""
+        self._check_cache.clear()
+
     def is_ion_gauge_on(self) -> bool:
         """Return True if ion gauge is considered ON based on analog input and config.
 
@@ -146,6 +289,22 @@ class SafetyController:
         Returns:
             SafetyResult with allowed status and message
         """
+        if not is_auto_procedure:
+            return self._check_button_safety(button_name, is_auto_procedure)
+
+        # Auto procedures re-check the same buttons repeatedly (explicit step
+        # checks plus the check inside set_relay_safe); reuse the previous
+        # result while none of the evaluated inputs have changed.
+        fingerprint = self._state_fingerprint()
+        cached = self._check_cache.get(button_name)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        result = self._check_button_safety(button_name, is_auto_procedure)
+        self._check_cache[button_name] = (fingerprint, result)
+        return result
+
+    def _check_button_safety(self, button_name: str, is_auto_procedure: bool) -> SafetyResult:
+        """Evaluate the safety conditions for a button (uncached)."""
         # Check if safety config is loaded
         if not self.safety_config:
             return SafetyResult(False, "Safety configuration not loaded")
@@ -243,10 +402,10 @@ class SafetyController:
         
         # Check forbidden conditions
         forbidden = conditions.get('forbidden_conditions', [])
-        for condition in forbidden:
-            if self._evaluate_condition(condition):
-                error_msg = conditions.get('error_message', f"Forbidden condition detected: {condition}")
-                return SafetyResult(False, error_msg)
+        condition = self._find_forbidden_condition(button_name, forbidden)
+        if condition is not None:
+            error_msg = conditions.get('error_message', f"Forbidden condition detected: {condition}")
+            return SafetyResult(False, error_msg)
         
         # Check if confirmation is required (skip for auto procedures)
         if not is_auto_procedure:
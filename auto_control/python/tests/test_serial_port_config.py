@@ -0,0 +1,113 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path to allow imports
+current_dir = Path(__file__).resolve().parent
+parent_dir = current_dir.parent
+sys.path.append(str(parent_dir))
+
+yaml = pytest.importorskip("yaml")
+pytest.importorskip("serial")  # subprocess_controller probes ports with pyserial
+
+from gas_control.subprocess_controller import _set_global_serial_port
+
+MFCS = """\
+  mfcs:
+    Ar:
+      unit_id: 'A'
+      serial_port: '/dev/ttyUSB1'
+    N2:
+      unit_id: 'B'
+      serial_port: serial_port
+"""
+TRAILER = """\
+other_section:
+  serial_port: '/dev/ttyACM0'
+"""
+
+
+def _parse(text):
+    return yaml.safe_load(text)
+
+
+def test_replaces_commented_global_key():
+    content = ("gas_control:\n"
+               "  auto_reconnect: true\n"
+               "  # serial_port: '/dev/ttyUSB0'  # Commented out to force auto-detection\n"
+               + MFCS)
+    updated = _set_global_serial_port(content, "COM5")
+
+    lines = updated.splitlines()
+    assert lines[2] == "  serial_port: 'COM5'  # Auto-detected"
+    assert len(lines) == len(content.splitlines())
+    assert _parse(updated)["gas_control"]["serial_port"] == "COM5"
+
+
+def test_replaces_live_global_key():
+    content = ("gas_control:\n"
+               "  serial_port: '/dev/ttyUSB0'\n"
+               "  read_interval: 1.0\n"
+               + MFCS)
+    updated = _set_global_serial_port(content, "/dev/ttyUSB3")
+
+    gas = _parse(updated)["gas_control"]
+    assert gas["serial_port"] == "/dev/ttyUSB3"
+    assert gas["read_interval"] == 1.0
+    assert updated.count("serial_port:") == content.count("serial_port:")
+
+
+def test_prefers_live_key_over_commented_one():
+    content = ("gas_control:\n"
+               "  # serial_port: '/dev/ttyUSB9'\n"
+               "  serial_port: '/dev/ttyUSB0'\n"
+               + MFCS)
+    updated = _set_global_serial_port(content, "COM7")
+
+    lines = updated.splitlines()
+    assert lines[1] == "  # serial_port: '/dev/ttyUSB9'"
+    assert _parse(updated)["gas_control"]["serial_port"] == "COM7"
+
+
+def test_inserts_missing_global_key():
+    content = ("gas_control:\n"
+               "  read_interval: 1.0\n"
+               + MFCS)
+    updated = _set_global_serial_port(content, "COM3")
+
+    assert updated.splitlines()[1] == "  serial_port: 'COM3'  # Auto-detected"
+    gas = _parse(updated)["gas_control"]
+    assert gas["serial_port"] == "COM3"
+    assert gas["read_interval"] == 1.0
+
+
+def test_uses_indent_of_gas_control_settings():
+    content = ("gas_control:\n"
+               "    read_interval: 1.0\n"
+               "    # serial_port: '/dev/ttyUSB0'\n")
+    updated = _set_global_serial_port(content, "COM4")
+
+    assert updated.splitlines()[2] == "    serial_port: 'COM4'  # Auto-detected"
+    assert _parse(updated)["gas_control"]["serial_port"] == "COM4"
+
+
+def test_leaves_per_mfc_and_other_sections_alone():
+    content = ("gas_control:\n"
+               "  read_interval: 1.0\n"
+               + MFCS + TRAILER)
+    updated = _set_global_serial_port(content, "COM6")
+
+    parsed = _parse(updated)
+    mfcs = parsed["gas_control"]["mfcs"]
+    assert parsed["gas_control"]["serial_port"] == "COM6"
+    assert mfcs["Ar"]["serial_port"] == "/dev/ttyUSB1"
+    assert mfcs["N2"]["serial_port"] == "serial_port"
+    assert parsed["other_section"]["serial_port"] == "/dev/ttyACM0"
+    # Only the inserted line differs
+    assert [l for l in updated.splitlines() if "Auto-detected" not in l] == content.splitlines()
+
+
+def test_missing_gas_control_section_returns_none():
+    assert _set_global_serial_port(TRAILER, "COM1") is None
+    assert _set_global_serial_port("", "COM1") is None
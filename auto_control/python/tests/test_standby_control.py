@@ -0,0 +1,66 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path to allow imports
+current_dir = Path(__file__).resolve().parent
+parent_dir = current_dir.parent
+sys.path.append(str(parent_dir))
+
+pytest.importorskip("serial")  # auto_procedures imports the Arduino controller
+
+from auto_procedures import _standby_control_step
+
+LOW, HIGH = 2.0, 2.4
+
+
+def test_off_pump_turns_on_below_low():
+    assert _standby_control_step([1.9], False, LOW, HIGH) == (True, 1.9)
+
+
+def test_off_pump_stays_off_inside_band():
+    # Between the thresholds an OFF pump is left to coast down
+    assert _standby_control_step([2.2], False, LOW, HIGH) == (False, 2.2)
+
+
+def test_on_pump_stays_on_inside_band():
+    # ...and an ON pump keeps running until it reaches the high threshold
+    assert _standby_control_step([2.2], True, LOW, HIGH) == (True, 2.2)
+
+
+def test_on_pump_turns_off_at_high():
+    assert _standby_control_step([2.4], True, LOW, HIGH) == (False, 2.4)
+    assert _standby_control_step([2.6], True, LOW, HIGH) == (False, 2.6)
+
+
+def test_off_pump_stays_off_at_low():
+    # The thresholds are strict: exactly `low` does not switch the pump on
+    assert _standby_control_step([2.0], False, LOW, HIGH) == (False, 2.0)
+
+
+def test_hysteresis_cycle():
+    # Spin down with the pump OFF, back up with it ON: one switch each way
+    pump_on = False
+    switches = []
+    for volts in (2.3, 2.1, 1.9, 2.1, 2.3, 2.5, 2.3, 2.1):
+        should_on, _ = _standby_control_step([volts], pump_on, LOW, HIGH)
+        if should_on != pump_on:
+            switches.append((volts, should_on))
+            pump_on = should_on
+    assert switches == [(1.9, True), (2.5, False)]
+
+
+def test_median_rejects_single_spike():
+    # One noisy low sample must not switch an OFF pump on
+    should_on, smoothed = _standby_control_step([2.2, 0.5, 2.2], False, LOW, HIGH)
+    assert (should_on, smoothed) == (False, 2.2)
+    # ...nor one high sample switch an ON pump off
+    should_on, smoothed = _standby_control_step([2.1, 3.5, 2.2], True, LOW, HIGH)
+    assert (should_on, smoothed) == (True, 2.2)
+
+
+def test_median_of_even_window():
+    should_on, smoothed = _standby_control_step([1.8, 1.9, 2.1, 2.3], False, LOW, HIGH)
+    assert smoothed == pytest.approx(2.0)
+    assert should_on is False
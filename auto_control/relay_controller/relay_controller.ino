@@ -7,6 +7,8 @@
  * Reads 4 analog inputs via pins A1-A4 (A1=Load-lock, A2=Chamber, A3=Ion Gauge, A4=Turbo Spin)
  * Serial communication at 9600 baud
  * Command format: RELAY_X_ON or RELAY_X_OFF (X = 1-23)
+ * Bulk format: RELAYS_<mask>_<states> (hex bitmasks, bit 0 = relay 1)
+ * Pulse train: PULSE_RELAY_<relay>_<pulse_ms>_<interval_ms>_<count>, stopped early by ABORT_PULSE
  * Response format: OK or ERROR
  *
  * CRITICAL SAFETY: Pin 22 (Relay 1) - mains power safety shutdown only
@@ -55,6 +57,15 @@ int analogInputValues[NUM_ANALOG_CHANNELS];
 
 bool previousInterlockState = false;  // Track previous state of all 3 critical interlocks
 
+// Firmware-timed relay pulse train (one at a time). Timed with millis() from
+// loop() so serial commands and the interlock check keep running meanwhile.
+int pulseRelayNum = 0;                // 1-based relay being pulsed, 0 = no train running
+unsigned long pulseWidthMs = 0;       // ON time of each pulse
+unsigned long pulseIntervalMs = 0;    // start-to-start spacing of pulses
+int pulsesRemaining = 0;              // pulses still to start after the current one
+bool pulseOn = false;                 // relay currently held ON by the train
+unsigned long pulseStartMs = 0;       // millis() when the current pulse started
+
 void setup() {
   // Initialize serial communication
   Serial.begin(BAUD_RATE);
@@ -166,6 +177,9 @@ void loop() {
   
   // Update previous state for next loop
   previousInterlockState = allInterlocksOK;
+
+  // Advance any running pulse train
+  updatePulseTrain();
   
   // Check for incoming serial commands
   if (Serial.available() > 0) {
@@ -195,11 +209,31 @@ void processCommand(String command) {
     } else {
       Serial.println("ERROR");
     }
+  } else if (command.startsWith("RELAYS_")) {
+    // Bulk relay command: set several relays in one transaction
+    if (processBulkRelayCommand(command)) {
+      Serial.println("OK");
+    } else {
+      Serial.println("ERROR");
+    }
+  } else if (command.startsWith("PULSE_RELAY_")) {
+    // Firmware-timed pulse train: returns immediately, pulses run from loop()
+    if (startPulseTrain(command)) {
+      Serial.println("OK");
+    } else {
+      Serial.println("ERROR");
+    }
+  } else if (command == "ABORT_PULSE") {
+    // Stop a running pulse train and release its relay
+    stopPulseTrain();
+    Serial.println("OK");
   } else if (command == "STATUS") {
     // Return current status of all relays
     sendStatus();
   } else if (command == "ALL_OFF") {
-    // Emergency: turn off all relays
+    // Emergency: turn off all relays (and stop any pulse train)
+    pulseRelayNum = 0;
+    pulseOn = false;
     allRelaysOff();
     Serial.println("OK");
   } else if (command == "GET_DIGITAL_INPUTS") {
@@ -249,6 +283,108 @@ bool parseRelayCommand(String command, int &relayNum, bool &turnOn) {
   return false;
 }
 
+bool processBulkRelayCommand(String command) {
+  // Parse commands like "RELAYS_1F00_0" (mask and states in hex, bit 0 = relay 1)
+  // Every relay whose mask bit is set is switched to the matching state bit.
+  int firstUnderscore = command.indexOf('_');
+  int secondUnderscore = command.indexOf('_', firstUnderscore + 1);
+
+  if (firstUnderscore == -1 || secondUnderscore == -1) {
+    return false;
+  }
+
+  String maskStr = command.substring(firstUnderscore + 1, secondUnderscore);
+  String statesStr = command.substring(secondUnderscore + 1);
+  if (maskStr.length() == 0 || statesStr.length() == 0) {
+    return false;
+  }
+
+  unsigned long mask = strtoul(maskStr.c_str(), NULL, 16);
+  unsigned long states = strtoul(statesStr.c_str(), NULL, 16);
+
+  // Validate mask: at least one relay, none beyond relay 23
+  if (mask == 0 || (mask >> NUM_RELAYS) != 0) {
+    return false;
+  }
+
+  bool allOK = true;
+  for (int i = 0; i < NUM_RELAYS; i++) {
+    if (mask & (1UL << i)) {
+      if (!controlRelay(i + 1, (states & (1UL << i)) != 0)) {
+        allOK = false;
+      }
+    }
+  }
+  return allOK;
+}
+
+bool startPulseTrain(String command) {
+  // Parse commands like "PULSE_RELAY_5_150_10000_8" (relay, pulse ms, interval ms, count)
+  int values[4];
+  int start = String("PULSE_RELAY_").length();
+  for (int i = 0; i < 4; i++) {
+    int end = command.indexOf('_', start);
+    if (i < 3 && end == -1) {
+      return false;
+    }
+    String field = (i < 3) ? command.substring(start, end) : command.substring(start);
+    if (field.length() == 0) {
+      return false;
+    }
+    values[i] = field.toInt();
+    start = end + 1;
+  }
+
+  int relayNum = values[0];
+  // Mains power (relay 1) is never pulsed; only one train may run at a time
+  if (relayNum < 2 || relayNum > NUM_RELAYS || pulseRelayNum != 0) {
+    return false;
+  }
+  if (values[1] <= 0 || values[2] <= values[1] || values[3] <= 0) {
+    return false;
+  }
+
+  pulseWidthMs = (unsigned long)values[1];
+  pulseIntervalMs = (unsigned long)values[2];
+  pulsesRemaining = values[3] - 1;
+  pulseRelayNum = relayNum;
+  pulseStartMs = millis();
+  pulseOn = controlRelay(pulseRelayNum, true);
+  if (!pulseOn) {
+    pulseRelayNum = 0;
+  }
+  return pulseOn;
+}
+
+void updatePulseTrain() {
+  if (pulseRelayNum == 0) {
+    return;
+  }
+  unsigned long now = millis();
+  if (pulseOn) {
+    if (now - pulseStartMs >= pulseWidthMs) {
+      controlRelay(pulseRelayNum, false);
+      pulseOn = false;
+      if (pulsesRemaining <= 0) {
+        pulseRelayNum = 0;  // Train finished
+      }
+    }
+  } else if (now - pulseStartMs >= pulseIntervalMs) {
+    pulsesRemaining--;
+    pulseStartMs = now;
+    pulseOn = controlRelay(pulseRelayNum, true);
+  }
+}
+
+void stopPulseTrain() {
+  if (pulseRelayNum != 0) {
+    controlRelay(pulseRelayNum, false);
+  }
+  pulseRelayNum = 0;
+  pulseOn = false;
+  pulsesRemaining = 0;
+}
+
 bool controlRelay(int relayNumber, bool state) {
   // Convert from 1-based to 0-based indexing
   int index = relayNumber - 1;